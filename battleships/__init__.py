@@ -1,25 +1,32 @@
 #  Copyright © 2019 CAILLAUD Jean-Baptiste.
-from engine import Engine
-from engine.input.CloseOnEscapeOrQuit import CloseOnEscapeOrQuit
-from engine.logic.GameManager import GameManager
-from engine.logic.Math import Vector2
-from engine.logic.Primitives import RectGameObject, LineGameObject
-
-class MovingRect(RectGameObject):
-    def tick(self, dt):
-        self.transform.position.x = self.transform.position.x + (32 * dt)
-        if self.transform.position.x > 512:
-            self.transform.position.x = 0
-        pass
-
-class GameMode(GameManager):
-    def begin(self):
-        rect = MovingRect(Engine.scene, Vector2(128, 128), 5, (255, 0, 0), (0, 255, 0))
-        rect.transform.position = Vector2(256, 256)
-        Engine.input_handler.add_listener(CloseOnEscapeOrQuit())
+# The engine is only imported when the game starts, so the rules can be used without pygame.
+
+# Import the sys module.
+import sys
 
 
 def start():
+    # Check for the --tournament flag, which plays the AI strategies against each other without the engine.
+    if "--tournament" in sys.argv:
+        # Import the tournament.
+        from battleships.tournament import Tournament
+
+        tournament = Tournament.from_arguments(sys.argv)
+        tournament.run()
+        tournament.report()
+        return
+
+    # Check for the --dedicated flag, which hosts the multiplayer games without the engine.
+    if "--dedicated" in sys.argv:
+        # Import the dedicated server.
+        from battleships.network import DedicatedServer
+
+        DedicatedServer.from_arguments(sys.argv).run()
+        return
+
+    # Import the engine.
+    from engine import Engine
+
     Engine.initialize()
 
     Engine.start()
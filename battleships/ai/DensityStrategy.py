@@ -0,0 +1,138 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the strategy base class.
+from battleships.ai.Strategy import Strategy
+# Import the vectorized heat map.
+from battleships.ai.HeatMap import HeatMap
+# Import the rules.
+from battleships.rules import CELL_COUNT, FLEET_LENGTHS, SHOT_MISS, SHOT_HIT_AND_SUNK, SHOT_GAME_OVER, \
+    get_placements, iterate_cells
+
+
+class DensityStrategy(Strategy):
+    """
+    Shoots the cell covered by the most legal placements of the ships that are still afloat.
+    In hunt mode, when no damaged ship is left, every placement that avoids the shot cells is counted.
+    In target mode, only the placements covering the hits of the damaged ships are counted,
+    weighted by the number of hits they cover, so the damaged ships are finished first.
+    The density is computed with a vectorized HeatMap when numpy is installed, and in pure Python otherwise.
+
+    Attributes:
+        remaining   The lengths of the ships that were not sunk yet.
+        unresolved  The hits that do not belong to a sunk ship.
+        sunk_cells  The cells of the sunk ships.
+        heat_map    The vectorized heat map, or None to use the pure Python density.
+    """
+
+    # Weight multiplier of a placement, for each unresolved hit it covers.
+    TARGET_WEIGHT = 16
+
+    # Placement masks and their cells, by ship length.
+    __placement_cells = {}
+
+    def __init__(self, rng=None, lengths=FLEET_LENGTHS, vectorized=None):
+        """
+        Class constructor.
+        :param rng: The random generator to use.
+        :param lengths: The lengths of the opponent's ships.
+        :param vectorized: If True, uses the vectorized heat map. Defaults to True if numpy is installed.
+        """
+        super().__init__(rng)
+        self.remaining = list(lengths)
+        self.unresolved = 0
+        self.sunk_cells = 0
+        if vectorized is None:
+            vectorized = HeatMap.is_available()
+        self.heat_map = HeatMap() if vectorized else None
+
+    @classmethod
+    def get_placement_cells(cls, length):
+        """
+        Returns all the placements of a ship on the empty board, with the list of the cells they cover.
+        The returned list is shared and must not be modified.
+        :param length: The length of the ship.
+        :return: A list of (mask, cells) tuples.
+        """
+        placements = cls.__placement_cells.get(length)
+        if placements is None:
+            placements = [(mask, tuple(iterate_cells(mask))) for mask in get_placements(length)]
+            cls.__placement_cells[length] = placements
+        return placements
+
+    def get_density(self):
+        """
+        Counts the legal placements covering each cell.
+        :return: The weight of each cell, by cell index.
+        """
+        blocked = self.grid.get_misses() | self.sunk_cells
+        unresolved = self.unresolved
+        if self.heat_map is not None:
+            return self.heat_map.compute(
+                self.remaining, blocked, unresolved, DensityStrategy.TARGET_WEIGHT
+            ).ravel().tolist()
+
+        density = [0] * CELL_COUNT
+
+        for length in set(self.remaining):
+            count = self.remaining.count(length)
+            for mask, cells in DensityStrategy.get_placement_cells(length):
+                if mask & blocked != 0:
+                    continue
+                # In hunt mode, the placements must avoid the shot cells.
+                if unresolved == 0:
+                    weight = count
+                else:
+                    covered = mask & unresolved
+                    if covered == 0:
+                        continue
+                    weight = count * DensityStrategy.TARGET_WEIGHT ** bin(covered).count("1")
+                for cell in cells:
+                    density[cell] += weight
+        return density
+
+    def next_shot(self):
+        """
+        Chooses the cell with the highest density, breaking ties at random.
+        """
+        density = self.get_density()
+        best = 0
+        candidates = []
+        for cell in range(CELL_COUNT):
+            if self.grid.has_shot(cell):
+                continue
+            if density[cell] > best:
+                best = density[cell]
+                candidates = [cell]
+            elif density[cell] == best:
+                candidates.append(cell)
+
+        if len(candidates) == 0:
+            raise ValueError("Every cell was already shot.")
+        return self.rng.choice(candidates)
+
+    def record(self, cell, result):
+        """
+        Records the result of a shot, and finds which ship was sunk.
+        :param cell: The index of the cell that was shot.
+        :param result: One of the SHOT_ results.
+        """
+        super().record(cell, result)
+        if result == SHOT_MISS:
+            return
+        self.unresolved |= 1 << cell
+
+        # If a ship was sunk, find the longest remaining ship made of unresolved hits ending on this cell.
+        if result == SHOT_HIT_AND_SUNK or result == SHOT_GAME_OVER:
+            for length in sorted(set(self.remaining), reverse=True):
+                for mask, cells in DensityStrategy.get_placement_cells(length):
+                    if mask >> cell & 1 and mask & self.unresolved == mask:
+                        self.unresolved &= ~mask
+                        self.sunk_cells |= mask
+                        self.remaining.remove(length)
+                        return
+
+            # The sunk ship could not be identified, only forget the shot cell.
+            self.unresolved &= ~(1 << cell)
+            self.sunk_cells |= 1 << cell
+            if len(self.remaining) > 0:
+                self.remaining.remove(min(self.remaining))
@@ -0,0 +1,114 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import numpy, if it is available.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Import the rules.
+from battleships.rules import BOARD_SIZE, CELL_COUNT, get_placements
+
+
+class HeatMap:
+    """
+    Vectorized shot probability map.
+    All the placements of the ships are stored as the rows of a matrix over the 100 cells. The placements that
+    are still legal are filtered with one matrix product against the blocked cells, and the density of each cell is
+    the weighted sum of the legal rows. Can be used by any player that wants hints. Requires numpy.
+    The matrices hold floats, as numpy only uses the optimized matrix products for them. All the weights are
+    integers small enough to be exact.
+    """
+
+    # Placement matrices, by tuple of distinct ship lengths.
+    __matrices = {}
+    # Weight of each row of the placement matrices, by tuple of remaining ship lengths.
+    __row_weights = {}
+
+    def __init__(self):
+        """
+        Class constructor.
+        """
+        if numpy is None:
+            raise ImportError("The heat map requires numpy.")
+
+    @staticmethod
+    def is_available():
+        """
+        :return: True if numpy is installed, and heat maps can be computed.
+        """
+        return numpy is not None
+
+    @staticmethod
+    def to_vector(mask):
+        """
+        Converts a bitboard into a vector of the 100 cells.
+        :param mask: The bitboard to convert.
+        :return: A numpy vector, with 1 for each cell set in the mask.
+        """
+        data = numpy.frombuffer(mask.to_bytes((CELL_COUNT + 7) // 8, "little"), dtype=numpy.uint8)
+        return numpy.unpackbits(data, bitorder="little")[:CELL_COUNT].astype(numpy.float64)
+
+    @classmethod
+    def get_matrix(cls, lengths):
+        """
+        Returns the placement matrix of the given ship lengths.
+        The returned matrix is shared and must not be modified.
+        :param lengths: The distinct ship lengths, sorted.
+        :return: A matrix with one row per placement and one column per cell, and the length of each row.
+        """
+        matrix = cls.__matrices.get(lengths)
+        if matrix is None:
+            rows = []
+            row_lengths = []
+            for length in lengths:
+                for mask in get_placements(length):
+                    rows.append(HeatMap.to_vector(mask))
+                    row_lengths.append(length)
+            matrix = (
+                numpy.array(rows, dtype=numpy.float64).reshape(len(rows), CELL_COUNT),
+                numpy.array(row_lengths, dtype=numpy.int64)
+            )
+            cls.__matrices[lengths] = matrix
+        return matrix
+
+    @classmethod
+    def __get_row_weights(cls, remaining):
+        """
+        Returns the weight of each placement, which is the number of remaining ships of its length.
+        :param remaining: The lengths of the remaining ships, sorted.
+        :return: The placement matrix, and the weight of each of its rows.
+        """
+        lengths = tuple(sorted(set(remaining)))
+        matrix, row_lengths = cls.get_matrix(lengths)
+        weights = cls.__row_weights.get(remaining)
+        if weights is None:
+            weights = numpy.zeros(len(row_lengths), dtype=numpy.float64)
+            for length in lengths:
+                weights[row_lengths == length] = remaining.count(length)
+            cls.__row_weights[remaining] = weights
+        return matrix, weights
+
+    def compute(self, remaining, blocked, unresolved=0, target_weight=16):
+        """
+        Computes the number of legal placements covering each cell.
+        :param remaining: The lengths of the ships that were not sunk yet.
+        :param blocked: The bitboard of the cells no ship can cover.
+        :param unresolved: The bitboard of the hits on ships that were not sunk yet. If not empty, only the
+                           placements covering one of them are counted, multiplied by target_weight for each.
+        :param target_weight: The weight multiplier of a placement, for each unresolved hit it covers.
+        :return: A 10x10 numpy array of weights, indexed by row then column.
+        """
+        if len(remaining) == 0:
+            return numpy.zeros((BOARD_SIZE, BOARD_SIZE), dtype=numpy.int64)
+        matrix, weights = HeatMap.__get_row_weights(tuple(sorted(remaining)))
+
+        # Drop the placements covering a blocked cell.
+        weights = weights * (matrix @ HeatMap.to_vector(blocked) == 0)
+        # In target mode, only keep the placements covering unresolved hits.
+        if unresolved != 0:
+            covered = matrix @ HeatMap.to_vector(unresolved)
+            weights = weights * (covered > 0) * target_weight ** covered
+
+        # Sum the legal placements.
+        return (weights @ matrix).astype(numpy.int64).reshape(BOARD_SIZE, BOARD_SIZE)
@@ -0,0 +1,129 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the high resolution timer.
+from time import perf_counter
+
+# Import the density strategy base class.
+from battleships.ai.DensityStrategy import DensityStrategy
+# Import the rules.
+from battleships.rules import CELL_COUNT
+
+
+class MonteCarloStrategy(DensityStrategy):
+    """
+    Samples complete layouts of the remaining ships that are consistent with the shots so far, and shoots the cell
+    occupied in the most layouts. Unlike the density, which counts the placements of each ship on its own, the
+    samples account for the ships blocking each other and for the hits that each ship can explain.
+    Each ship is placed at random over the cells that were not missed, and the layouts where ships overlap or leave
+    a hit uncovered are rejected.
+    Sampling stops when the think time or the maximal number of samples is reached, so the strategy is run in a
+    background worker. If no consistent layout is found, the density strategy is used instead.
+
+    Attributes:
+        think_time  The time spent sampling for each shot, in seconds.
+        max_samples The maximal number of layouts sampled for each shot.
+    """
+
+    # The sampling takes a while, do not block the engine.
+    background = True
+
+    # Number of samples taken between two checks of the time.
+    SAMPLES_PER_CHECK = 32
+
+    def __init__(self, rng=None, think_time=0.5, max_samples=20000, **kwargs):
+        """
+        Class constructor.
+        :param rng: The random generator to use.
+        :param think_time: The time spent sampling for each shot, in seconds.
+        :param max_samples: The maximal number of layouts sampled for each shot.
+        :param kwargs: The other settings of the density strategy.
+        """
+        super().__init__(rng, **kwargs)
+        self.think_time = think_time
+        self.max_samples = max_samples
+
+    def configure(self, options):
+        """
+        Reads the think_time and max_samples settings.
+        :param options: The [AI] section of the configuration.
+        """
+        self.think_time = options.getfloat("think_time", fallback=self.think_time)
+        self.max_samples = options.getint("max_samples", fallback=self.max_samples)
+
+    def next_shot(self):
+        """
+        Chooses the unshot cell occupied in the most sampled layouts.
+        """
+        counts = self.sample()
+        best = 0
+        candidates = []
+        for cell in range(CELL_COUNT):
+            if self.grid.has_shot(cell):
+                continue
+            if counts[cell] > best:
+                best = counts[cell]
+                candidates = [cell]
+            elif counts[cell] == best:
+                candidates.append(cell)
+
+        # If no layout was found, fall back to the density.
+        if best == 0:
+            return super().next_shot()
+        return self.rng.choice(candidates)
+
+    def sample(self):
+        """
+        Samples consistent layouts until the think time or the maximal number of samples is reached.
+        :return: The number of sampled layouts occupying each cell, by cell index.
+        """
+        deadline = perf_counter() + self.think_time
+        counts = [0] * CELL_COUNT
+
+        # List the placements that avoid the misses and the sunk ships.
+        blocked = self.grid.get_misses() | self.sunk_cells
+        legal = {}
+        for length in set(self.remaining):
+            legal[length] = [
+                placement for placement in DensityStrategy.get_placement_cells(length) if placement[0] & blocked == 0
+            ]
+
+        samples = 0
+        attempts = 0
+        while samples < self.max_samples:
+            # Check the time once in a while.
+            if attempts % MonteCarloStrategy.SAMPLES_PER_CHECK == 0 and perf_counter() >= deadline:
+                break
+            attempts += 1
+
+            layout = self.__sample_layout(legal)
+            if layout is None:
+                continue
+            samples += 1
+            for mask, cells in layout:
+                for cell in cells:
+                    counts[cell] += 1
+        return counts
+
+    def __sample_layout(self, legal):
+        """
+        Places each remaining ship at random.
+        Layouts are rejected rather than repaired, so all the consistent layouts are equally likely.
+        :param legal: The placements avoiding the misses and the sunk ships, by length.
+        :return: The list of placements, or None if the ships overlap or leave a hit uncovered.
+        """
+        occupied = 0
+        layout = []
+        for length in self.remaining:
+            placements = legal[length]
+            if len(placements) == 0:
+                return None
+            placement = placements[int(self.rng.random() * len(placements))]
+            if placement[0] & occupied != 0:
+                return None
+            occupied |= placement[0]
+            layout.append(placement)
+
+        # All the hits must belong to a ship.
+        if self.unresolved & ~occupied != 0:
+            return None
+        return layout
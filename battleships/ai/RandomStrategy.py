@@ -0,0 +1,21 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the strategy base class.
+from battleships.ai.Strategy import Strategy
+# Import the rules.
+from battleships.rules import CELL_COUNT
+
+
+class RandomStrategy(Strategy):
+    """
+    Shoots the cells in a random order.
+    """
+
+    def next_shot(self):
+        """
+        Chooses a random cell that was not shot yet.
+        """
+        cells = [cell for cell in range(CELL_COUNT) if not self.grid.has_shot(cell)]
+        if len(cells) == 0:
+            raise ValueError("Every cell was already shot.")
+        return self.rng.choice(cells)
@@ -0,0 +1,63 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the abstract class and methods.
+from abc import ABC, abstractmethod
+# Import the random generator.
+import random
+
+# Import the rules.
+from battleships.rules import Fleet, ShotGrid
+
+
+class Strategy(ABC):
+    """
+    Base class of the AI strategies.
+    A strategy places its fleet and chooses where to shoot, from the results of its previous shots only.
+    Strategies do not depend on the engine, so they can be used in simulations.
+
+    Attributes:
+        rng         The random generator used by the strategy.
+        grid        The shots fired by the strategy, and their results.
+        background  Flag set if the strategy thinks long enough to be run in a background worker. (read-only)
+    """
+
+    # Strategies are fast enough to be run on the engine thread by default.
+    background = False
+
+    def __init__(self, rng=None):
+        """
+        Class constructor.
+        :param rng: The random generator to use. Defaults to a new unseeded generator.
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self.grid = ShotGrid()
+
+    def configure(self, options):
+        """
+        Reads the settings of the strategy.
+        :param options: The [AI] section of the configuration.
+        """
+        pass
+
+    def place_fleet(self):
+        """
+        Places the ships of the strategy.
+        :return: The placed Fleet.
+        """
+        return Fleet.random(rng=self.rng)
+
+    @abstractmethod
+    def next_shot(self):
+        """
+        Chooses the next cell to shoot. The cell must not have been shot yet.
+        :return: The index of the cell.
+        """
+        pass
+
+    def record(self, cell, result):
+        """
+        Records the result of a shot fired by the strategy.
+        :param cell: The index of the cell that was shot.
+        :param result: One of the SHOT_ results.
+        """
+        self.grid.record(cell, result)
@@ -0,0 +1,23 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the strategy base class.
+from battleships.ai.Strategy import Strategy
+# Import the rules.
+from battleships.rules import CELL_COUNT
+
+
+class SweepStrategy(Strategy):
+    """
+    Shoots every cell in order, from the top left to the bottom right.
+    Only useful as a baseline for the other strategies.
+    """
+
+    def next_shot(self):
+        """
+        Chooses the first cell that was not shot yet.
+        """
+        for cell in range(CELL_COUNT):
+            if not self.grid.has_shot(cell):
+                return cell
+        raise ValueError("Every cell was already shot.")
+
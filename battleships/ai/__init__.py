@@ -0,0 +1,13 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+# The AI strategies. Like the rules, this package must not import pygame or the engine.
+
+# Import the strategy base class.
+from battleships.ai.Strategy import Strategy
+# Import the strategies.
+from battleships.ai.SweepStrategy import SweepStrategy
+from battleships.ai.RandomStrategy import RandomStrategy
+from battleships.ai.DensityStrategy import DensityStrategy
+# Import the vectorized heat map.
+from battleships.ai.HeatMap import HeatMap
+# Import the Monte Carlo strategy.
+from battleships.ai.MonteCarloStrategy import MonteCarloStrategy
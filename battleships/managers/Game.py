@@ -2,12 +2,11 @@
 
 # Import the engine.
 import engine
-import sys
 
 # Import the player indices.
 from battleships.managers.GameManager import PLAYER_1, PLAYER_2
-# Import the Player class.
-from battleships.players.Player import Player
+# Import the shot results.
+from battleships.rules import SHOT_GAME_OVER
 
 
 class Game(engine.LevelManager):
@@ -44,12 +43,8 @@ class Game(engine.LevelManager):
         # Prepare the timer.
         self.timer = 0
 
-        # Set the current player index.
+        # Set the current player index. The players can change it once they are prepared.
         self.current_player_index = 0
-        # If we are the client, the server goes first.
-        for i in range(len(sys.argv)):
-            if sys.argv[i] == "--client":
-                self.current_player_index = 1
 
         # Prepare the phase counter.
         self.__current_phase = Game.PHASE_PREPARE
@@ -73,6 +68,10 @@ class Game(engine.LevelManager):
         Waits for GAME_DELAY seconds before moving onto the next phase.
         :param dt: The time since the last frame.
         """
+        # Tick the players.
+        for player in engine.Engine.game_manager.players.values():
+            player.tick(dt)
+
         # Increment the timer.
         self.timer += dt
 
@@ -116,6 +115,12 @@ class Game(engine.LevelManager):
         if self.__current_phase == self.PHASE_PREPARE:
             # If both players are ready.
             if self.__get_current_player().pre_game_prepare() and self.__get_other_player().pre_game_prepare():
+                # Let the players choose who shoots first.
+                for index in Game.PLAYERS:
+                    first = engine.Engine.game_manager.players[index].plays_first()
+                    if first is not None:
+                        self.current_player_index = index if first else (index + 1) % 2
+
                 # Start the turn.
                 self.__current_phase = self.PHASE_START_TURN
 
@@ -159,7 +164,7 @@ class Game(engine.LevelManager):
         # If the game awaits the next shot.
         elif self.__current_phase == self.PHASE_AWAIT_OPPONENT_SHOT:
             # If the opponent has lost.
-            if self.__current_fire_effect == Player.SHOT_HIT_TYPE_GAME_OVER:
+            if self.__current_fire_effect == SHOT_GAME_OVER:
                 # Store the winner's index.
                 engine.Engine.game_manager.winner = self.current_player_index
                 # Move to the game over phase.
@@ -38,3 +38,12 @@ class GameManager(engine.GameManager):
         """
         self.players[PLAYER_1] = engine.Engine.load_class(self.config["Players"]["player_1"])()
         self.players[PLAYER_2] = engine.Engine.load_class(self.config["Players"]["player_2"])()
+
+    def end(self):
+        """
+        Called when the engine stops.
+        Releases the resources of the players.
+        """
+        for player in self.players.values():
+            if player is not None:
+                player.close()
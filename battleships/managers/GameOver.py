@@ -10,6 +10,12 @@ class GameOver(engine.LevelManager):
     """
 
     def begin(self):
+        # Without a display, report the result and exit.
+        if engine.Engine.is_headless():
+            print("Player {} won.".format(engine.Engine.game_manager.winner + 1))
+            engine.Engine.request_exit()
+            return
+
         # Add the close handler.
         engine.Engine.input_handler.add_listener(engine.CloseOnEscapeOrQuit())
 
@@ -0,0 +1,92 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the struct module.
+import struct
+
+# Import the codec base class.
+from battleships.network.Codec import Codec
+# Import the JSON codec, used for the uncommon messages.
+from battleships.network.JsonCodec import JsonCodec
+# Import the rules.
+from battleships.rules import CELL_COUNT, cell_index, cell_coordinates, in_bounds
+
+
+class BinaryCodec(Codec):
+    """
+    Encodes the shots and hits in a few bytes: an opcode, the index of the cell and the result of the shot.
+    The other messages are sent as JSON, after their own opcode.
+    """
+
+    NAME = "binary"
+
+    # Opcodes of the messages.
+    OPCODE_JSON = 0
+    OPCODE_SHOT = 1
+    OPCODE_HIT = 2
+
+    # Layouts of the messages.
+    SHOT = struct.Struct("!BB")
+    HIT = struct.Struct("!BBB")
+
+    def __init__(self):
+        """
+        Class constructor.
+        """
+        self.__json = JsonCodec()
+
+    def encode(self, message):
+        if message["type"] == "shot":
+            return BinaryCodec.SHOT.pack(BinaryCodec.OPCODE_SHOT, BinaryCodec.__get_cell(message["attributes"]))
+        if message["type"] == "hit":
+            attributes = message["attributes"]
+            return BinaryCodec.HIT.pack(BinaryCodec.OPCODE_HIT, BinaryCodec.__get_cell(attributes), attributes["hit"])
+        return bytes((BinaryCodec.OPCODE_JSON,)) + self.__json.encode(message)
+
+    def decode(self, payload):
+        if len(payload) == 0:
+            raise ValueError("Received an empty message.")
+        opcode = payload[0]
+        if opcode == BinaryCodec.OPCODE_SHOT:
+            x, y = BinaryCodec.__get_coordinates(BinaryCodec.__unpack(BinaryCodec.SHOT, payload)[1])
+            return {"type": "shot", "attributes": {"x": x, "y": y}}
+        if opcode == BinaryCodec.OPCODE_HIT:
+            opcode, cell, hit = BinaryCodec.__unpack(BinaryCodec.HIT, payload)
+            x, y = BinaryCodec.__get_coordinates(cell)
+            return {"type": "hit", "attributes": {"x": x, "y": y, "hit": hit}}
+        if opcode == BinaryCodec.OPCODE_JSON:
+            return self.__json.decode(payload[1:])
+        raise ValueError("Received an unknown opcode: {}.".format(opcode))
+
+    @staticmethod
+    def __unpack(layout, payload):
+        """
+        Unpacks a message, checking its length first.
+        :param layout: The layout of the message.
+        :param payload: The received bytes.
+        :return: The unpacked values.
+        """
+        if len(payload) != layout.size:
+            raise ValueError("Received a message of {} bytes instead of {}.".format(len(payload), layout.size))
+        return layout.unpack(payload)
+
+    @staticmethod
+    def __get_coordinates(cell):
+        """
+        Returns the coordinates of a received cell, checking that it is on the board.
+        :param cell: The received index of the cell.
+        :return: The column and the row of the cell.
+        """
+        if cell >= CELL_COUNT:
+            raise ValueError("Received the cell {}, which is not on the board.".format(cell))
+        return cell_coordinates(cell)
+
+    @staticmethod
+    def __get_cell(attributes):
+        """
+        Returns the index of the cell of a message.
+        :param attributes: The attributes of the message.
+        :return: The index of the cell.
+        """
+        if not in_bounds(attributes["x"], attributes["y"]):
+            raise ValueError("The cell {}, {} is not on the board.".format(attributes["x"], attributes["y"]))
+        return cell_index(attributes["x"], attributes["y"])
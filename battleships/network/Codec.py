@@ -0,0 +1,32 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the abstract class and methods.
+from abc import ABC, abstractmethod
+
+
+class Codec(ABC):
+    """
+    Base class of the encodings of the messages sent over the network.
+    A message is a dictionary with a "type" and a dictionary of "attributes".
+    """
+
+    # Name of the codec, sent in the handshake.
+    NAME = None
+
+    @abstractmethod
+    def encode(self, message):
+        """
+        Encodes a message.
+        :param message: The message to encode.
+        :return: The payload to send.
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, payload):
+        """
+        Decodes a received payload.
+        :param payload: The received bytes.
+        :return: The decoded message.
+        """
+        pass
@@ -0,0 +1,256 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the asynchronous I/O module.
+import asyncio
+# Import the json module.
+import json
+# Import the thread safe queue.
+import queue
+# Import the threading module.
+import threading
+
+# Import the protocol.
+from battleships.network.Protocol import CODECS, HANDSHAKE_TIMEOUT, FrameDecoder, encode_frame, get_hello, \
+    check_hello
+
+
+class Connection:
+    """
+    Connection to the other player, run by an asyncio event loop on its own thread.
+    The game never waits on the network: the received messages are queued until the game polls them,
+    and the messages to send are queued until the I/O thread writes them.
+    Messages are sent in length-prefixed frames. Both players start by sending the version of their protocol and
+    their codecs, and the connection is only flagged as connected once the versions match.
+
+    Attributes:
+        server      Flag set if the connection waits for the other player to connect.
+        address     The listening address of the server, or the address to connect to.
+        port        The port of the server.
+        codecs      The names of the codecs this player accepts.
+        codec       The codec chosen during the handshake, or None before. (read-only)
+        lobby       Flag set if the other side is a dedicated server, which sends a start message once the match
+                    is found. (read-only)
+        connected   Flag set once the other player is connected and uses the same protocol. (read-only)
+        closed      Flag set once the connection is closed. (read-only)
+        error       The error that closed the connection, if any. (read-only)
+    """
+
+    # Delay between two connection attempts of the client, in seconds.
+    RETRY_DELAY = 1
+    # Maximal number of bytes read at once.
+    READ_SIZE = 4096
+
+    def __init__(self, server, address, port, codecs=None):
+        """
+        Class constructor.
+        Starts the I/O thread.
+        :param server: If True, waits for the other player to connect. Otherwise, connects to the server.
+        :param address: The listening address of the server, or the address to connect to.
+        :param port: The port of the server.
+        :param codecs: The names of the codecs this player accepts. Defaults to all the codecs.
+        """
+        self.server = server
+        self.address = address
+        self.port = port
+        self.codecs = list(codecs) if codecs is not None else list(CODECS)
+        self.codec = None
+        self.lobby = False
+        self.connected = False
+        self.closed = False
+        self.error = None
+
+        # Prepare the queue of the received messages. The queue of the messages to send belongs to the event loop,
+        # so it is created on the I/O thread.
+        self.__incoming = queue.Queue()
+        self.__outgoing = None
+
+        # Start the event loop on its own thread.
+        self.__loop = asyncio.new_event_loop()
+        self.__task = None
+        self.__thread = threading.Thread(target=self.__run, name="Connection", daemon=True)
+        self.__thread.start()
+
+    def send(self, message):
+        """
+        Queues a message for the other player.
+        :param message: The message to send.
+        """
+        try:
+            self.__loop.call_soon_threadsafe(self.__queue_message, message)
+        except RuntimeError:
+            # The event loop already stopped, the message is dropped.
+            if self.error is None:
+                self.error = ConnectionError("The connection is closed, a message could not be sent.")
+
+    def poll(self):
+        """
+        Returns the oldest message received from the other player, without waiting.
+        :return: The message, or None if no message was received.
+        """
+        try:
+            return self.__incoming.get_nowait()
+        except queue.Empty:
+            return None
+
+    def close(self):
+        """
+        Closes the connection and stops the I/O thread.
+        """
+        try:
+            self.__loop.call_soon_threadsafe(self.__cancel)
+        except RuntimeError:
+            # The event loop already stopped.
+            pass
+
+    def __queue_message(self, message):
+        """
+        Queues a message for the writer. Run on the I/O thread.
+        :param message: The message to send.
+        """
+        self.__outgoing.put_nowait(message)
+
+    def __cancel(self):
+        """
+        Cancels the connection task. Run on the I/O thread.
+        """
+        if self.__task is not None:
+            self.__task.cancel()
+
+    def __run(self):
+        """
+        Runs the event loop until the connection is closed.
+        """
+        asyncio.set_event_loop(self.__loop)
+        # Create the queue before the messages sent early are queued by the event loop.
+        self.__outgoing = asyncio.Queue()
+        self.__task = self.__loop.create_task(self.__main())
+        try:
+            self.__loop.run_until_complete(self.__task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.__loop.close()
+
+    async def __main(self):
+        """
+        Connects to the other player, then exchanges messages until one side closes the connection.
+        """
+        writer = None
+        try:
+            # Open the connection.
+            if self.server:
+                reader, writer = await self.__accept()
+            else:
+                reader, writer = await self.__connect()
+
+            # Check that both players use the same protocol.
+            decoder = FrameDecoder()
+            await self.__handshake(reader, writer, decoder)
+            self.connected = True
+
+            # Read and write until either side stops.
+            tasks = [
+                asyncio.ensure_future(self.__read(reader, decoder)),
+                asyncio.ensure_future(self.__write(writer))
+            ]
+            try:
+                done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            finally:
+                for task in tasks:
+                    task.cancel()
+        except asyncio.CancelledError:
+            # The connection was closed by this player.
+            raise
+        except Exception as error:
+            # Any other error closes the connection, and is reported to the game.
+            self.error = error
+        finally:
+            self.closed = True
+            if writer is not None:
+                writer.close()
+
+    async def __accept(self):
+        """
+        Waits for the other player to connect.
+        :return: The reader and writer of the connection.
+        """
+        accepted = self.__loop.create_future()
+
+        def on_client(client_reader, client_writer):
+            # Only the first client is accepted.
+            if accepted.done():
+                client_writer.close()
+            else:
+                accepted.set_result((client_reader, client_writer))
+
+        server = await asyncio.start_server(on_client, self.address, self.port)
+        try:
+            return await accepted
+        finally:
+            server.close()
+
+    async def __connect(self):
+        """
+        Connects to the server, retrying until it accepts the connection.
+        :return: The reader and writer of the connection.
+        """
+        while True:
+            try:
+                return await asyncio.open_connection(self.address, self.port)
+            except ConnectionRefusedError:
+                print("Connection refused.")
+                await asyncio.sleep(Connection.RETRY_DELAY)
+
+    async def __handshake(self, reader, writer, decoder):
+        """
+        Exchanges the protocol versions and the codecs with the other player.
+        :param reader: The reader of the connection.
+        :param writer: The writer of the connection.
+        :param decoder: The frame decoder of the connection.
+        """
+        writer.write(encode_frame(json.dumps(get_hello(self.codecs)).encode("UTF-8")))
+        await writer.drain()
+
+        # Wait for the first frame of the other player.
+        payloads = []
+        while len(payloads) == 0:
+            data = await asyncio.wait_for(reader.read(Connection.READ_SIZE), HANDSHAKE_TIMEOUT)
+            if len(data) == 0:
+                raise ConnectionError("The other player closed the connection during the handshake.")
+            payloads = decoder.feed(data)
+        hello = json.loads(payloads[0].decode("UTF-8"))
+        self.codec = check_hello(hello, self.codecs)
+        self.lobby = bool(hello["attributes"].get("lobby", False))
+
+        # Queue the messages that were sent right after the handshake.
+        for payload in payloads[1:]:
+            self.__incoming.put(self.codec.decode(payload))
+
+    async def __read(self, reader, decoder):
+        """
+        Queues the messages received from the other player.
+        :param reader: The reader of the connection.
+        :param decoder: The frame decoder of the connection.
+        """
+        while True:
+            data = await reader.read(Connection.READ_SIZE)
+            # Stop if the other player closed the connection.
+            if len(data) == 0:
+                if decoder.get_pending_size() > 0:
+                    raise ConnectionError("The connection was closed in the middle of a message.")
+                return
+            for payload in decoder.feed(data):
+                self.__incoming.put(self.codec.decode(payload))
+
+    async def __write(self, writer):
+        """
+        Sends the queued messages to the other player.
+        :param writer: The writer of the connection.
+        """
+        while True:
+            # Write the whole frame, and wait until it is flushed.
+            message = await self.__outgoing.get()
+            writer.write(encode_frame(self.codec.encode(message)))
+            await writer.drain()
@@ -0,0 +1,140 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the asynchronous I/O module.
+import asyncio
+# Import the random generator.
+import random
+
+# Import the protocol.
+from battleships.network.Protocol import CODECS
+from battleships.network.JsonCodec import JsonCodec
+# Import the server classes.
+from battleships.network.ServerMatch import ServerMatch
+from battleships.network.ServerSession import ServerSession
+
+
+class DedicatedServer:
+    """
+    Headless server hosting many matches in one asyncio event loop.
+    The clients are paired in the order they connect, and each pair plays a ServerMatch.
+    Clients connect with the --client flag, like to a game started with --server.
+
+    Attributes:
+        address         The listening address of the server.
+        port            The port of the server.
+        codecs          The names of the codecs accepted by the server.
+        rng             The random generator choosing who shoots first.
+        waiting         The session waiting for an opponent, or None.
+        matches         The matches being played, by number.
+        match_count     The number of matches started since the server started.
+    """
+
+    def __init__(self, address, port, codecs=None, rng=None):
+        """
+        Class constructor.
+        :param address: The listening address of the server.
+        :param port: The port of the server.
+        :param codecs: The names of the codecs accepted by the server. Defaults to all the codecs.
+        :param rng: The random generator choosing who shoots first.
+        """
+        self.address = address
+        self.port = port
+        self.codecs = list(codecs) if codecs is not None else list(CODECS)
+        self.rng = rng if rng is not None else random.Random()
+        self.waiting = None
+        self.matches = {}
+        self.match_count = 0
+
+    @classmethod
+    def from_arguments(cls, arguments):
+        """
+        Creates a server from the command line, with the same --address, --port and --json flags as the game.
+        :param arguments: The command line arguments.
+        :return: The new server.
+        """
+        address = '0.0.0.0'
+        port = 61888
+        codecs = None
+        for arg_i in range(len(arguments)):
+            # Check for the --address, --port and --json flags.
+            if arguments[arg_i] == "--address" and arg_i + 1 < len(arguments):
+                address = arguments[arg_i + 1]
+            if arguments[arg_i] == "--port" and arg_i + 1 < len(arguments):
+                port = int(arguments[arg_i + 1])
+            if arguments[arg_i] == "--json":
+                codecs = [JsonCodec.NAME]
+        return cls(address, port, codecs)
+
+    def run(self):
+        """
+        Runs the server until it is interrupted.
+        """
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+
+    async def serve(self):
+        """
+        Accepts clients until the task is cancelled.
+        """
+        server = await asyncio.start_server(self.__on_client, self.address, self.port)
+        print("Dedicated server listening on {}:{}.".format(self.address, self.port))
+        async with server:
+            await server.serve_forever()
+
+    async def __on_client(self, reader, writer):
+        """
+        Serves a client, from its handshake until its match ends.
+        :param reader: The reader of the connection.
+        :param writer: The writer of the connection.
+        """
+        session = ServerSession(reader, writer)
+        try:
+            await session.handshake(self.codecs)
+            self.__join(session)
+
+            # Relay the messages of the client to its opponent.
+            while True:
+                message = await session.receive()
+                if message is None:
+                    break
+                if session.match is None:
+                    raise ValueError("The client sent a message before its match started.")
+                session.match.receive(session, message)
+                if session.match.is_over():
+                    match = session.match
+                    print("Match {} won by {}.".format(match.number, match.sessions[match.winner].address))
+                    break
+        except (OSError, ValueError) as error:
+            print("Client {} dropped: {}".format(session.address, error))
+        finally:
+            self.__leave(session)
+
+    def __join(self, session):
+        """
+        Pairs a client with the waiting one, or makes it wait.
+        :param session: The session of the client.
+        """
+        if self.waiting is None:
+            self.waiting = session
+            return
+
+        # Start a new match.
+        self.match_count += 1
+        match = ServerMatch(self.match_count, (self.waiting, session), self.rng.randrange(2))
+        self.matches[match.number] = match
+        self.waiting = None
+
+    def __leave(self, session):
+        """
+        Removes a client that left, and ends its match.
+        :param session: The session of the client.
+        """
+        if self.waiting is session:
+            self.waiting = None
+        match = session.match
+        if match is not None and match.number in self.matches:
+            del self.matches[match.number]
+            match.close()
+        session.close()
@@ -0,0 +1,21 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the json module.
+import json
+
+# Import the codec base class.
+from battleships.network.Codec import Codec
+
+
+class JsonCodec(Codec):
+    """
+    Encodes the messages as JSON. Readable, and used for debugging.
+    """
+
+    NAME = "json"
+
+    def encode(self, message):
+        return json.dumps(message).encode("UTF-8")
+
+    def decode(self, payload):
+        return json.loads(payload.decode("UTF-8"))
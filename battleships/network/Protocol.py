@@ -0,0 +1,114 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the struct module.
+import struct
+
+# Import the codecs.
+from battleships.network.BinaryCodec import BinaryCodec
+from battleships.network.JsonCodec import JsonCodec
+
+
+# Version of the network protocol. Both players must use the same version.
+PROTOCOL_VERSION = 1
+# Header of the frames: the length of the payload, as a big endian unsigned int.
+FRAME_HEADER = struct.Struct("!I")
+# Maximal length of a payload, larger frames are considered corrupted.
+MAX_FRAME_SIZE = 1 << 16
+# Time given to the other side to send its hello message, in seconds.
+HANDSHAKE_TIMEOUT = 10
+# Codecs of the messages, by name, from the most to the least preferred.
+CODECS = {BinaryCodec.NAME: BinaryCodec, JsonCodec.NAME: JsonCodec}
+
+
+def encode_frame(payload):
+    """
+    Prefixes a payload with its length.
+    :param payload: The bytes to send.
+    :return: The frame to send.
+    """
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ValueError("The payload is too large to be sent: {} bytes.".format(len(payload)))
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def get_hello(codecs, lobby=False):
+    """
+    Returns the first message sent by both sides, always encoded as JSON.
+    :param codecs: The names of the codecs supported by the sender.
+    :param lobby: True if the sender is a dedicated server, which will send a start message once a match is found.
+    :return: The message, with the version of the protocol and the supported codecs.
+    """
+    return {"type": "hello", "attributes": {"version": PROTOCOL_VERSION, "codecs": list(codecs), "lobby": lobby}}
+
+
+def check_hello(message, codecs):
+    """
+    Checks the first message received from the other player, and chooses the codec of the connection.
+    Both players choose the most preferred codec they both support.
+    :param message: The received message.
+    :param codecs: The names of the codecs supported by this player.
+    :return: The codec to use.
+    """
+    if not isinstance(message, dict) or message.get("type") != "hello":
+        raise ValueError("The other player did not start with a handshake.")
+    attributes = message.get("attributes", {})
+    if not isinstance(attributes, dict):
+        raise ValueError("The other player sent a malformed handshake.")
+    version = attributes.get("version")
+    if version != PROTOCOL_VERSION:
+        raise ValueError("The other player uses version {} of the protocol instead of {}.".format(
+            version, PROTOCOL_VERSION
+        ))
+
+    # Players that do not list their codecs only support JSON.
+    other_codecs = attributes.get("codecs", [JsonCodec.NAME])
+    for name, codec in CODECS.items():
+        if name in codecs and name in other_codecs:
+            return codec()
+    raise ValueError("The other player does not support any of the codecs: {}.".format(", ".join(codecs)))
+
+
+class FrameDecoder:
+    """
+    Streaming decoder of length-prefixed frames.
+    The received bytes are buffered until complete frames can be extracted, so a frame can be split
+    over several reads, and a read can hold several frames.
+    """
+
+    def __init__(self):
+        """
+        Class constructor.
+        """
+        self.__buffer = bytearray()
+
+    def feed(self, data):
+        """
+        Adds received bytes to the buffer, and extracts the complete frames.
+        :param data: The received bytes.
+        :return: The payloads of the complete frames, in order.
+        """
+        self.__buffer += data
+        payloads = []
+        offset = 0
+        while len(self.__buffer) - offset >= FRAME_HEADER.size:
+            # Read the length of the next frame.
+            length = FRAME_HEADER.unpack_from(self.__buffer, offset)[0]
+            if length > MAX_FRAME_SIZE:
+                raise ValueError("Received a frame of {} bytes, the stream is corrupted.".format(length))
+
+            # Stop if the frame is not complete yet.
+            end = offset + FRAME_HEADER.size + length
+            if end > len(self.__buffer):
+                break
+            payloads.append(bytes(self.__buffer[offset + FRAME_HEADER.size:end]))
+            offset = end
+
+        # Drop the extracted frames.
+        del self.__buffer[:offset]
+        return payloads
+
+    def get_pending_size(self):
+        """
+        :return: The number of buffered bytes that do not make a complete frame yet.
+        """
+        return len(self.__buffer)
@@ -0,0 +1,114 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the rules.
+from battleships.rules import ShotGrid, SHOT_MISS, SHOT_GAME_OVER, cell_index, in_bounds
+
+
+class ServerMatch:
+    """
+    Match between two clients of the dedicated server.
+    Follows the turns of the Game level: the shooter sends its shot, which is relayed to its opponent,
+    and the opponent answers with the result, which is relayed back before the turn passes.
+    The fleets stay on the clients, so the server checks the order of the messages, the cells and the results,
+    but cannot check that the results are true.
+
+    Attributes:
+        number          The number of the match, used in the logs.
+        sessions        The sessions of both clients.
+        grids           The shots fired by each client.
+        current_player  The index of the client that shoots next.
+        pending_shot    The cell shot by the current player, until its opponent answers, or None.
+        winner          The index of the winner, or None if the match is not over.
+    """
+
+    def __init__(self, number, sessions, first_player):
+        """
+        Class constructor.
+        Tells both clients that the match starts, and who shoots first.
+        :param number: The number of the match.
+        :param sessions: The sessions of both clients.
+        :param first_player: The index of the client that shoots first.
+        """
+        self.number = number
+        self.sessions = list(sessions)
+        self.grids = [ShotGrid(), ShotGrid()]
+        self.current_player = first_player
+        self.pending_shot = None
+        self.winner = None
+
+        for index, session in enumerate(self.sessions):
+            session.match = self
+            session.index = index
+            session.send({"type": "start", "attributes": {"first": index == first_player}})
+
+    def is_over(self):
+        """
+        :return: True if one of the clients won.
+        """
+        return self.winner is not None
+
+    def receive(self, session, message):
+        """
+        Checks a message of a client, and relays it to its opponent.
+        :param session: The session of the client.
+        :param message: The received message.
+        """
+        if self.winner is not None:
+            raise ValueError("The match is over.")
+        if not isinstance(message, dict) or not isinstance(message.get("attributes", {}), dict):
+            raise ValueError("The client sent a malformed message.")
+        attributes = message.get("attributes", {})
+
+        # The current player sends its shot.
+        if message.get("type") == "shot":
+            if session.index != self.current_player or self.pending_shot is not None:
+                raise ValueError("The client shot out of turn.")
+            cell = ServerMatch.__get_cell(attributes)
+            if self.grids[session.index].has_shot(cell):
+                raise ValueError("The client shot the cell {} twice.".format(cell))
+            self.pending_shot = cell
+
+        # Its opponent answers with the result.
+        elif message.get("type") == "hit":
+            if session.index == self.current_player or self.pending_shot is None:
+                raise ValueError("The client sent a result without a shot.")
+            if ServerMatch.__get_cell(attributes) != self.pending_shot:
+                raise ValueError("The client sent the result of another cell.")
+            result = attributes.get("hit")
+            if not isinstance(result, int) or not SHOT_MISS <= result <= SHOT_GAME_OVER:
+                raise ValueError("The client sent an unknown result: {}.".format(result))
+
+            # Resolve the shot, and pass the turn.
+            self.grids[self.current_player].record(self.pending_shot, result)
+            self.pending_shot = None
+            if result == SHOT_GAME_OVER:
+                self.winner = self.current_player
+            else:
+                self.current_player = 1 - self.current_player
+
+        else:
+            raise ValueError("Received a wrong message.")
+
+        # Relay the message.
+        self.sessions[1 - session.index].send(message)
+
+    def close(self):
+        """
+        Closes the connections of both clients.
+        """
+        for session in self.sessions:
+            session.close()
+
+    @staticmethod
+    def __get_cell(attributes):
+        """
+        Returns the index of the cell of a message.
+        :param attributes: The attributes of the message.
+        :return: The index of the cell.
+        """
+        x = attributes.get("x")
+        y = attributes.get("y")
+        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)) or not in_bounds(x, y) \
+                or x != int(x) or y != int(y):
+            raise ValueError("The cell {}, {} is not on the board.".format(x, y))
+        return cell_index(x, y)
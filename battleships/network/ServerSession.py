@@ -0,0 +1,79 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the asynchronous I/O module.
+import asyncio
+# Import the json module.
+import json
+
+# Import the protocol.
+from battleships.network.Protocol import HANDSHAKE_TIMEOUT, FrameDecoder, encode_frame, get_hello, check_hello
+
+
+class ServerSession:
+    """
+    Connection of a client to the dedicated server.
+    Unlike the Connection of the players, a session runs on the event loop of the server.
+
+    Attributes:
+        address     The address of the client.
+        codec       The codec chosen during the handshake, or None before. (read-only)
+        match       The match of the client, or None while it waits for an opponent.
+        index       The index of the client in its match.
+    """
+
+    # Maximal number of bytes read at once.
+    READ_SIZE = 4096
+
+    def __init__(self, reader, writer):
+        """
+        Class constructor.
+        :param reader: The reader of the connection.
+        :param writer: The writer of the connection.
+        """
+        self.address = writer.get_extra_info("peername")
+        self.codec = None
+        self.match = None
+        self.index = 0
+        self.__reader = reader
+        self.__writer = writer
+        self.__decoder = FrameDecoder()
+        self.__received = []
+
+    async def handshake(self, codecs):
+        """
+        Exchanges the protocol versions and the codecs with the client.
+        :param codecs: The names of the codecs accepted by the server.
+        """
+        message = await asyncio.wait_for(self.receive(json.loads), HANDSHAKE_TIMEOUT)
+        if message is None:
+            raise ConnectionError("The client closed the connection during the handshake.")
+        self.codec = check_hello(message, codecs)
+        self.__writer.write(encode_frame(json.dumps(get_hello(codecs, True)).encode("UTF-8")))
+
+    async def receive(self, decode=None):
+        """
+        Waits for the next message of the client.
+        :param decode: The function decoding the payload. Defaults to the codec of the session.
+        :return: The message, or None if the client closed the connection.
+        """
+        while len(self.__received) == 0:
+            data = await self.__reader.read(ServerSession.READ_SIZE)
+            if len(data) == 0:
+                return None
+            self.__received.extend(self.__decoder.feed(data))
+        payload = self.__received.pop(0)
+        return (decode or self.codec.decode)(payload)
+
+    def send(self, message):
+        """
+        Sends a message to the client, without waiting for it to be flushed.
+        :param message: The message to send.
+        """
+        if not self.__writer.is_closing():
+            self.__writer.write(encode_frame(self.codec.encode(message)))
+
+    def close(self):
+        """
+        Closes the connection, once the sent messages are flushed.
+        """
+        self.__writer.close()
@@ -0,0 +1,13 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+# The network layer of the multiplayer games. Like the rules, this package must not import pygame or the engine.
+
+# Import the connection class.
+from battleships.network.Connection import Connection
+# Import the codecs.
+from battleships.network.Codec import Codec
+from battleships.network.JsonCodec import JsonCodec
+from battleships.network.BinaryCodec import BinaryCodec
+# Import the protocol tools.
+from battleships.network.Protocol import PROTOCOL_VERSION, CODECS, FrameDecoder, encode_frame
+# Import the dedicated server.
+from battleships.network.DedicatedServer import DedicatedServer
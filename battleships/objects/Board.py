@@ -33,9 +33,12 @@ class Board(engine.GameObject, ABC):
         :param color: The color of the background.
         :param line_color: The color of the lines.
         """
+        # The background never changes, render it as a single cached layer.
+        layer = engine.StaticLayerGameObject(parent)
+
         # Create the rectangle for the background.
         rect = engine.RectGameObject(
-            parent,
+            layer,
             engine.math.Vector2(Board.CELL_SIZE * 10, Board.CELL_SIZE * 10),
             4,
             color,
@@ -22,6 +22,9 @@ class Ship(engine.TexturedGameObject, engine.InputListener, ABC):
         rotation    The rotation angle of the ship.
     """
 
+    # Ships are drawn above the boards.
+    render_layer = engine.LAYER_SHIPS
+
     def __init__(self, board, length, texture):
         """
         Class constructor.
@@ -33,7 +36,8 @@ class Ship(engine.TexturedGameObject, engine.InputListener, ABC):
         # Call the parent constructor.
         super().__init__(board, texture, engine.math.Vector2(49, 48 * length + 1))
         self.texture = self.texture.convert_alpha()
-        self.base_texture = self.texture.copy()
+        # The converted texture is different from the shared one.
+        self.texture_key = "{}:alpha".format(texture)
         self.base_size = copy(self.size)
         self.board = board
 
@@ -161,8 +165,9 @@ class Ship(engine.TexturedGameObject, engine.InputListener, ABC):
             self.size.x = self.size.y
             self.size.y = tmp
 
-        self.texture = pygame.transform.rotate(self.base_texture, deg_angle)
+        self.texture_angle = deg_angle
         self.rotation = angle
+        self.mark_dirty()
 
 
 class AircraftCarrier(Ship):
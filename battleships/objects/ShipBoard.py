@@ -6,10 +6,19 @@ from battleships.objects.Board import Board
 # Import the engine.
 import engine
 
+# Import the rules.
+from battleships.rules import Fleet, placement_mask
+
 
 class ShipBoard(Board):
     """
     Board object that renders all the ships from the player.
+    The cells covered by the placed ships are computed by the game rules, so the board and the fleet used during the
+    game always agree on where the ships are.
+
+    Attributes:
+        placed_ships    List of all the ships placed on the board. Use place_boat and remove_boat to change it.
+        occupancy       Bitboard of all the occupied cells. (read-only)
     """
 
     def __init__(self, parent):
@@ -26,14 +35,40 @@ class ShipBoard(Board):
 
         # List of all the placed ships.
         self.placed_ships = []
+        # Prepare the bitboard.
+        self.occupancy = 0
+        # Mask of the cells covered by each placed ship.
+        self.__ship_masks = {}
 
     def remove_boat(self, boat):
+        """
+        Removes the ship from the board.
+        :param boat: The ship to remove.
+        """
         if boat in self.placed_ships:
             self.placed_ships.remove(boat)
 
+        # Free the cells of the ship.
+        self.occupancy &= ~self.__ship_masks.pop(boat, 0)
+
     def place_boat(self, boat):
+        """
+        Places the ship on the board, on the cells it currently covers.
+        :param boat: The ship to place.
+        """
+        mask = ShipBoard.get_mask(boat.get_cell(), boat.length, boat.rotation)
+        if mask == 0:
+            raise ValueError("The ship does not fit on the board.")
+
+        # If the ship was already placed, move it.
+        if boat in self.placed_ships:
+            self.remove_boat(boat)
         self.placed_ships.append(boat)
 
+        # Occupy the cells of the ship.
+        self.__ship_masks[boat] = mask
+        self.occupancy |= mask
+
     def all_boats_placed(self):
         return len(self.placed_ships) == 5
 
@@ -45,40 +80,26 @@ class ShipBoard(Board):
         :param direction: The direction of the ship.
         :return: True if the position is valid.
         """
-        # Check if the position is within the bounds.
-        if cell.x >= 0 and cell.y >= 0:
-            if cell.x <= 10 and cell.y <= 10:
-                # If the ship is in the bounds.
-                if direction % 2 == 0:
-                    if cell.x <= 10 - length:
-                        # Check for collisions
-                        return self.collision_check(cell, length, direction) is None
-                else:
-                    if cell.y <= 10 - length:
-                        # Check for collisions
-                        return self.collision_check(cell, length, direction) is None
+        mask = ShipBoard.get_mask(cell, length, direction)
+        return mask != 0 and self.occupancy & mask == 0
 
-    @staticmethod
-    def __get_covered_cells(cell, length, direction):
-        covered_cells = []
-        for i in range(length):
-            if direction % 2 == 0:
-                covered_cells.append(i + (cell.x + cell.y * 10))
-            else:
-                covered_cells.append((i * 10) + (cell.x + cell.y * 10))
-
-        return covered_cells
-
-    def collision_check(self, cell, length, direction):
-        # Compute all the cells covered by the ship/shot.
-        covered_cells = ShipBoard.__get_covered_cells(cell, length, direction)
-
-        # Loop through all the ships.
-        for ship in self.placed_ships:
-            ship_cells = ShipBoard.__get_covered_cells(ship.get_cell(), ship.length, ship.rotation)
-            intersect = list(set(covered_cells) & set(ship_cells))
-            if len(intersect) > 0:
-                return ship
-
-        return None
+    def create_fleet(self):
+        """
+        Creates the fleet of the placed ships, used to resolve the shots during the game.
+        :return: The fleet, where each ship has the index it has in placed_ships.
+        """
+        fleet = Fleet()
+        for boat in self.placed_ships:
+            fleet.place_mask(self.__ship_masks[boat])
+        return fleet
 
+    @staticmethod
+    def get_mask(cell, length, direction):
+        """
+        Returns the bitboard of the cells covered by a ship.
+        :param cell: The first cell of the ship.
+        :param length: The length of the ship.
+        :param direction: The direction of the ship. Even directions are horizontal.
+        :return: The mask of the covered cells, or 0 if the ship does not fit on the board.
+        """
+        return placement_mask(cell.x, cell.y, length, direction % 2 == 0)
@@ -39,6 +39,6 @@ class ShotBoard(Board):
             0,
             (255, 0, 0) if hit else (64, 64, 64)
         )
-        print(self.get_top_left())
         new_shot.transform.set_world_position(at * Board.CELL_SIZE + self.get_top_left())
         new_shot.transform.offset = engine.math.Vector2(8, 8)
+        new_shot.set_render_layer(engine.LAYER_MARKERS)
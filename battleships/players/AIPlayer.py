@@ -1,13 +1,75 @@
 #  Copyright © 2019 CAILLAUD Jean-Baptiste.
+# Import the worker pool.
+from concurrent.futures import ThreadPoolExecutor
 import random
 
 import engine
 from battleships.players.Player import Player
+# Import the rules.
+from battleships.rules import cell_index, cell_coordinates
 
 
 class AIPlayer(Player):
+    """
+    Computer controlled player.
+    Places its fleet and chooses its shots with the strategy set in the [AI] section of the configuration.
+
+    Attributes:
+        strategy    The strategy choosing the shots of the player.
+        fleet       The state of the player's ships, used to resolve the opponent's shots.
+        pending     The shot being chosen by the background worker, or None.
+    """
+
+    # Strategy used if none is configured.
+    DEFAULT_STRATEGY = "battleships.ai.DensityStrategy"
+
+    # Worker running the slow strategies, shared by all the AI players.
+    __worker = None
+
+    def __init__(self):
+        super().__init__()
+
+        # Load the strategy from the configuration.
+        config = engine.Engine.game_manager.config
+        strategy = config.get("AI", "strategy", fallback=AIPlayer.DEFAULT_STRATEGY)
+        seed = config.get("AI", "seed", fallback="")
+        self.strategy = engine.Engine.load_class(strategy)(random.Random(seed) if seed != "" else None)
+        if config.has_section("AI"):
+            self.strategy.configure(config["AI"])
+        self.fleet = None
+        self.pending = None
+
+    def __del__(self):
+        self.cancel_shot()
+
+    @classmethod
+    def shutdown_worker(cls):
+        """
+        Stops the background worker, cancelling the shots that did not start yet.
+        Otherwise, the program waits for all the queued shots before exiting.
+        """
+        if cls.__worker is not None:
+            cls.__worker.shutdown(wait=False, cancel_futures=True)
+            cls.__worker = None
+
+    def close(self):
+        """
+        Ignores the shot being chosen, and stops the background worker.
+        """
+        self.cancel_shot()
+        AIPlayer.shutdown_worker()
+
+    def cancel_shot(self):
+        """
+        Cancels the shot being chosen by the background worker, if any. Its result is ignored.
+        """
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
+
     def start_game(self):
-        pass
+        # Place the ships.
+        self.fleet = self.strategy.place_fleet()
 
     def start_turn(self):
         pass
@@ -16,20 +78,37 @@ class AIPlayer(Player):
         pass
 
     def request_shot(self):
-        self.current_cell += 1
-        self.fire(engine.math.Vector2(self.current_cell % 10, self.current_cell // 10))
+        # If the strategy is slow, let it think in the background.
+        if self.strategy.background:
+            if AIPlayer.__worker is None:
+                AIPlayer.__worker = ThreadPoolExecutor(max_workers=1)
+            self.cancel_shot()
+            self.pending = AIPlayer.__worker.submit(self.strategy.next_shot)
+        else:
+            self.__fire_at(self.strategy.next_shot())
+
+    def tick(self, dt):
+        # Fire once the background worker is done.
+        if self.pending is not None and self.pending.done():
+            pending = self.pending
+            self.pending = None
+            self.__fire_at(pending.result())
 
     def request_hit(self, at: engine.math.Vector2):
-        self.hit(at, self.SHOT_HIT_TYPE_GAME_OVER if at == self.ship_cell else self.SHOT_HIT_TYPE_MISS)
+        self.hit(at, self.fleet.receive_shot(cell_index(at.x, at.y)))
 
     def show_hit(self, at: engine.math.Vector2, hit_type: int):
-        pass
+        super().show_hit(at, hit_type)
+        # Tell the strategy the result of its shot.
+        self.strategy.record(cell_index(at.x, at.y), hit_type)
 
     def await_opponent_shot(self):
         pass
 
-    def __init__(self):
-        super().__init__()
-        self.current_cell = 0
-
-        self.ship_cell = engine.math.Vector2(4, 4)
+    def __fire_at(self, cell):
+        """
+        Fires at the chosen cell.
+        :param cell: The index of the cell to fire at.
+        """
+        x, y = cell_coordinates(cell)
+        self.fire(engine.math.Vector2(x, y))
@@ -11,6 +11,8 @@ from battleships.objects import ShipBoard, ShotBoard
 from battleships.players.Player import Player
 # Import the game texts.
 from battleships.objects.GameStateTexts import GameStateTexts
+# Import the rules.
+from battleships.rules import Fleet, cell_index
 
 # Import the pygame locals.
 import pygame.locals
@@ -20,6 +22,10 @@ class HumanPlayer(Player, engine.InputListener):
     """
     Human player class.
     Allows a human to play the game.
+
+    Attributes:
+        fleet   The state of the player's ships, used to resolve the opponent's shots.
+                The damage of the ships on the board is derived from it.
     """
 
     def __init__(self):
@@ -32,6 +38,11 @@ class HumanPlayer(Player, engine.InputListener):
         # Prepares the boat list.
         self.boat_list = []
 
+        # Prepare the fleet.
+        self.fleet = Fleet()
+        # Ship object of each ship of the fleet, by index.
+        self.__fleet_ships = []
+
         # Prepare the boards.
         self.ship_board = None
         self.shot_board = None
@@ -47,7 +58,6 @@ class HumanPlayer(Player, engine.InputListener):
 
         # Create the ships board.
         self.ship_board = ShipBoard(engine.Engine.scene)
-        self.ship_board.placed_ships = self.boat_list
         self.shot_board = ShotBoard(engine.Engine.scene)
         self.ship_board.visible = True
         self.shot_board.visible = False
@@ -60,10 +70,14 @@ class HumanPlayer(Player, engine.InputListener):
         self.texts = GameStateTexts(engine.Engine.scene)
         self.texts.transform.position = engine.math.Vector2(256, 564)
 
-        # Add the boats back to the tree.
+        # Add the boats back to the tree, and place them on the new board.
         for ship in self.boat_list:
             ship.transform.parent = self.ship_board.transform
             ship.enable_rendering()
+            self.ship_board.place_boat(ship)
+        # Create the fleet from the board.
+        self.fleet = self.ship_board.create_fleet()
+        self.__fleet_ships = list(self.ship_board.placed_ships)
 
     def start_turn(self):
         """
@@ -110,44 +124,35 @@ class HumanPlayer(Player, engine.InputListener):
         Request made by the engine to get the hit status.
         :param at: Where the shot was made.
         """
-        # Get the touched boat.
-        touched = self.ship_board.collision_check(at, 1, 1)
+        # Resolve the shot. A repeated shot on a damaged cell is a miss, but keeps its damage marker.
+        cell = cell_index(at.x, at.y)
+        already_hit = self.fleet.hits & (1 << cell) != 0
+        result = self.fleet.receive_shot(cell)
 
         # Display the text.
         self.texts.show_text(self.texts.TEXT_GAME_REQ_HIT)
 
-        # Add a hit marker.
-        col = engine.TexturedGameObject(
-            self.ship_board,
-            "WaterSplash" if touched is None else "BoatDamage",
-            engine.math.Vector2(48, 48)
-        )
-        col.transform.position = (at * self.shot_board.CELL_SIZE) - (self.shot_board.get_size() / 2)
-        col.transform.offset = copy(engine.math.UNIT_VECTOR)
-
-        # Compute the hit status.
-        if touched is None:
-            engine.Engine.play_sound("WaterExplosion")
-            # Tell the game that he did not hit.
-            self.hit(at, self.SHOT_HIT_TYPE_MISS)
-        else:
-            engine.Engine.play_sound("Explosion")
-            # Increment the damages on the boat.
-            touched.damage += 1
-
-            # If the ship is sunk.
-            if touched.damage >= touched.length:
-                # If all ships are sunk
-                all_sunk = True
-                for ship in self.ship_board.placed_ships:
-                    if ship.damage < ship.length:
-                        all_sunk = False
-                        break
-                # Tell the game that he sunk a ship.
-                self.hit(at, self.SHOT_HIT_TYPE_GAME_OVER if all_sunk else self.SHOT_HIT_TYPE_HIT_AND_SUNK)
+        # Add a hit marker, unless the cell already shows one.
+        if not already_hit:
+            col = engine.TexturedGameObject(
+                self.ship_board,
+                "WaterSplash" if result == self.SHOT_HIT_TYPE_MISS else "BoatDamage",
+                engine.math.Vector2(48, 48)
+            )
+            col.transform.position = (at * self.shot_board.CELL_SIZE) - (self.shot_board.get_size() / 2)
+            col.transform.offset = copy(engine.math.UNIT_VECTOR)
+            col.set_render_layer(engine.LAYER_MARKERS)
+
+            if result == self.SHOT_HIT_TYPE_MISS:
+                engine.Engine.play_sound("WaterExplosion")
             else:
-                # Tell the game that he hit a ship.
-                self.hit(at, self.SHOT_HIT_TYPE_HIT)
+                engine.Engine.play_sound("Explosion")
+                # Update the damages of the boat from the fleet.
+                index = self.fleet.get_ship_at(cell)
+                self.__fleet_ships[index].damage = self.fleet.get_damage(index)
+
+        # Tell the game the result of the shot.
+        self.hit(at, result)
 
     def hit(self, at: engine.math.Vector2, hit_status: int):
         """
@@ -179,6 +184,7 @@ class HumanPlayer(Player, engine.InputListener):
         )
         col.transform.position = (at * self.shot_board.CELL_SIZE) - (self.shot_board.get_size() / 2)
         col.transform.offset = copy(engine.math.UNIT_VECTOR)
+        col.set_render_layer(engine.LAYER_MARKERS)
         engine.Engine.play_sound("WaterExplosion" if hit_type == self.SHOT_HIT_TYPE_MISS else "Explosion")
 
         # Show the hit status.
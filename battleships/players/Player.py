@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 
 # Import the engine.
 import engine
+# Import the rules.
+from battleships.rules import ShotGrid, SHOT_MISS, SHOT_HIT, SHOT_HIT_AND_SUNK, SHOT_GAME_OVER, cell_index, in_bounds
 
 
 class Player(ABC):
@@ -14,13 +16,14 @@ class Player(ABC):
 
     Attributes:
         opponent    The opponent that this player is playing against.
+        shots       The shots fired by this player, and their results.
     """
 
     # Defines all the possible shots responses.
-    SHOT_HIT_TYPE_MISS = 0
-    SHOT_HIT_TYPE_HIT = 1
-    SHOT_HIT_TYPE_HIT_AND_SUNK = 2
-    SHOT_HIT_TYPE_GAME_OVER = 3
+    SHOT_HIT_TYPE_MISS = SHOT_MISS
+    SHOT_HIT_TYPE_HIT = SHOT_HIT
+    SHOT_HIT_TYPE_HIT_AND_SUNK = SHOT_HIT_AND_SUNK
+    SHOT_HIT_TYPE_GAME_OVER = SHOT_GAME_OVER
 
     def __init__(self):
         """
@@ -28,12 +31,19 @@ class Player(ABC):
         """
         # The opponent that this player is playing against.
         self.opponent = None
-        # List of all the moves made by this player.
-        self.moves = {}
+        # All the shots made by this player.
+        self.shots = ShotGrid()
 
     def pre_game_prepare(self):
         return True
 
+    def plays_first(self):
+        """
+        Called by the manager once both players are prepared, to choose who shoots first.
+        :return: True if this player must shoot first, False if the other player must, or None to let the manager choose.
+        """
+        return None
+
     @abstractmethod
     def start_game(self):
         """
@@ -75,12 +85,12 @@ class Player(ABC):
     def show_hit(self, at: engine.math.Vector2, hit_type: int):
         """
         Shows the user the effect of their shot.
-        Also, adds the shot to the moves list.
+        Also, records the shot in the shots grid.
         :param at: Where the shot landed.
         :param hit_type: One of SHOT_TYPE_.
         """
-        # Add the shot to the moves.
-        self.moves[at.tuple()] = hit_type
+        # Record the shot.
+        self.shots.record(cell_index(at.x, at.y), hit_type)
 
     @abstractmethod
     def await_opponent_shot(self):
@@ -91,6 +101,16 @@ class Player(ABC):
         pass
 
     def tick(self, dt):
+        """
+        Called by the manager on every frame of the game.
+        :param dt: The time since the last frame.
+        """
+        pass
+
+    def close(self):
+        """
+        Called by the manager when the engine stops, to release the resources of the player.
+        """
         pass
 
     def fire(self, at):
@@ -99,8 +119,8 @@ class Player(ABC):
         :param at: Where to fire.
         :return: True if the fire event was accepted.
         """
-        # Check if the fire event did not already occur at that position.
-        if at.tuple() in self.moves.keys():
+        # Check if the position is on the board, and was not already shot.
+        if not in_bounds(at.x, at.y) or self.shots.has_shot(cell_index(at.x, at.y)):
             return False
 
         # Tell the manager that we fired.
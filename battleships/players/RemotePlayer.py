@@ -1,20 +1,26 @@
 #  Copyright © 2019 CAILLAUD Jean-Baptiste.
 
-# Import the socket class.
-import socket
 # Import the system objects.
 import sys
-import json
 # Import the engine.
 import engine
 
 # Import the player base class.
 from battleships.players.Player import Player
+# Import the network connection.
+from battleships.network import Connection, JsonCodec
+# Import the rules.
+from battleships.rules import in_bounds
 
 
 class RemotePlayer(Player):
     """
     This class is used to represent the other player over the network.
+    The connection runs on its own thread. The player only polls the received messages on every tick,
+    so the game keeps running while it waits for the other player.
+
+    Attributes:
+        connection  The connection to the other player.
     """
 
     def __init__(self):
@@ -25,13 +31,11 @@ class RemotePlayer(Player):
         # Call the parent constructor.
         super().__init__()
 
-        # Create the socket.
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         # Check the type of the game.
-        self.client = None
         self.game_type = 'client'
         self.game_port = 61888
         self.game_addr = '127.0.0.1'
+        codecs = None
         for i in range(len(sys.argv)):
             # If the game is in server mode.
             if sys.argv[i] == "--server":
@@ -42,36 +46,53 @@ class RemotePlayer(Player):
                 self.game_port = int(sys.argv[i + 1])
             elif sys.argv[i] == "--address" and len(sys.argv) > i:
                 self.game_addr = sys.argv[i + 1]
+            # If the messages must be readable.
+            elif sys.argv[i] == "--json":
+                codecs = [JsonCodec.NAME]
 
-        # Paste those parameters.
-        if self.game_type == 'server':
-            self.socket.bind((self.game_addr, self.game_port))
-            self.socket.listen(1)
-
+        # Start the connection.
+        self.connection = Connection(self.game_type == 'server', self.game_addr, self.game_port, codecs)
+        # The type of the message the game is waiting for.
+        self.__expected = None
+        # On a dedicated server, True if the local player shoots first, or None until the match starts.
+        self.__local_first = None
 
     def __del__(self):
-        if self.client is not None:
-            self.client.close()
+        self.connection.close()
 
     def pre_game_prepare(self):
         """
-        Prepares the socket before the game.
+        Checks if the other player is connected.
         """
-        # If the socket is in server mode.
-        if self.game_type == 'server':
-            # Accept client connections.
-            self.client = self.socket.accept()[0]
-            return True
-        else:
-            # Try to connect to the server.
-            try:
-                self.socket.connect((self.game_addr, self.game_port))
-                self.client = self.socket
-                return True
-            except ConnectionRefusedError:
-                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                print("Connection refused.")
+        # If the connection could not be opened.
+        if self.connection.error is not None:
+            raise self.connection.error
+        if not self.connection.connected:
+            return False
+
+        # On a dedicated server, wait until an opponent is found.
+        if self.connection.lobby and self.__local_first is None:
+            # All the messages are queued before the connection is flagged as closed.
+            closed = self.connection.closed
+            response = self.connection.poll()
+            if response is None:
+                if closed:
+                    if self.connection.error is not None:
+                        raise self.connection.error
+                    raise ConnectionError("The server closed the connection before the match started.")
                 return False
+            if response["type"] != "start":
+                raise ValueError("Received a wrong message.")
+            self.__local_first = bool(response["attributes"]["first"])
+        return True
+
+    def plays_first(self):
+        """
+        On a dedicated server, the server chooses who shoots first. Otherwise, the server shoots first.
+        """
+        if self.connection.lobby:
+            return not self.__local_first
+        return self.game_type == 'client'
 
     def start_game(self):
         pass
@@ -84,36 +105,58 @@ class RemotePlayer(Player):
 
     def request_shot(self):
         # Wait for the client to send their shot info.
-        response = json.loads(self.client.recv(1024).decode("UTF-8"))
-        if response["type"] == "shot":
-            # Parse the shot info.
-            self.fire(engine.math.Vector2(
-                int(response["attributes"]["x"]),
-                int(response["attributes"]["y"]))
-            )
-        else:
-            raise ValueError("Received a wrong message.")
+        self.__expected = "shot"
 
     def request_hit(self, at: engine.math.Vector2):
         # Send the hit info to the client.
         data = {"type": "shot", "attributes": {"x": at.x, "y": at.y}}
-        self.client.send(json.dumps(data).encode("UTF-8"))
+        self.connection.send(data)
 
         # Wait for the client to send their shot info.
-        response = json.loads(self.client.recv(1024).decode("UTF-8"))
-        if response["type"] == "hit":
-            # Parse the shot info.
-            self.hit(engine.math.Vector2(
-                int(response["attributes"]["x"]),
-                int(response["attributes"]["y"])
-            ), int(response["attributes"]["hit"]))
-        else:
-            raise ValueError("Received a wrong message.")
+        self.__expected = "hit"
 
     def show_hit(self, at: engine.math.Vector2, hit_type: int):
         # Send the hit info to the client.
         data = {"type": "hit", "attributes": {"x": at.x, "y": at.y, "hit": hit_type}}
-        self.client.send(json.dumps(data).encode("UTF-8"))
+        self.connection.send(data)
 
     def await_opponent_shot(self):
         pass
+
+    def tick(self, dt):
+        # If the game is not waiting for a message, leave the received ones queued.
+        if self.__expected is None:
+            return
+
+        # Check for a message. All the messages are queued before the connection is flagged as closed.
+        closed = self.connection.closed
+        response = self.connection.poll()
+        if response is None:
+            if closed:
+                if self.connection.error is not None:
+                    raise self.connection.error
+                raise ConnectionError("The connection to the other player was lost.")
+            return
+        if response["type"] != self.__expected:
+            raise ValueError("Received a wrong message.")
+        self.__expected = None
+
+        if response["type"] == "shot":
+            # Parse the shot info.
+            self.fire(RemotePlayer.__get_location(response["attributes"]))
+        else:
+            # Parse the hit info.
+            self.hit(RemotePlayer.__get_location(response["attributes"]), int(response["attributes"]["hit"]))
+
+    @staticmethod
+    def __get_location(attributes):
+        """
+        Returns the location of a received message, checking that it is on the board.
+        :param attributes: The attributes of the message.
+        :return: The location of the cell.
+        """
+        x = int(attributes["x"])
+        y = int(attributes["y"])
+        if not in_bounds(x, y):
+            raise ValueError("The cell {}, {} is not on the board.".format(x, y))
+        return engine.math.Vector2(x, y)
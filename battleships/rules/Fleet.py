@@ -0,0 +1,138 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the random generator.
+import random
+
+# Import the grid tools.
+from battleships.rules.Grid import CELL_COUNT, FLEET_LENGTHS, SHOT_MISS, SHOT_HIT, SHOT_HIT_AND_SUNK, \
+    SHOT_GAME_OVER, placement_mask, get_placements, iterate_cells
+
+
+class Fleet:
+    """
+    The ships of a player, and the damage they took.
+    Cells are stored in bitboards, where the bit x + y * 10 represents the cell (x, y).
+
+    Attributes:
+        ship_masks  The cells covered by each ship, in placement order. (read-only)
+        occupancy   The cells covered by any ship. (read-only)
+        hits        The occupied cells that were shot. (read-only)
+        sunk        The number of sunk ships. (read-only)
+    """
+
+    def __init__(self):
+        """
+        Class constructor.
+        Creates an empty fleet.
+        """
+        self.ship_masks = []
+        self.occupancy = 0
+        self.hits = 0
+        self.sunk = 0
+        # Index of the ship on each cell, plus one. 0 if the cell is empty.
+        self.__cell_ships = bytearray(CELL_COUNT)
+
+    @staticmethod
+    def random(lengths=FLEET_LENGTHS, rng=random):
+        """
+        Creates a fleet with the ships placed at random.
+        :param lengths: The lengths of the ships to place.
+        :param rng: The random generator to use.
+        :return: The new fleet.
+        """
+        fleet = Fleet()
+        for length in lengths:
+            placements = [mask for mask in get_placements(length) if mask & fleet.occupancy == 0]
+            fleet.place_mask(rng.choice(placements))
+        return fleet
+
+    def can_place(self, x, y, length, horizontal):
+        """
+        Checks if a ship can be placed without leaving the board or overlapping another ship.
+        :param x: The column of the first cell of the ship.
+        :param y: The row of the first cell of the ship.
+        :param length: The length of the ship.
+        :param horizontal: True if the ship goes right from the first cell, False if it goes down.
+        :return: True if the ship can be placed.
+        """
+        mask = placement_mask(x, y, length, horizontal)
+        return mask != 0 and mask & self.occupancy == 0
+
+    def place(self, x, y, length, horizontal):
+        """
+        Places a new ship.
+        :param x: The column of the first cell of the ship.
+        :param y: The row of the first cell of the ship.
+        :param length: The length of the ship.
+        :param horizontal: True if the ship goes right from the first cell, False if it goes down.
+        :return: The index of the new ship.
+        """
+        mask = placement_mask(x, y, length, horizontal)
+        if mask == 0:
+            raise ValueError("A ship of length {} does not fit at ({}, {}).".format(length, x, y))
+        return self.place_mask(mask)
+
+    def place_mask(self, mask):
+        """
+        Places a new ship on the cells of the mask.
+        :param mask: The cells covered by the ship.
+        :return: The index of the new ship.
+        """
+        if mask & self.occupancy != 0:
+            raise ValueError("The ship overlaps another ship.")
+
+        self.ship_masks.append(mask)
+        self.occupancy |= mask
+        for cell in iterate_cells(mask):
+            self.__cell_ships[cell] = len(self.ship_masks)
+        return len(self.ship_masks) - 1
+
+    def get_ship_at(self, cell):
+        """
+        Returns the ship placed on the cell.
+        :param cell: The index of the cell.
+        :return: The index of the ship, or None if the cell is empty.
+        """
+        ship = self.__cell_ships[cell]
+        return ship - 1 if ship != 0 else None
+
+    def receive_shot(self, cell):
+        """
+        Resolves a shot of the opponent.
+        A shot on a cell that was already hit does not damage the ship again, and is reported as a miss.
+        :param cell: The index of the cell that was shot.
+        :return: One of the SHOT_ results.
+        """
+        bit = 1 << cell
+        ship = self.__cell_ships[cell]
+        if ship == 0 or self.hits & bit:
+            return SHOT_MISS
+        self.hits |= bit
+
+        # Check if the whole ship was hit.
+        mask = self.ship_masks[ship - 1]
+        if self.hits & mask != mask:
+            return SHOT_HIT
+        self.sunk += 1
+        return SHOT_GAME_OVER if self.is_defeated() else SHOT_HIT_AND_SUNK
+
+    def get_damage(self, ship):
+        """
+        :param ship: The index of the ship.
+        :return: The number of cells of the ship that were hit.
+        """
+        return bin(self.hits & self.ship_masks[ship]).count("1")
+
+    def is_sunk(self, ship):
+        """
+        :param ship: The index of the ship.
+        :return: True if all the cells of the ship were hit.
+        """
+        mask = self.ship_masks[ship]
+        return self.hits & mask == mask
+
+    def is_defeated(self):
+        """
+        :return: True if all the ships were sunk.
+        """
+        return self.occupancy != 0 and self.hits == self.occupancy
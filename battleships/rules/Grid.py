@@ -0,0 +1,96 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Number of cells on each side of the board.
+BOARD_SIZE = 10
+# Number of cells on the board.
+CELL_COUNT = BOARD_SIZE * BOARD_SIZE
+# Mask with every cell of the board set.
+FULL_MASK = (1 << CELL_COUNT) - 1
+
+# Lengths of the ships of a fleet.
+FLEET_LENGTHS = (5, 4, 3, 3, 2)
+
+# Defines all the possible shot results.
+SHOT_MISS = 0
+SHOT_HIT = 1
+SHOT_HIT_AND_SUNK = 2
+SHOT_GAME_OVER = 3
+
+# Cache of the placement masks, by length.
+__placements = {}
+
+
+def cell_index(x, y):
+    """
+    Returns the index of the cell, which is also its bit in the board masks.
+    :param x: The column of the cell.
+    :param y: The row of the cell.
+    :return: The index of the cell.
+    """
+    return int(x) + int(y) * BOARD_SIZE
+
+
+def cell_coordinates(index):
+    """
+    Returns the column and row of the cell.
+    :param index: The index of the cell.
+    :return: The column and the row of the cell.
+    """
+    return index % BOARD_SIZE, index // BOARD_SIZE
+
+
+def in_bounds(x, y):
+    """
+    :return: True if the cell is on the board.
+    """
+    return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
+
+
+def placement_mask(x, y, length, horizontal):
+    """
+    Returns the mask of the cells covered by a ship.
+    :param x: The column of the first cell of the ship.
+    :param y: The row of the first cell of the ship.
+    :param length: The length of the ship.
+    :param horizontal: True if the ship goes right from the first cell, False if it goes down.
+    :return: The mask of the covered cells, or 0 if the ship does not fit on the board.
+    """
+    x, y = int(x), int(y)
+    end_x, end_y = (x + length - 1, y) if horizontal else (x, y + length - 1)
+    if not in_bounds(x, y) or not in_bounds(end_x, end_y):
+        return 0
+
+    step = 1 if horizontal else BOARD_SIZE
+    mask = 0
+    for i in range(length):
+        mask |= 1 << (cell_index(x, y) + i * step)
+    return mask
+
+
+def get_placements(length):
+    """
+    Returns the masks of all the placements of a ship on the empty board.
+    The returned list is shared and must not be modified.
+    :param length: The length of the ship.
+    :return: The list of masks, horizontal placements first.
+    """
+    placements = __placements.get(length)
+    if placements is None:
+        placements = [
+            placement_mask(x, y, length, horizontal)
+            for horizontal in (True, False) for y in range(BOARD_SIZE) for x in range(BOARD_SIZE)
+        ]
+        placements = [mask for mask in placements if mask != 0]
+        __placements[length] = placements
+    return placements
+
+
+def iterate_cells(mask):
+    """
+    Iterates over the indices of the cells set in the mask, in increasing order.
+    :param mask: The mask to iterate over.
+    """
+    while mask != 0:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
@@ -0,0 +1,59 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the grid tools.
+from battleships.rules.Grid import CELL_COUNT, SHOT_GAME_OVER
+# Import the shot grid class.
+from battleships.rules.ShotGrid import ShotGrid
+
+
+class Match:
+    """
+    A complete game between two fleets, without any player logic.
+    The players shoot in turns, one shot each, until a fleet is defeated.
+
+    Attributes:
+        fleets          The fleets of both players.
+        grids           The shots fired by each player.
+        current_player  The index of the player that shoots next.
+        winner          The index of the winner, or None if the game is not over.
+    """
+
+    def __init__(self, fleets, first_player=0):
+        """
+        Class constructor.
+        :param fleets: The fleets of both players.
+        :param first_player: The index of the player that shoots first.
+        """
+        self.fleets = list(fleets)
+        self.grids = [ShotGrid(), ShotGrid()]
+        self.current_player = first_player
+        self.winner = None
+
+    def is_over(self):
+        """
+        :return: True if one of the fleets was defeated.
+        """
+        return self.winner is not None
+
+    def fire(self, cell):
+        """
+        Fires a shot of the current player at the opponent's fleet, then passes the turn.
+        :param cell: The index of the cell to shoot.
+        :return: One of the SHOT_ results.
+        """
+        if self.winner is not None:
+            raise ValueError("The match is over.")
+        if not 0 <= cell < CELL_COUNT:
+            raise ValueError("The cell {} is not on the board.".format(cell))
+        grid = self.grids[self.current_player]
+        if grid.has_shot(cell):
+            raise ValueError("The cell {} was already shot.".format(cell))
+
+        # Resolve the shot.
+        result = self.fleets[1 - self.current_player].receive_shot(cell)
+        grid.record(cell, result)
+        if result == SHOT_GAME_OVER:
+            self.winner = self.current_player
+        else:
+            self.current_player = 1 - self.current_player
+        return result
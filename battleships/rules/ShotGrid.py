@@ -0,0 +1,59 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the grid tools.
+from battleships.rules.Grid import SHOT_MISS, SHOT_HIT_AND_SUNK, SHOT_GAME_OVER
+
+
+class ShotGrid:
+    """
+    The shots fired by a player at the opponent's fleet, and their results.
+    Cells are stored in bitboards, where the bit x + y * 10 represents the cell (x, y).
+
+    Attributes:
+        shots   The cells that were shot. (read-only)
+        hits    The cells where a ship was hit. (read-only)
+        sunk    The number of ships that were sunk. (read-only)
+        results The result of each shot, by cell index, in firing order. (read-only)
+    """
+
+    def __init__(self):
+        """
+        Class constructor.
+        Creates a grid without any shot.
+        """
+        self.shots = 0
+        self.hits = 0
+        self.sunk = 0
+        self.results = {}
+
+    def has_shot(self, cell):
+        """
+        :param cell: The index of the cell.
+        :return: True if the cell was already shot.
+        """
+        return self.shots >> cell & 1 == 1
+
+    def record(self, cell, result):
+        """
+        Records the result of a shot.
+        :param cell: The index of the cell that was shot.
+        :param result: One of the SHOT_ results.
+        """
+        self.shots |= 1 << cell
+        self.results[cell] = result
+        if result != SHOT_MISS:
+            self.hits |= 1 << cell
+        if result == SHOT_HIT_AND_SUNK or result == SHOT_GAME_OVER:
+            self.sunk += 1
+
+    def get_misses(self):
+        """
+        :return: The mask of the cells that were shot without hitting anything.
+        """
+        return self.shots & ~self.hits
+
+    def get_shot_count(self):
+        """
+        :return: The number of shots fired.
+        """
+        return len(self.results)
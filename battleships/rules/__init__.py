@@ -0,0 +1,11 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+# The rules of the game, without any rendering. This package must not import pygame or the engine.
+
+# Import the grid tools.
+from battleships.rules.Grid import BOARD_SIZE, CELL_COUNT, FULL_MASK, FLEET_LENGTHS, \
+    SHOT_MISS, SHOT_HIT, SHOT_HIT_AND_SUNK, SHOT_GAME_OVER, \
+    cell_index, cell_coordinates, in_bounds, placement_mask, get_placements, iterate_cells
+# Import the game state classes.
+from battleships.rules.Fleet import Fleet
+from battleships.rules.ShotGrid import ShotGrid
+from battleships.rules.Match import Match
@@ -0,0 +1,274 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the process pool.
+from concurrent.futures import ProcessPoolExecutor
+# Import the configuration parser.
+from configparser import ConfigParser
+# Import the pairing generator.
+from itertools import combinations
+# Import the os module.
+import os
+# Import the random generator.
+import random
+# Import the high resolution timer.
+from time import perf_counter
+
+# Import the rules.
+from battleships.rules import Match
+
+
+# Strategy classes already loaded by this process, by dotted path.
+_strategy_classes = {}
+
+
+def load_class(class_name):
+    """
+    Dynamically loads the specified class, like Engine.load_class, without importing the engine.
+    :param class_name: The class to load.
+    """
+    class_info = class_name.rsplit(".", 1)
+    mod = __import__(class_info[0], fromlist=[class_info[1]])
+    return getattr(mod, class_info[1])
+
+
+def new_score():
+    """
+    Creates the score of one side of a pairing.
+    :return: A dictionary with the wins, the shots fired in the won games, the moves played,
+             the total and the longest time spent choosing a move, in seconds.
+    """
+    return {"wins": 0, "shots_to_win": 0, "moves": 0, "move_time": 0.0, "max_move_time": 0.0}
+
+
+def merge_score(score, other):
+    """
+    Adds a score to another.
+    :param score: The score to update.
+    :param other: The score to add.
+    """
+    for key in ("wins", "shots_to_win", "moves", "move_time"):
+        score[key] += other[key]
+    score["max_move_time"] = max(score["max_move_time"], other["max_move_time"])
+
+
+def play_batch(strategies, first_game, count, seed, options):
+    """
+    Plays a batch of games between two strategies. Run by the workers of the tournament.
+    The strategies take turns shooting first.
+    :param strategies: The dotted paths of the two strategy classes.
+    :param first_game: The number of the first game of the batch, used to seed the games.
+    :param count: The number of games to play.
+    :param seed: The seed of the tournament, or None for unseeded games.
+    :param options: The settings passed to the configure method of the strategies, or None.
+    :return: The score of each strategy.
+    """
+    # Load the strategy classes.
+    classes = []
+    for strategy in strategies:
+        if strategy not in _strategy_classes:
+            _strategy_classes[strategy] = load_class(strategy)
+        classes.append(_strategy_classes[strategy])
+
+    # Rebuild the settings section.
+    section = None
+    if options is not None:
+        config = ConfigParser()
+        config.read_dict({"AI": options})
+        section = config["AI"]
+
+    scores = [new_score(), new_score()]
+    for game in range(first_game, first_game + count):
+        # Create the players of the game.
+        players = []
+        for side in range(2):
+            rng = random.Random("{}:{}:{}".format(seed, game, side)) if seed is not None else None
+            player = classes[side](rng)
+            if section is not None:
+                player.configure(section)
+            players.append(player)
+
+        # Play until a fleet is defeated.
+        match = Match([player.place_fleet() for player in players], game % 2)
+        while not match.is_over():
+            side = match.current_player
+            start = perf_counter()
+            cell = players[side].next_shot()
+            move_time = perf_counter() - start
+            players[side].record(cell, match.fire(cell))
+
+            # Store the time spent on the move.
+            score = scores[side]
+            score["moves"] += 1
+            score["move_time"] += move_time
+            if move_time > score["max_move_time"]:
+                score["max_move_time"] = move_time
+
+        # Store the result of the game.
+        scores[match.winner]["wins"] += 1
+        scores[match.winner]["shots_to_win"] += match.grids[match.winner].get_shot_count()
+    return scores
+
+
+class Tournament:
+    """
+    Plays AI strategies against each other, without the engine.
+    Every pair of strategies plays the same number of games. The games are split in batches,
+    which are played on all the processors by a process pool.
+
+    Attributes:
+        strategies  The dotted paths of the strategy classes.
+        games       The number of games played by each pair of strategies.
+        workers     The number of worker processes.
+        seed        The seed of the games, or None for unseeded games.
+        options     The settings passed to the configure method of the strategies, or None.
+        results     The games played and the scores of both strategies, by pair of strategy indices.
+        elapsed     The time taken by the last run, in seconds.
+    """
+
+    # Number of games played by a worker at once.
+    BATCH_SIZE = 250
+
+    def __init__(self, strategies, games=1000, workers=None, seed=None, options=None):
+        """
+        Class constructor.
+        :param strategies: The dotted paths of the strategy classes. A single strategy plays against itself.
+        :param games: The number of games played by each pair of strategies.
+        :param workers: The number of worker processes. Defaults to the number of processors.
+        :param seed: The seed of the games, or None for unseeded games.
+        :param options: The settings passed to the configure method of the strategies, or None.
+        """
+        self.strategies = list(strategies)
+        self.games = games
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.seed = seed
+        self.options = options
+        self.results = {}
+        self.elapsed = 0.0
+
+    @classmethod
+    def from_arguments(cls, arguments):
+        """
+        Creates a tournament from the command line.
+        The strategies are listed after the --tournament flag. The number of games per pair, the number of workers
+        and the seed are set with the --games, --workers and --seed flags. If a configuration is selected with
+        --config, its [AI] section configures the strategies.
+        :param arguments: The command line arguments.
+        :return: The new tournament.
+        """
+        strategies = []
+        games = 1000
+        workers = None
+        seed = None
+        options = None
+        for arg_i in range(len(arguments)):
+            # Read the strategies following the --tournament flag.
+            if arguments[arg_i] == "--tournament":
+                for strategy in arguments[arg_i + 1:]:
+                    if strategy.startswith("-"):
+                        break
+                    strategies.append(strategy)
+
+            # Check for the --games, --workers and --seed flags.
+            if arguments[arg_i] == "--games" and arg_i + 1 < len(arguments):
+                games = int(arguments[arg_i + 1])
+            if arguments[arg_i] == "--workers" and arg_i + 1 < len(arguments):
+                workers = int(arguments[arg_i + 1])
+            if arguments[arg_i] == "--seed" and arg_i + 1 < len(arguments):
+                seed = arguments[arg_i + 1]
+
+            # Check for the --config or -c flag.
+            if (arguments[arg_i] == "--config" or arguments[arg_i] == "-c") and arg_i + 1 < len(arguments):
+                config = ConfigParser()
+                config.read("Data/%s.ini" % arguments[arg_i + 1])
+                if config.has_section("AI"):
+                    options = dict(config["AI"])
+
+        if len(strategies) == 0:
+            raise ValueError("The --tournament flag must be followed by at least one strategy.")
+        return cls(strategies, games, workers, seed, options)
+
+    def get_pairings(self):
+        """
+        :return: The pairs of strategy indices that play against each other.
+        """
+        if len(self.strategies) == 1:
+            return [(0, 0)]
+        return list(combinations(range(len(self.strategies)), 2))
+
+    def run(self):
+        """
+        Plays all the games of the tournament.
+        :return: The results of the tournament.
+        """
+        start = perf_counter()
+        self.results = {}
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            # Submit the batches of every pairing.
+            futures = []
+            for pairing in self.get_pairings():
+                self.results[pairing] = {"games": 0, "scores": [new_score(), new_score()]}
+                strategies = (self.strategies[pairing[0]], self.strategies[pairing[1]])
+                for first_game in range(0, self.games, Tournament.BATCH_SIZE):
+                    count = min(Tournament.BATCH_SIZE, self.games - first_game)
+                    future = executor.submit(play_batch, strategies, first_game, count, self.seed, self.options)
+                    futures.append((pairing, count, future))
+
+            # Gather the scores.
+            for pairing, count, future in futures:
+                result = self.results[pairing]
+                result["games"] += count
+                for side, score in enumerate(future.result()):
+                    merge_score(result["scores"][side], score)
+        self.elapsed = perf_counter() - start
+        return self.results
+
+    def get_standings(self):
+        """
+        Sums the scores of each strategy over all its pairings.
+        :return: The number of games played and the total score, by strategy index.
+        """
+        standings = [{"games": 0, "score": new_score()} for _ in self.strategies]
+        for pairing, result in self.results.items():
+            for side in range(2):
+                standing = standings[pairing[side]]
+                standing["games"] += result["games"]
+                merge_score(standing["score"], result["scores"][side])
+        return standings
+
+    def report(self):
+        """
+        Prints the results of the tournament.
+        """
+        for pairing, result in self.results.items():
+            print("{} vs {}, {} games:".format(
+                self.strategies[pairing[0]], self.strategies[pairing[1]], result["games"]
+            ))
+            for side in range(2):
+                Tournament.__print_score(self.strategies[pairing[side]], result["games"], result["scores"][side])
+
+        if len(self.results) > 1:
+            print("Standings:")
+            for index, standing in enumerate(self.get_standings()):
+                Tournament.__print_score(self.strategies[index], standing["games"], standing["score"])
+
+        games = sum(result["games"] for result in self.results.values())
+        print("Played {} games in {:.1f}s ({:.0f} games/s) on {} workers.".format(
+            games, self.elapsed, games / self.elapsed if self.elapsed > 0 else 0, self.workers
+        ))
+
+    @staticmethod
+    def __print_score(name, games, score):
+        """
+        Prints a line of the results.
+        :param name: The name of the strategy.
+        :param games: The number of games played.
+        :param score: The score of the strategy.
+        """
+        wins = score["wins"]
+        print("    {:<40} win rate {:6.2f}%  shots to win {:5.1f}  move {:8.1f}µs  max move {:7.2f}ms".format(
+            name,
+            100 * wins / games if games > 0 else 0,
+            score["shots_to_win"] / wins if wins > 0 else 0,
+            1e6 * score["move_time"] / score["moves"] if score["moves"] > 0 else 0,
+            1e3 * score["max_move_time"]
+        ))
@@ -0,0 +1,5 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+# Plays the AI strategies against each other. Like the rules, this package must not import pygame or the engine.
+
+# Import the tournament class and its worker function.
+from battleships.tournament.Tournament import Tournament, load_class, play_batch
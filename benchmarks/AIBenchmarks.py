@@ -0,0 +1,69 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the random generator.
+import random
+# Import the partial function helper.
+from functools import partial
+
+# Import the benchmark registration function.
+from benchmarks.Benchmark import register
+# Import the rules and the strategies.
+from battleships.rules import Fleet, SHOT_HIT
+from battleships.ai import DensityStrategy, MonteCarloStrategy
+from battleships.ai.HeatMap import HeatMap
+
+
+def play_shots(strategy_class, shots, target):
+    """
+    Prepares a strategy that already fired some shots at a random fleet.
+    :param strategy_class: The class of the strategy.
+    :param shots: The number of shots to fire before timing.
+    :param target: If True, more shots are fired until a ship is damaged but not sunk.
+    """
+    def setup():
+        fleet = Fleet.random(rng=random.Random(0))
+        strategy = strategy_class(random.Random(0))
+        for i in range(100):
+            cell = strategy.next_shot()
+            result = fleet.receive_shot(cell)
+            strategy.record(cell, result)
+            if i + 1 >= shots and (not target or result == SHOT_HIT):
+                break
+
+        def run():
+            strategy.next_shot()
+        return run
+    return setup
+
+
+def heat_map(remaining, blocked, unresolved):
+    """
+    Computes a heat map.
+    :param remaining: The lengths of the remaining ships.
+    :param blocked: The cells no ship can cover.
+    :param unresolved: The hits on ships that were not sunk yet.
+    """
+    def setup():
+        heat = HeatMap()
+
+        def run():
+            heat.compute(remaining, blocked, unresolved)
+        return run
+    return setup
+
+
+# List the strategies to benchmark.
+STRATEGIES = [("density.python", partial(DensityStrategy, vectorized=False))]
+if HeatMap.is_available():
+    STRATEGIES.append(("density.numpy", partial(DensityStrategy, vectorized=True)))
+    register("ai.heat_map.hunt", heat_map([5, 4, 3, 3, 2], 0x1234567, 0))
+    register("ai.heat_map.target", heat_map([4, 3, 3, 2], 0x1234567, 1 << 55))
+
+# Time a fixed number of Monte Carlo samples rather than a think time.
+STRATEGIES.append(("monte_carlo", partial(MonteCarloStrategy, think_time=60, max_samples=200)))
+
+# Register the benchmarks of each strategy.
+for strategy_name, strategy_class in STRATEGIES:
+    register("ai.{}.hunt.start".format(strategy_name), play_shots(strategy_class, 0, False))
+    register("ai.{}.hunt.late".format(strategy_name), play_shots(strategy_class, 40, False))
+    register("ai.{}.target".format(strategy_name), play_shots(strategy_class, 10, True))
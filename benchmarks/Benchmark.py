@@ -0,0 +1,50 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+
+class Benchmark:
+    """
+    Describes a single benchmark.
+    The setup function prepares everything the benchmark needs and returns the function to time.
+
+    Attributes:
+        name    The unique name of the benchmark, prefixed by its group.
+        setup   The function that prepares the benchmark and returns the timed function.
+        ops     The number of operations done by each call to the timed function.
+    """
+
+    def __init__(self, name, setup, ops=1):
+        """
+        Class constructor.
+        :param name: The unique name of the benchmark.
+        :param setup: The function that prepares the benchmark and returns the timed function.
+        :param ops: The number of operations done by each call to the timed function.
+        """
+        self.name = name
+        self.setup = setup
+        self.ops = ops
+
+
+# List of all the registered benchmarks, in registration order.
+BENCHMARKS = []
+
+
+def register(name, setup, ops=1):
+    """
+    Registers a new benchmark.
+    :param name: The unique name of the benchmark.
+    :param setup: The function that prepares the benchmark and returns the timed function.
+    :param ops: The number of operations done by each call to the timed function.
+    """
+    BENCHMARKS.append(Benchmark(name, setup, ops))
+
+
+def benchmark(name, ops=1):
+    """
+    Decorator registering the decorated setup function as a benchmark.
+    :param name: The unique name of the benchmark.
+    :param ops: The number of operations done by each call to the timed function.
+    """
+    def decorator(setup):
+        register(name, setup, ops)
+        return setup
+    return decorator
@@ -0,0 +1,54 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the benchmark decorator.
+from benchmarks.Benchmark import benchmark
+# Import the offscreen renderer helper.
+from benchmarks.RenderBenchmarks import use_renderer
+# Import the engine.
+from engine.Engine import Engine
+# Import the math tools.
+from engine.logic.Math import Vector2
+# Import the board and the ships.
+from battleships.objects import ShipBoard, AircraftCarrier, BattleShip, Cruiser, PatrolBoat, Submarine
+# Import the rules.
+from battleships.rules import cell_index
+
+
+# Every cell of the board, in both directions.
+PROBES = [(Vector2(x, y), direction) for y in range(10) for x in range(10) for direction in (1, 2)]
+
+
+def create_board():
+    """
+    Creates a ship board with the five ships placed vertically on every other column.
+    :return: The board.
+    """
+    use_renderer(False)
+    board = ShipBoard(Engine.scene)
+    board.transform.position = Vector2(256, 256)
+    for column, ship_class in enumerate((AircraftCarrier, BattleShip, Cruiser, PatrolBoat, Submarine)):
+        ship = ship_class(board)
+        ship.transform.set_world_position(board.get_top_left() + Vector2(column * 2 * board.CELL_SIZE, 0))
+        board.place_boat(ship)
+    return board
+
+
+@benchmark("board.position_is_valid", len(PROBES))
+def position_is_valid():
+    board = create_board()
+
+    def run():
+        for cell, direction in PROBES:
+            board.position_is_valid(cell, 3, direction)
+    return run
+
+
+@benchmark("board.get_ship_at", len(PROBES))
+def get_ship_at():
+    fleet = create_board().create_fleet()
+    cells = [cell_index(cell.x, cell.y) for cell, direction in PROBES]
+
+    def run():
+        for cell in cells:
+            fleet.get_ship_at(cell)
+    return run
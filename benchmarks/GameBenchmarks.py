@@ -0,0 +1,43 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the os, sys and subprocess modules.
+import os
+import sys
+import subprocess
+# Import the json parser.
+import json
+# Import the temporary file helper.
+from tempfile import TemporaryDirectory
+
+# Import the benchmark decorator.
+from benchmarks.Benchmark import benchmark
+
+
+# Root of the repository, where the game is started from.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@benchmark("game.simulated")
+def simulated_game():
+    """
+    Plays a full headless game between two AI players, in its own process.
+    The frame times are read from the profiler of the game.
+    """
+    metrics = {}
+
+    def run():
+        with TemporaryDirectory() as directory:
+            profile = os.path.join(directory, "profile.json")
+            subprocess.run(
+                [sys.executable, "main.py", "--config", "SimulationConfig", "--headless", "--profile", profile],
+                cwd=ROOT, stdout=subprocess.DEVNULL, check=True
+            )
+            with open(profile) as file:
+                frames = json.load(file)["frames"]
+
+        # Compute the statistics of the recorded frames.
+        durations = sorted(frame["duration"] for frame in frames)
+        metrics["frames"] = frames[-1]["frame"] + 1
+        metrics["frame_mean_ms"] = sum(durations) / len(durations) * 1000
+        metrics["frame_p95_ms"] = durations[int(len(durations) * 0.95)] * 1000
+    return run, metrics
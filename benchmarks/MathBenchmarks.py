@@ -0,0 +1,74 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the benchmark decorator.
+from benchmarks.Benchmark import benchmark
+# Import the math tools.
+from engine.logic.Math import Vector2, Mat3x3
+
+
+# Number of operations done by each call of the timed functions.
+OPS = 1000
+
+
+@benchmark("math.vector2.add", OPS)
+def vector_add():
+    a = Vector2(1.5, 2.5)
+    b = Vector2(3.0, -1.0)
+
+    def run():
+        for _ in range(OPS):
+            a + b
+    return run
+
+
+@benchmark("math.vector2.iadd", OPS)
+def vector_iadd():
+    a = Vector2(1.5, 2.5)
+    b = Vector2(3.0, -1.0)
+
+    def run():
+        for _ in range(OPS):
+            a.iadd(b)
+    return run
+
+
+@benchmark("math.vector2.scale", OPS)
+def vector_scale():
+    a = Vector2(1.5, 2.5)
+
+    def run():
+        for _ in range(OPS):
+            a * 2.0
+    return run
+
+
+@benchmark("math.mat3x3.create", OPS)
+def matrix_create():
+    position = Vector2(12, 34)
+
+    def run():
+        for _ in range(OPS):
+            Mat3x3.create_matrix(position, 30)
+    return run
+
+
+@benchmark("math.mat3x3.compose", OPS)
+def matrix_compose():
+    a = Mat3x3.create_matrix(Vector2(12, 34), 30)
+    b = Mat3x3.create_matrix(Vector2(-5, 8), 45)
+
+    def run():
+        for _ in range(OPS):
+            a * b
+    return run
+
+
+@benchmark("math.mat3x3.apply", OPS)
+def matrix_apply():
+    a = Mat3x3.create_matrix(Vector2(12, 34), 30)
+    v = Vector2(3, 4)
+
+    def run():
+        for _ in range(OPS):
+            a * v
+    return run
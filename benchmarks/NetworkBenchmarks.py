@@ -0,0 +1,38 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the benchmark registration function.
+from benchmarks.Benchmark import register
+# Import the network protocol.
+from battleships.network import CODECS, FrameDecoder, encode_frame
+
+
+# A turn of the game: a shot, and its result.
+MESSAGES = [
+    {"type": "shot", "attributes": {"x": 4, "y": 7}},
+    {"type": "hit", "attributes": {"x": 4, "y": 7, "hit": 1}}
+]
+
+
+def round_trip(codec_class):
+    """
+    Encodes, frames, decodes and parses the messages of a turn.
+    :param codec_class: The class of the codec.
+    """
+    def setup():
+        codec = codec_class()
+        decoder = FrameDecoder()
+
+        def run():
+            for message in MESSAGES:
+                for payload in decoder.feed(encode_frame(codec.encode(message))):
+                    codec.decode(payload)
+
+        # Report the size of a turn on the wire.
+        size = sum(len(encode_frame(codec.encode(message))) for message in MESSAGES)
+        return run, {"bytes_per_turn": size}
+    return setup
+
+
+# Register the benchmarks of each codec.
+for codec_name, codec_class in CODECS.items():
+    register("network.{}.round_trip".format(codec_name), round_trip(codec_class), len(MESSAGES))
@@ -0,0 +1,94 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the benchmark registration function.
+from benchmarks.Benchmark import register
+# Import the engine.
+from engine.Engine import Engine
+# Import the headless renderer.
+from engine.render.HeadlessRenderer import HeadlessRenderer
+# Import the rendered objects.
+from engine.logic.Primitives import RectGameObject, LineGameObject
+from engine.logic.Textured import TexturedGameObject
+from engine.logic.TextGameObject import TextGameObject
+# Import the math tools.
+from engine.logic.Math import Vector2
+
+
+# Size of the offscreen surface.
+SCREEN_SIZE = (512, 512)
+# Numbers of rendered objects.
+COUNTS = (100, 1000)
+
+# Offscreen renderers, by dirty rectangle mode. They are kept alive until the end, as deleting one quits pygame.
+__renderers = {}
+
+
+def use_renderer(dirty_rects):
+    """
+    Makes the engine render onto an offscreen surface.
+    :param dirty_rects: If True, only the damaged regions of the surface are repainted.
+    """
+    if dirty_rects not in __renderers:
+        __renderers[dirty_rects] = HeadlessRenderer(SCREEN_SIZE, True, dirty_rects)
+    Engine.renderer = __renderers[dirty_rects]
+    Engine.renderer.clear()
+
+
+def get_position(i, count):
+    """
+    Spreads the objects over the screen on a grid.
+    :param i: The index of the object.
+    :param count: The number of objects.
+    :return: The position of the object.
+    """
+    columns = int(count ** 0.5) + 1
+    return Vector2((i % columns) * SCREEN_SIZE[0] // columns, (i // columns) * SCREEN_SIZE[1] // columns)
+
+
+def create_rect(i, count):
+    rect = RectGameObject(Engine.scene, Vector2(16, 16), 1, (255, 0, 0), (0, 255, 0))
+    rect.transform.position = get_position(i, count)
+
+
+def create_line(i, count):
+    line = LineGameObject(Engine.scene, Vector2(0, 0), Vector2(16, 12), 2, (255, 255, 255))
+    line.transform.position = get_position(i, count)
+
+
+def create_texture(i, count):
+    texture = TexturedGameObject(Engine.scene, "Hit", Vector2(24, 24))
+    texture.transform.position = get_position(i, count)
+
+
+def create_text(i, count):
+    text = TextGameObject(Engine.scene, "Futura", 12, "Text {}".format(i % 10), (255, 255, 255))
+    text.transform.position = get_position(i, count)
+
+
+def render_frames(create, count, dirty_rects):
+    """
+    Renders frames of the given number of objects.
+    :param create: The function creating one object.
+    :param count: The number of objects to create.
+    :param dirty_rects: If True, only the damaged regions are repainted, so unchanged frames are cheap.
+    """
+    def setup():
+        use_renderer(dirty_rects)
+        for i in range(count):
+            create(i, count)
+
+        def run():
+            Engine.renderer.render()
+        return run
+    return setup
+
+
+# Register the benchmarks of each object type.
+for object_name, create_object in (
+        ("rects", create_rect), ("lines", create_line), ("textures", create_texture), ("texts", create_text)
+):
+    for object_count in COUNTS:
+        register("render.{}.{}".format(object_name, object_count), render_frames(create_object, object_count, False))
+        register(
+            "render.{}.{}.unchanged".format(object_name, object_count), render_frames(create_object, object_count, True)
+        )
@@ -0,0 +1,107 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the json parser.
+import json
+# Import the timer.
+from timeit import Timer
+
+# Import the benchmark list.
+from benchmarks.Benchmark import BENCHMARKS
+# Import the engine.
+from engine.Engine import Engine
+
+
+class BenchmarkRunner:
+    """
+    Runs the registered benchmarks and compares their results with a saved baseline.
+    Each benchmark is called enough times to last at least 0.2 seconds, and the best of several repeats is kept.
+
+    Attributes:
+        filters     Only the benchmarks whose name contains one of these strings are run. All are run if empty.
+        repeat      The number of times each benchmark is repeated.
+        results     The results of the last run, by benchmark name.
+    """
+
+    def __init__(self, filters=(), repeat=5):
+        """
+        Class constructor.
+        :param filters: Only the benchmarks whose name contains one of these strings are run.
+        :param repeat: The number of times each benchmark is repeated.
+        """
+        self.filters = list(filters)
+        self.repeat = repeat
+        self.results = {}
+
+    def run(self):
+        """
+        Runs all the selected benchmarks, printing their results as they complete.
+        :return: The results, by benchmark name.
+        """
+        for bench in BENCHMARKS:
+            if len(self.filters) > 0 and not any(name in bench.name for name in self.filters):
+                continue
+
+            # Prepare the benchmark.
+            prepared = bench.setup()
+            function, metrics = prepared if isinstance(prepared, tuple) else (prepared, {})
+
+            # Time the benchmark.
+            timer = Timer(function)
+            number = timer.autorange()[0]
+            best = min(timer.repeat(self.repeat, number)) / number
+
+            result = {"ops_per_sec": bench.ops / best, "ms_per_op": best / bench.ops * 1000}
+            result.update(metrics)
+            self.results[bench.name] = result
+            print("{:48} {:>14.1f} ops/s {:>12.4f} ms/op".format(bench.name, result["ops_per_sec"], result["ms_per_op"]))
+            for key, value in metrics.items():
+                print("    {:44} {:>14.4f}".format(key, value))
+
+            # Remove everything the benchmark created.
+            BenchmarkRunner.__clear_scene()
+        return self.results
+
+    def save(self, path):
+        """
+        Saves the results of the last run.
+        :param path: The file to write.
+        """
+        with open(path, "w") as file:
+            json.dump(self.results, file, indent=1, sort_keys=True)
+
+    def compare(self, path, threshold=10):
+        """
+        Compares the results of the last run with a saved baseline, printing the change of each benchmark.
+        :param path: The baseline file to read.
+        :param threshold: The slowdown, in percent, above which a benchmark is considered to have regressed.
+        :return: The names of the benchmarks that regressed.
+        """
+        with open(path) as file:
+            baseline = json.load(file)
+
+        regressions = []
+        print()
+        print("{:48} {:>14} {:>14} {:>8}".format("benchmark", "baseline", "current", "change"))
+        for name, result in self.results.items():
+            if name not in baseline:
+                print("{:48} {:>14} {:>14.1f}".format(name, "-", result["ops_per_sec"]))
+                continue
+
+            change = (result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1) * 100
+            regressed = change < -threshold
+            if regressed:
+                regressions.append(name)
+            print("{:48} {:>14.1f} {:>14.1f} {:>+7.1f}%{}".format(
+                name, baseline[name]["ops_per_sec"], result["ops_per_sec"], change, " REGRESSION" if regressed else ""
+            ))
+        return regressions
+
+    @staticmethod
+    def __clear_scene():
+        """
+        Detaches all the objects from the scene and clears the renderer.
+        """
+        for child in list(Engine.scene.transform.children):
+            child.parent = None
+        if Engine.renderer is not None:
+            Engine.renderer.clear()
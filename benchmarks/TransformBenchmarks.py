@@ -0,0 +1,78 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the benchmark registration function.
+from benchmarks.Benchmark import register
+# Import the transform class.
+from engine.logic.Transform import Transform
+# Import the math tools.
+from engine.logic.Math import Vector2
+
+
+# Depths of the transform chains.
+DEPTHS = (1, 4, 16, 64)
+
+
+def create_chain(depth):
+    """
+    Creates a chain of transforms, each one the child of the previous one.
+    :param depth: The number of transforms in the chain.
+    :return: The root and the leaf of the chain.
+    """
+    root = Transform(None, Vector2(10, 10), rotation=5)
+    leaf = root
+    for i in range(depth - 1):
+        leaf = Transform(leaf, Vector2(i, 1), Vector2(1, 0), rotation=3)
+    return root, leaf
+
+
+def world_matrix_cold(depth):
+    """
+    Computes the world matrix of the leaf after each change of the root.
+    :param depth: The depth of the chain.
+    """
+    def setup():
+        root, leaf = create_chain(depth)
+        position = Vector2(10, 10)
+
+        def run():
+            root.position = position
+            leaf.get_world_matrix()
+        return run
+    return setup
+
+
+def world_matrix_cached(depth):
+    """
+    Computes the world matrix of the leaf when nothing changed.
+    :param depth: The depth of the chain.
+    """
+    def setup():
+        root, leaf = create_chain(depth)
+
+        def run():
+            leaf.get_world_matrix()
+        return run
+    return setup
+
+
+def world_position_cold(depth):
+    """
+    Computes the world position of the leaf after each change of the root.
+    :param depth: The depth of the chain.
+    """
+    def setup():
+        root, leaf = create_chain(depth)
+        position = Vector2(10, 10)
+
+        def run():
+            root.position = position
+            leaf.get_world_position()
+        return run
+    return setup
+
+
+# Register the benchmarks of each depth.
+for chain_depth in DEPTHS:
+    register("transform.world_matrix.cold.depth{}".format(chain_depth), world_matrix_cold(chain_depth))
+    register("transform.world_matrix.cached.depth{}".format(chain_depth), world_matrix_cached(chain_depth))
+    register("transform.world_position.cold.depth{}".format(chain_depth), world_position_cold(chain_depth))
@@ -0,0 +1,14 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the benchmark tools.
+from benchmarks.Benchmark import Benchmark, BENCHMARKS, register, benchmark
+from benchmarks.Runner import BenchmarkRunner
+
+# Import all the benchmarks, to register them.
+import benchmarks.MathBenchmarks
+import benchmarks.TransformBenchmarks
+import benchmarks.RenderBenchmarks
+import benchmarks.BoardBenchmarks
+import benchmarks.AIBenchmarks
+import benchmarks.NetworkBenchmarks
+import benchmarks.GameBenchmarks
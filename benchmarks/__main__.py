@@ -0,0 +1,45 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the os and sys modules.
+import os
+import sys
+
+# The benchmarks load the game data relative to the root of the repository.
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import the benchmarks.
+from benchmarks import BenchmarkRunner
+
+
+# Read the arguments.
+filters = []
+save_path = None
+compare_path = None
+threshold = 10
+repeat = 5
+for arg_i in range(1, len(sys.argv)):
+    # Check for the --filter flag, which can be repeated.
+    if sys.argv[arg_i] == "--filter" and arg_i + 1 < len(sys.argv):
+        filters.append(sys.argv[arg_i + 1])
+    # Check for the --save flag.
+    if sys.argv[arg_i] == "--save" and arg_i + 1 < len(sys.argv):
+        save_path = sys.argv[arg_i + 1]
+    # Check for the --compare flag.
+    if sys.argv[arg_i] == "--compare" and arg_i + 1 < len(sys.argv):
+        compare_path = sys.argv[arg_i + 1]
+    # Check for the --threshold flag.
+    if sys.argv[arg_i] == "--threshold" and arg_i + 1 < len(sys.argv):
+        threshold = float(sys.argv[arg_i + 1])
+    # Check for the --quick flag.
+    if sys.argv[arg_i] == "--quick":
+        repeat = 1
+
+# Run the benchmarks.
+runner = BenchmarkRunner(filters, repeat)
+runner.run()
+if save_path is not None:
+    runner.save(save_path)
+if compare_path is not None:
+    # Fail if any benchmark regressed.
+    if len(runner.compare(compare_path, threshold)) > 0:
+        sys.exit(1)
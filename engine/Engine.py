@@ -2,10 +2,12 @@
 
 # Import the sys module.
 import sys
+# Import the ceil function.
+from math import ceil
 # Import the ini parser.
 from configparser import ConfigParser
 # Import pygame.
-from pygame import time, mixer
+from pygame import time, mixer, image
 
 # Import the GameManager base class.
 from engine.logic.GameManager import GameManager
@@ -14,11 +16,22 @@ from engine.logic.LevelManager import LevelManager
 
 # Import the GameObject base class.
 from engine.logic.GameObject import GameObject
+# Import the transform class.
+from engine.logic.Transform import Transform
+# Import the batched transform solver.
+from engine.logic.TransformBatch import TransformBatch
 
 # Import the renderer class.
 from engine.render.Renderer import Renderer
+# Import the headless renderer class.
+from engine.render.HeadlessRenderer import HeadlessRenderer
 # Import the input handler class.
 from engine.input.InputHandler import InputHandler
+# Import the loop scheduler class.
+from engine.LoopScheduler import LoopScheduler
+# Import the profiler classes.
+from engine.Profiler import Profiler
+from engine.render.ProfilerOverlay import ProfilerOverlay
 
 
 class Engine:
@@ -31,6 +44,8 @@ class Engine:
         game_manager   The GameManager instance used for this game.
         input_handler  The input handler used by this engine.
         scene          The root object of the current scene.
+        transform_batch The batched transform solver, if enabled in the configuration.
+        profiler       The profiler of the engine loop, if enabled in the configuration.
     """
 
     # Renderer instance.
@@ -41,7 +56,11 @@ class Engine:
     input_handler = InputHandler()
     # Scene instance.
     scene = GameObject()
-    # Time since the last frame.
+    # Batched transform solver instance.
+    transform_batch = None
+    # Profiler instance.
+    profiler = None
+    # Duration of the current logic tick.
     frame_time = 0
     # Name of the level currently loaded.
     current_level = None
@@ -50,13 +69,27 @@ class Engine:
     __config = ConfigParser()
     # Looping status.
     __is_looping = False
-    # Last frame's timestamp.
-    __frame_timestamp = time.get_ticks()
+    # Loop scheduler instance.
+    __scheduler = None
+    # Flag set if the loop should sleep until the next event when idle.
+    __idle_wait = False
     # Next level to load.
     __loaded_level = None
     # All loaded sounds.
     __sounds = {}
+    # All loaded textures.
+    __textures = {}
     __silenced = False
+    # Flag set if the engine runs without a display or an audio device.
+    __headless = False
+    # Flag set if the headless engine still renders the scene onto an offscreen surface.
+    __offscreen = False
+    # Simulated time of the headless engine, in seconds.
+    __simulated_time = 0
+    # On-screen overlay of the profiler.
+    __profiler_overlay = None
+    # File the profiler is dumped to on exit.
+    __profiler_dump = None
 
     @classmethod
     def initialize(cls):
@@ -78,13 +111,62 @@ class Engine:
             if sys.argv[arg_i] == "--silenced":
                 cls.__silenced = True
 
+            # Check for the --headless and --offscreen flags.
+            if sys.argv[arg_i] == "--headless":
+                cls.__headless = True
+            if sys.argv[arg_i] == "--offscreen":
+                cls.__headless = True
+                cls.__offscreen = True
+
+            # Check for the --profile flag.
+            if sys.argv[arg_i] == "--profile":
+                # If there is an argument behind, dump the profiler to this file.
+                if arg_i + 1 < len(sys.argv) and not sys.argv[arg_i + 1].startswith("-"):
+                    cls.__profiler_dump = sys.argv[arg_i + 1]
+                else:
+                    cls.__profiler_dump = ""
+
+        # There is no audio device in headless mode.
+        if cls.__headless:
+            cls.__silenced = True
+
         # Try to load the configuration file(s).
         cls.__config.read(config_files)
 
         # Read the renderer info.
         render_info = cls.__config["Renderer"]
         # Create the renderer class.
-        cls.renderer = Renderer((render_info.getint("window_width"), render_info.getint("window_height")))
+        if cls.__headless:
+            cls.renderer = HeadlessRenderer(
+                (render_info.getint("window_width"), render_info.getint("window_height")),
+                cls.__offscreen,
+                render_info.getboolean("dirty_rects", fallback=False)
+            )
+        else:
+            cls.renderer = Renderer(
+                (render_info.getint("window_width"), render_info.getint("window_height")),
+                render_info.getboolean("dirty_rects", fallback=False)
+            )
+        # Create the batched transform solver, if requested.
+        if render_info.getboolean("batch_transforms", fallback=False):
+            cls.transform_batch = TransformBatch()
+            Transform.batch = cls.transform_batch
+
+        # Create the loop scheduler.
+        cls.__scheduler = LoopScheduler(
+            cls.__config.getint("Engine", "tick_rate", fallback=0),
+            render_info.getint("target_fps", fallback=0),
+            cls.__config.getint("Engine", "max_ticks_per_frame", fallback=5)
+        )
+        cls.__idle_wait = cls.__config.getboolean("Engine", "idle_wait", fallback=False)
+
+        # Create the profiler, if requested.
+        if cls.__profiler_dump is not None or cls.__config.getboolean("Profiler", "enabled", fallback=False):
+            cls.profiler = Profiler(cls.__config.getint("Profiler", "frames", fallback=600))
+            cls.renderer.profiler = cls.profiler
+            cls.__profiler_overlay = ProfilerOverlay(cls.profiler, cls.renderer)
+            if cls.__profiler_dump is None or cls.__profiler_dump == "":
+                cls.__profiler_dump = cls.__config.get("Profiler", "dump", fallback="")
 
         # Create the isLooping attribute.
         cls.__is_looping = True
@@ -114,6 +196,13 @@ class Engine:
         # Set the is looping flag to false.
         cls.__is_looping = False
 
+    @classmethod
+    def is_headless(cls):
+        """
+        :return: True if the engine runs without a display or an audio device.
+        """
+        return cls.__headless
+
     @classmethod
     def load_class(cls, class_name):
         """
@@ -167,6 +256,36 @@ class Engine:
         else:
             print("The sound {} was not loaded.".format(sound_path))
 
+    @classmethod
+    def load_texture(cls, texture_path):
+        """
+        Loads the specified texture.
+        If it was already loaded, returns the previous one instead of reading the file again.
+        The returned surface is shared and must not be modified.
+        :param texture_path: The name of the texture to load.
+        :return: The loaded texture.
+        """
+        # If it was already loaded.
+        if texture_path in cls.__textures:
+            # Return the cached version.
+            return cls.__textures[texture_path]
+
+        # Load the file.
+        texture = image.load("Data/Textures/{}.bmp".format(texture_path)).convert()
+        texture.set_colorkey(texture.get_at((1, 1)))
+        # Store the file in cache.
+        cls.__textures[texture_path] = texture
+        return texture
+
+    @classmethod
+    def preload_textures(cls, texture_paths):
+        """
+        Loads all the specified textures ahead of time.
+        :param texture_paths: The names of the textures to load.
+        """
+        for texture_path in texture_paths:
+            cls.load_texture(texture_path)
+
     @classmethod
     def __setup(cls):
         """
@@ -192,28 +311,94 @@ class Engine:
 
     @classmethod
     def __loop(cls):
-        # Compute the new frame time.
-        cls.frame_time = (time.get_ticks() - cls.__frame_timestamp) / 1000
-        cls.__frame_timestamp = time.get_ticks()
-        # Call the object's tick method.
-        cls.scene._tick_internal(cls.frame_time)
-        # Call the manager's tick method.
-        cls.current_level.tick(cls.frame_time)
-
-        # Render the renderables.
-        cls.renderer.render()
-        # Handle the events.
-        cls.input_handler.handle_events()
+        # Get the time of this frame.
+        now = cls.__get_time()
+        if cls.profiler is not None:
+            cls.profiler.begin_frame(now)
+
+        ticks, cls.frame_time = cls.__scheduler.advance(now)
+        for _ in range(ticks):
+            # Call the object's tick method.
+            cls.__run_phase("tick", cls.scene._tick_internal, cls.frame_time)
+            # Call the manager's tick method.
+            cls.__run_phase("level", cls.current_level.tick, cls.frame_time)
+
+        # If a frame is due.
+        if cls.__scheduler.should_render(now):
+            # Solve all the transforms at once, if requested.
+            if cls.transform_batch is not None:
+                cls.__run_phase("transforms", cls.transform_batch.solve, cls.scene.transform)
+            # Render the renderables.
+            cls.__run_phase("render", cls.renderer.render)
+
+        # Handle the events, sleeping until the next tick or frame if there is nothing to do.
+        wait = ceil(cls.__scheduler.get_wait_time(cls.__get_time()) * 1000)
+        if cls.__headless:
+            # The simulated time does not pass while sleeping.
+            cls.__run_phase("input", cls.input_handler.handle_events)
+        elif cls.__idle_wait and cls.profiler is None:
+            cls.input_handler.handle_events(wait)
+        else:
+            # When profiling, the events are handled before sleeping to keep the wait out of the input phase.
+            cls.__run_phase("input", cls.input_handler.handle_events)
+            if wait > 0:
+                cls.__run_phase("wait", time.wait, wait)
 
         # If there is a new level to load.
         if cls.__loaded_level is not None:
             # Load the new level.
-            cls.__load_level()
+            cls.__run_phase("load", cls.__load_level)
+
+        # Move the simulated time to the next tick.
+        if cls.__headless:
+            cls.__simulated_time += cls.__scheduler.tick_time if cls.__scheduler.tick_time > 0 else 1 / 60
+
+        if cls.profiler is not None:
+            cls.profiler.end_frame(cls.__count_objects(cls.scene.transform), cls.renderer.get_renderable_count())
+
+    @classmethod
+    def __run_phase(cls, phase, function, *args):
+        """
+        Runs one phase of the loop, timing it if the profiler is enabled.
+        :param phase: The name of the phase.
+        :param function: The function to call.
+        :param args: The arguments of the function.
+        """
+        if cls.profiler is None:
+            function(*args)
+        else:
+            cls.profiler.measure(phase, function, *args)
+
+    @classmethod
+    def __count_objects(cls, transform):
+        """
+        Counts the game objects below the given transform.
+        :param transform: The transform to explore.
+        :return: The number of descendants of the transform.
+        """
+        return sum(1 + cls.__count_objects(child) for child in transform.children)
+
+    @classmethod
+    def __get_time(cls):
+        """
+        Returns the current time of the engine.
+        In headless mode, the time is simulated and advances by one tick per loop, so games run as fast as possible.
+        :return: The current time, in seconds.
+        """
+        if cls.__headless:
+            return cls.__simulated_time
+        return time.get_ticks() / 1000
 
     @classmethod
     def __close(cls):
         # Unload the level.
         cls.__unload_level()
+        # Tell the game manager that the game is over.
+        cls.game_manager.end()
+
+        # Dump the profiler, if requested.
+        if cls.profiler is not None and cls.__profiler_dump != "":
+            cls.profiler.dump(cls.__profiler_dump)
 
     @classmethod
     def __unload_level(cls):
@@ -227,6 +412,8 @@ class Engine:
         cls.scene._end_internal()
         # Remove all rendered references.
         cls.renderer.clear()
+        if cls.transform_batch is not None:
+            cls.transform_batch.clear()
 
     @classmethod
     def __load_level(cls):
@@ -258,6 +445,18 @@ class Engine:
                 n_height = level_config["Display"].getint("window_height")
         cls.renderer.resize_window(n_width, n_height)
 
+        # Preload the textures used by the level.
+        if "Preload" in level_config.keys() and "textures" in level_config["Preload"].keys():
+            cls.preload_textures(
+                name.strip() for name in level_config["Preload"]["textures"].split(",") if name.strip() != ""
+            )
+
         # Setup the manager.
         cls.__loaded_level = None
         cls.current_level.begin()
+
+        # Put the profiler overlay back, the level may have cleared the renderer and the listeners.
+        if cls.__profiler_overlay is not None:
+            cls.__profiler_overlay.attach()
+            cls.input_handler.remove_listener(cls.__profiler_overlay)
+            cls.input_handler.add_listener(cls.__profiler_overlay)
@@ -0,0 +1,90 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+
+class LoopScheduler:
+    """
+    Decides when the engine loop should tick the logic and render the scene.
+    The logic ticks at a fixed rate, using an accumulator of the elapsed time.
+    The rendering is capped at the target frame rate, independently of the logic.
+    A rate of 0 disables the corresponding limit: the logic then ticks once per loop with the elapsed time,
+    and the scene is rendered on every loop.
+
+    Attributes:
+        tick_time   The duration of a logic tick, in seconds. 0 if the tick duration is variable.
+        render_time The minimal duration between two renders, in seconds. 0 if the rendering is not capped.
+        max_ticks   The maximal number of logic ticks run in a single loop.
+    """
+
+    def __init__(self, tick_rate=0, target_fps=0, max_ticks=5):
+        """
+        Class constructor.
+        :param tick_rate: The number of logic ticks per second.
+        :param target_fps: The maximal number of rendered frames per second.
+        :param max_ticks: The maximal number of logic ticks run in a single loop.
+        """
+        self.tick_time = 1 / tick_rate if tick_rate > 0 else 0
+        self.render_time = 1 / target_fps if target_fps > 0 else 0
+        self.max_ticks = max_ticks
+
+        # Timestamp of the last loop.
+        self.__last_time = None
+        # Elapsed time that was not consumed by the logic ticks yet.
+        self.__accumulator = 0
+        # Timestamp of the next render.
+        self.__next_render = 0
+
+    def advance(self, now):
+        """
+        Moves the scheduler to the given time.
+        :param now: The current time, in seconds.
+        :return: The number of logic ticks to run, and the duration of each tick.
+        """
+        elapsed = now - self.__last_time if self.__last_time is not None else 0
+        self.__last_time = now
+
+        # If the tick duration is variable, tick once with the elapsed time.
+        if self.tick_time == 0:
+            return 1, elapsed
+
+        # Consume the accumulated time in fixed steps.
+        self.__accumulator += elapsed
+        ticks = int(self.__accumulator // self.tick_time)
+        if ticks > self.max_ticks:
+            # Drop the time we cannot catch up with.
+            ticks = self.max_ticks
+            self.__accumulator = 0
+        else:
+            self.__accumulator -= ticks * self.tick_time
+        return ticks, self.tick_time
+
+    def should_render(self, now):
+        """
+        Checks if the scene should be rendered at the given time.
+        :param now: The current time, in seconds.
+        :return: True if the scene should be rendered.
+        """
+        if self.render_time == 0:
+            return True
+        if now < self.__next_render:
+            return False
+
+        # Schedule the next render, without trying to catch up with missed ones.
+        self.__next_render = max(self.__next_render + self.render_time, now)
+        return True
+
+    def get_wait_time(self, now):
+        """
+        Returns how long the loop can wait before it has something to do.
+        :param now: The current time, in seconds.
+        :return: The time to wait, in seconds.
+        """
+        # If the logic ticks on every loop, there is no waiting.
+        if self.tick_time == 0 and self.render_time == 0:
+            return 0
+
+        deadlines = []
+        if self.tick_time > 0 and self.__last_time is not None:
+            deadlines.append(self.__last_time + self.tick_time - self.__accumulator)
+        if self.render_time > 0:
+            deadlines.append(self.__next_render)
+        return max(0, min(deadlines) - now) if len(deadlines) > 0 else 0
@@ -0,0 +1,141 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the sys module.
+import sys
+# Import the csv and json writers.
+import csv
+import json
+# Import the ring buffer.
+from collections import deque
+# Import the high resolution timer.
+from time import perf_counter
+
+
+class Profiler:
+    """
+    Per-frame profiler of the engine loop.
+    Records the time spent in each phase of the loop, the render cost of each renderable class,
+    the number of objects and the number of memory blocks allocated during each frame.
+    Only the last recorded frames are kept, in a ring buffer.
+
+    Attributes:
+        frames  The recorded frames, oldest first. Each frame is a dictionary.
+    """
+
+    def __init__(self, capacity=600):
+        """
+        Class constructor.
+        :param capacity: The number of frames kept in the ring buffer.
+        """
+        self.frames = deque(maxlen=capacity)
+
+        # Number of the next frame.
+        self.__frame_number = 0
+        # Frame currently being recorded.
+        self.__frame = None
+        # Start time of the current frame.
+        self.__start = 0
+        # Number of memory blocks allocated at the start of the current frame.
+        self.__blocks = 0
+
+    def begin_frame(self, now):
+        """
+        Starts recording a new frame.
+        :param now: The engine time of the frame, in seconds.
+        """
+        self.__frame = {"frame": self.__frame_number, "time": now, "phases": {}, "renders": {}}
+        self.__frame_number += 1
+        self.__blocks = sys.getallocatedblocks()
+        self.__start = perf_counter()
+
+    def measure(self, phase, function, *args):
+        """
+        Calls the function and adds its duration to the given phase of the current frame.
+        :param phase: The name of the phase.
+        :param function: The function to call.
+        :param args: The arguments of the function.
+        :return: The result of the function.
+        """
+        start = perf_counter()
+        result = function(*args)
+        phases = self.__frame["phases"]
+        phases[phase] = phases.get(phase, 0) + perf_counter() - start
+        return result
+
+    def record_render(self, class_name, duration):
+        """
+        Adds the render duration of one renderable to the current frame.
+        :param class_name: The class of the renderable.
+        :param duration: The time spent rendering it, in seconds.
+        """
+        if self.__frame is None:
+            return
+        renders = self.__frame["renders"]
+        renders[class_name] = renders.get(class_name, 0) + duration
+
+    def end_frame(self, objects, renderables):
+        """
+        Finishes recording the current frame and stores it in the ring buffer.
+        :param objects: The number of game objects in the scene.
+        :param renderables: The number of renderables registered in the renderer.
+        """
+        frame = self.__frame
+        frame["duration"] = perf_counter() - self.__start
+        frame["allocated_blocks"] = sys.getallocatedblocks() - self.__blocks
+        frame["objects"] = objects
+        frame["renderables"] = renderables
+        self.frames.append(frame)
+        self.__frame = None
+
+    def get_summary(self, count=60):
+        """
+        Averages the last recorded frames.
+        :param count: The number of frames to average.
+        :return: A dictionary with the average duration, phases, render costs, counts and allocations.
+        """
+        frames = list(self.frames)[-count:]
+        summary = {"duration": 0, "phases": {}, "renders": {}, "objects": 0, "renderables": 0, "allocated_blocks": 0}
+        if len(frames) == 0:
+            return summary
+
+        for frame in frames:
+            summary["duration"] += frame["duration"] / len(frames)
+            summary["allocated_blocks"] += frame["allocated_blocks"] / len(frames)
+            for key in ("phases", "renders"):
+                for name, duration in frame[key].items():
+                    summary[key][name] = summary[key].get(name, 0) + duration / len(frames)
+        summary["objects"] = frames[-1]["objects"]
+        summary["renderables"] = frames[-1]["renderables"]
+        return summary
+
+    def dump(self, path):
+        """
+        Writes the recorded frames to a file.
+        The format depends on the extension: .csv writes one row per frame, anything else writes JSON.
+        :param path: The path of the file to write.
+        """
+        if path.lower().endswith(".csv"):
+            self.__dump_csv(path)
+        else:
+            with open(path, "w") as file:
+                json.dump({"frames": list(self.frames), "summary": self.get_summary(len(self.frames))}, file, indent=1)
+
+    def __dump_csv(self, path):
+        """
+        Writes the recorded frames to a CSV file, flattening the phases and render costs into columns.
+        :param path: The path of the file to write.
+        """
+        # List the columns used by any of the frames.
+        phases = sorted({name for frame in self.frames for name in frame["phases"]})
+        renders = sorted({name for frame in self.frames for name in frame["renders"]})
+        header = ["frame", "time", "duration", "objects", "renderables", "allocated_blocks"]
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(header + ["phase:" + name for name in phases] + ["render:" + name for name in renders])
+            for frame in self.frames:
+                writer.writerow(
+                    [frame[column] for column in header] +
+                    [frame["phases"].get(name, 0) for name in phases] +
+                    [frame["renders"].get(name, 0) for name in renders]
+                )
@@ -14,8 +14,11 @@ from engine.logic.GameObject import GameObject
 from engine.logic.RenderedGameObject import RenderedGameObject
 from engine.logic.Textured import TexturedGameObject
 from engine.logic.TextGameObject import TextGameObject
+from engine.logic.StaticLayer import StaticLayerGameObject
 # Import the primitives classes.
 from engine.logic.Primitives import RectGameObject, LineGameObject
+# Import the render layers.
+from engine.render.Renderer import LAYER_BACKGROUND, LAYER_BOARD, LAYER_SHIPS, LAYER_MARKERS, LAYER_UI, LAYER_DEBUG
 # Import all math tools.
 import engine.logic.Math as math
 
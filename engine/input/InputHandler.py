@@ -41,13 +41,21 @@ class InputHandler:
         """
         self.__listeners.clear()
 
-    def handle_events(self):
+    def handle_events(self, timeout=0):
         """
         Polls for all the events in the pygame queue.
         Passes them on to the listener instances.
+        :param timeout: If the queue is empty, how long to wait for an event, in milliseconds.
         """
+        events = pygame.event.get()
+        # If there is no event, sleep until one arrives or the timeout is over.
+        if len(events) == 0 and timeout > 0:
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.locals.NOEVENT:
+                events = [event] + pygame.event.get()
+
         # Loop until the queue is empty.
-        for event in pygame.event.get():
+        for event in events:
             # Pass the event onto all the listeners.
             for listener in self.__listeners:
                 listener.handle_input(event)
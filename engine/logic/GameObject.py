@@ -17,6 +17,7 @@ class GameObject:
     Attributes:
         transform     Matrix representing the state of this object.
         tick_mode     The ticking mode of this object. Defaults to PARENT_FIRST.
+        visible       Flag set if the gameobject is visible. Hides all the children when cleared.
     """
 
     def __init__(self, parent=None):
@@ -29,16 +30,60 @@ class GameObject:
         # Flag set if the object is persistent.
         self.persistent = False
         # Flag set if the gameobject is visible.
-        self.visible = True
+        self.__visible = True
+        # Flag set if the gameobject and all of its parents are visible.
+        self.__hierarchy_visible = parent.is_visible() if isinstance(parent, GameObject) else True
+
+    @property
+    def visible(self):
+        return self.__visible
+
+    @visible.setter
+    def visible(self, visible):
+        self.__visible = visible
+        self._update_visibility_internal()
 
     def is_visible(self):
         """
-        Enables rendering of this item.
+        Returns True if this object and all of its parents are visible.
+        """
+        # Return the cached rendering state.
+        return self.__hierarchy_visible
+
+    def _update_visibility_internal(self):
+        """
+        Recomputes the cached visibility of this object.
+        Propagates the change to all the children, if any.
         """
-        # Return the rendering state.
-        return self.visible and (
-            self.transform.parent.gameobject.is_visible() if self.transform.parent is not None else True
+        parent = self.transform.parent
+        visible = self.__visible and (
+            parent.gameobject.is_visible() if parent is not None and parent.gameobject is not None else True
         )
+        # If nothing changed, the children did not change either.
+        if visible == self.__hierarchy_visible:
+            return
+        self.__hierarchy_visible = visible
+        self._visibility_changed_internal(visible)
+
+        # Loop through the children.
+        for child in self.transform.children:
+            child.gameobject._update_visibility_internal()
+
+    def _transform_changed_internal(self):
+        """
+        Called when the transform of this object or of one of its parents changed.
+        Propagates the change to all the children, if any.
+        """
+        # Loop through the children.
+        for child in self.transform.children:
+            child.gameobject._transform_changed_internal()
+
+    def _visibility_changed_internal(self, visible):
+        """
+        Called when the cached visibility of this object changed.
+        :param visible: The new visibility of the object.
+        """
+        pass
 
     def begin(self):
         """
@@ -5,10 +5,25 @@ from math import cos, sin, sqrt, atan2, degrees, radians
 
 
 class Vector2:
+    """
+    Simple 2D vector.
+    Uses slots to avoid allocating a dictionary for each instance.
+
+    Attributes:
+        x       The horizontal component of the vector.
+        y       The vertical component of the vector.
+    """
+
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
 
+    def __copy__(self):
+        # Copies are always mutable, even when copying a frozen vector.
+        return Vector2(self.x, self.y)
+
     def __add__(self, other):
         if isinstance(other, Vector2):
             return Vector2(self.x + other.x, self.y + other.y)
@@ -47,14 +62,59 @@ class Vector2:
         else:
             ArithmeticError("Cannot divide a vector by something other that a vector.")
 
+    def set(self, x, y):
+        """
+        Overwrites both components of the vector in place.
+        :param x: The new horizontal component.
+        :param y: The new vertical component.
+        :return: This vector.
+        """
+        self.x = x
+        self.y = y
+        return self
+
+    def iadd(self, other):
+        """
+        Adds the other vector to this one, without allocating a new vector.
+        :param other: The vector to add.
+        :return: This vector.
+        """
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def isub(self, other):
+        """
+        Subtracts the other vector from this one, without allocating a new vector.
+        :param other: The vector to subtract.
+        :return: This vector.
+        """
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def imul(self, other):
+        """
+        Multiplies this vector by a vector or a number, without allocating a new vector.
+        :param other: The vector or number to multiply by.
+        :return: This vector.
+        """
+        if isinstance(other, Vector2):
+            self.x *= other.x
+            self.y *= other.y
+        else:
+            self.x *= other
+            self.y *= other
+        return self
+
     def magnitude(self):
         return sqrt(self.x * self.x + self.y * self.y)
 
     def tuple(self, integers=False):
         if integers:
-            return tuple([round(self.x), round(self.y)])
+            return round(self.x), round(self.y)
         else:
-            return tuple([self.x, self.y])
+            return self.x, self.y
 
     def positive(self):
         return Vector2(abs(self.x), abs(self.y))
@@ -64,22 +124,60 @@ class Vector2:
 
     @staticmethod
     def in_rect(self, origin, size):
-        extent = origin + size
-        return (self.x > origin.x) and (self.x < extent.x) and (self.y > origin.y) and (self.y < extent.y)
+        return (origin.x < self.x < origin.x + size.x) and (origin.y < self.y < origin.y + size.y)
+
+
+class FrozenVector2(Vector2):
+    """
+    Immutable 2D vector.
+    Used for the shared constants, so that they cannot be modified by accident.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, x, y):
+        # Bypass the frozen __setattr__.
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Cannot modify a frozen vector, copy it first.")
 
+    def __delattr__(self, key):
+        raise AttributeError("Cannot modify a frozen vector, copy it first.")
 
-UNIT_VECTOR = Vector2(1, 1)
-RIGHT_VECTOR = Vector2(1, 0)
-TOP_VECTOR = Vector2(0, 1)
-ZERO_VECTOR = Vector2(0, 0)
+    def set(self, x, y):
+        raise AttributeError("Cannot modify a frozen vector, copy it first.")
+
+    def iadd(self, other):
+        raise AttributeError("Cannot modify a frozen vector, copy it first.")
+
+    def isub(self, other):
+        raise AttributeError("Cannot modify a frozen vector, copy it first.")
+
+    def imul(self, other):
+        raise AttributeError("Cannot modify a frozen vector, copy it first.")
+
+
+UNIT_VECTOR = FrozenVector2(1, 1)
+RIGHT_VECTOR = FrozenVector2(1, 0)
+TOP_VECTOR = FrozenVector2(0, 1)
+ZERO_VECTOR = FrozenVector2(0, 0)
 
 
 class Mat3x3:
     """
-    Simple 3x3 matrix.
+    Simple 3x3 affine matrix.
     Used for 2D vector transformations.
+    Only the two first rows are stored, the last one is always [0, 0, 1].
+
+    Attributes:
+        m00, m01, m02   The components of the first row.
+        m10, m11, m12   The components of the second row.
     """
 
+    __slots__ = ("m00", "m01", "m02", "m10", "m11", "m12")
+
     def __init__(self, components=None):
         """
         Creates a new matrix with the given components.
@@ -88,7 +186,7 @@ class Mat3x3:
         # If the components are unset.
         if components is None:
             # Load the default 0 matrix.
-            components = [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+            components = [[0, 0, 0], [0, 0, 0], [0, 0, 1]]
 
         if not isinstance(components, list):
             raise ArithmeticError("Mat3 constructor MUST use a list.")
@@ -100,38 +198,53 @@ class Mat3x3:
             if len(components[i]) != 3:
                 raise ArithmeticError("Cannot create a Mat3x3 with " + str(len(components[i])) + " columns")
 
-        self.components = components
+        if components[2][0] != 0 or components[2][1] != 0 or components[2][2] != 1:
+            raise ArithmeticError("Mat3x3 can only represent affine matrices, the last row must be [0, 0, 1]")
+
+        self.m00, self.m01, self.m02 = components[0]
+        self.m10, self.m11, self.m12 = components[1]
+
+    @staticmethod
+    def affine(m00, m01, m02, m10, m11, m12):
+        """
+        Creates a new matrix from its six affine components, without any validation.
+        :returns: The created matrix.
+        """
+        out = Mat3x3.__new__(Mat3x3)
+        out.m00 = m00
+        out.m01 = m01
+        out.m02 = m02
+        out.m10 = m10
+        out.m11 = m11
+        out.m12 = m12
+        return out
 
     @staticmethod
     def create_matrix(position, rotation, scale=UNIT_VECTOR):
         """
         Generates the matrix from the specified components.
+        Equivalent to the product of the translation, rotation and scale matrices.
         :param position: The position component to apply to the matrix.
         :param rotation: The rotation component to apply to the matrix.
         :param scale: The scale of the matrix.
         :returns: The generated matrix.
         """
+        # Most objects are not rotated, skip the trigonometry.
+        if rotation == 0:
+            return Mat3x3.affine(scale.x, 0, position.x, 0, scale.y, position.y)
+
         # Convert the rotation in radians.
         rotation = radians(rotation)
-        # Create the three base matrices.
-        t_mat = Mat3x3(
-            [[1, 0, position.x],
-             [0, 1, position.y],
-             [0, 0, 1]]
-        )
-        r_mat = Mat3x3(
-            [[cos(rotation), -sin(rotation), 0],
-             [sin(rotation), cos(rotation), 0],
-             [0, 0, 1]]
-        )
-        s_mat = Mat3x3(
-            [[scale.x, 0, 0],
-             [0, scale.y, 0],
-             [0, 0, 1]]
-        )
+        c = cos(rotation)
+        s = sin(rotation)
+        return Mat3x3.affine(c * scale.x, -s * scale.y, position.x, s * scale.x, c * scale.y, position.y)
 
-        # Compute the final matrix.
-        return t_mat * r_mat * s_mat
+    @property
+    def components(self):
+        """
+        Returns the components of the matrix as a list of rows.
+        """
+        return [[self.m00, self.m01, self.m02], [self.m10, self.m11, self.m12], [0, 0, 1]]
 
     def __add__(self, other):
         """
@@ -140,76 +253,88 @@ class Mat3x3:
         :return: The added matrix.
         """
         if isinstance(other, Mat3x3):
-            return Mat3x3([
-                [
-                 self.components[0][0] + other.components[0][0],
-                 self.components[0][1] + other.components[0][1],
-                 self.components[0][2] + other.components[0][2]
-                 ],
-                [
-                 self.components[1][0] + other.components[1][0],
-                 self.components[1][1] + other.components[1][1],
-                 self.components[1][2] + other.components[1][2]
-                ],
-                [
-                 self.components[2][0] + other.components[2][0],
-                 self.components[2][1] + other.components[2][1],
-                 self.components[2][2] + other.components[2][2]
-                ]
-            ])
+            return Mat3x3.affine(
+                self.m00 + other.m00, self.m01 + other.m01, self.m02 + other.m02,
+                self.m10 + other.m10, self.m11 + other.m11, self.m12 + other.m12
+            )
         else:
             ArithmeticError("Cannot add a matrix to anything other than a matrix")
 
     def __mul__(self, other):
         """
-        Adds two matrices together, or a matrix and a vector.
+        Multiplies two matrices together, or a matrix and a vector.
         :param other: The other matrix, or vector, to multiply.
         :return: The multiplied object.
         """
-        out = Mat3x3()
         # If the other object is a matrix.
         if isinstance(other, Mat3x3):
-            for i in range(3):
-                for j in range(3):
-                    out.components[i][j] = \
-                        self.i(0, i) * other.i(j, 0) + \
-                        self.i(1, i) * other.i(j, 1) + \
-                        self.i(2, i) * other.i(j, 2)
-            return out
+            return self.compose(other)
 
         # If the other object is a vector2.
         elif isinstance(other, Vector2):
-            return Vector2(
-                (self.i(0, 0) * other.x) +
-                (self.i(1, 0) * other.y) +
-                (self.i(2, 0)),
-                (self.i(0, 1) * other.x) +
-                (self.i(1, 1) * other.y) +
-                (self.i(2, 1))
-            )
+            return self.apply(other)
         else:
             raise ArithmeticError("Cannot multiply a matrix to anything other than a matrix")
 
+    def compose(self, other):
+        """
+        Computes the product of this matrix by the other one.
+        :param other: The matrix to apply before this one.
+        :return: The composed matrix.
+        """
+        a00, a01, a10, a11 = self.m00, self.m01, self.m10, self.m11
+        b00, b01, b02, b10, b11, b12 = other.m00, other.m01, other.m02, other.m10, other.m11, other.m12
+        return Mat3x3.affine(
+            a00 * b00 + a01 * b10, a00 * b01 + a01 * b11, a00 * b02 + a01 * b12 + self.m02,
+            a10 * b00 + a11 * b10, a10 * b01 + a11 * b11, a10 * b02 + a11 * b12 + self.m12
+        )
+
+    def apply(self, vector, out=None):
+        """
+        Transforms the given point by this matrix.
+        :param vector: The point to transform.
+        :param out: If set, the vector to store the result in, instead of allocating a new one.
+        :return: The transformed point.
+        """
+        x = self.m00 * vector.x + self.m01 * vector.y + self.m02
+        y = self.m10 * vector.x + self.m11 * vector.y + self.m12
+        if out is None:
+            return Vector2(x, y)
+        return out.set(x, y)
+
+    def apply_linear(self, vector, out=None):
+        """
+        Transforms the given direction by this matrix, ignoring the translation.
+        :param vector: The direction to transform.
+        :param out: If set, the vector to store the result in, instead of allocating a new one.
+        :return: The transformed direction.
+        """
+        x = self.m00 * vector.x + self.m01 * vector.y
+        y = self.m10 * vector.x + self.m11 * vector.y
+        if out is None:
+            return Vector2(x, y)
+        return out.set(x, y)
+
     def i(self, x, y):
         return self.components[y][x]
 
     def get_rotation(self):
-        return degrees(atan2(self.components[1][0], -self.components[0][1]))
+        return degrees(atan2(self.m10, -self.m01))
 
     def get_translation(self):
-        return Vector2(self.components[0][2], self.components[1][2])
+        return Vector2(self.m02, self.m12)
 
     def get_scale(self):
         return Vector2(
-            self.components[0][0] / self.components[1][0] if self.components[1][0] != 0 else 1,
-            self.components[1][1] / -self.components[0][1] if self.components[0][1] != 0 else 1
+            self.m00 / self.m10 if self.m10 != 0 else 1,
+            self.m11 / -self.m01 if self.m01 != 0 else 1
         )
 
     def __str__(self):
         return "| {:10.5f} {:10.5f} {:10.5f} |\n| {:10.5f} {:10.5f} {:10.5f} |\n| {:10.5f} {:10.5f} {:10.5f} |".format(
-            self.i(0, 0), self.i(1, 0), self.i(2, 0),
-            self.i(0, 1), self.i(1, 1), self.i(2, 1),
-            self.i(0, 2), self.i(1, 2), self.i(2, 2),
+            self.m00, self.m01, self.m02,
+            self.m10, self.m11, self.m12,
+            0, 0, 1,
         )
 
 
@@ -9,7 +9,7 @@ import pygame
 from engine.logic.RenderedGameObject import RenderedGameObject
 
 # Import the math tools.
-from engine.logic.Math import ZERO_VECTOR, UNIT_VECTOR, Vector2
+from engine.logic.Math import ZERO_VECTOR
 
 
 class LineGameObject(RenderedGameObject):
@@ -42,17 +42,35 @@ class LineGameObject(RenderedGameObject):
         self.width = width
         self.color = color
 
+    def get_bounds(self):
+        """
+        Returns the area of the screen covered by the line.
+        """
+        origin = self.get_render_position()
+        bounds = pygame.Rect(round(origin.x), round(origin.y), round(self.extent.x), round(self.extent.y))
+        bounds.normalize()
+        return bounds.inflate(self.width * 2 + 2, self.width * 2 + 2)
+
+    def get_render_state(self):
+        """
+        Returns the values that affect the rendering of the line.
+        """
+        origin = self.get_render_position()
+        return origin.x, origin.y, self.extent.x, self.extent.y, self.width, self.color
+
     def render(self, window):
         """
         Renders the line on the screen.
 
         :param window The screen to render onto.
         """
+        # Compute the world position only once.
+        origin = self.get_render_position()
         pygame.draw.line(
             window,
             self.color,
-            self.transform.get_world_position().tuple(),
-            (self.transform.get_world_position() + self.extent).tuple(),
+            origin.tuple(),
+            (origin.x + self.extent.x, origin.y + self.extent.y),
             self.width
         )
 
@@ -88,29 +106,47 @@ class RectGameObject(RenderedGameObject):
         self.inner_color = inner_color
         self.outer_color = outer_color
 
+    def get_bounds(self):
+        """
+        Returns the area of the screen covered by the rectangle and its outline.
+        """
+        origin = self.get_render_position()
+        bounds = pygame.Rect(round(origin.x), round(origin.y), round(self.extent.x), round(self.extent.y))
+        bounds.normalize()
+        return bounds.inflate(self.width * 2 + 2, self.width * 2 + 2)
+
+    def get_render_state(self):
+        """
+        Returns the values that affect the rendering of the rectangle.
+        """
+        origin = self.get_render_position()
+        return origin.x, origin.y, self.extent.x, self.extent.y, self.width, self.inner_color, self.outer_color
+
     def render(self, window):
         """
         Renders the rect on the screen.
 
         :param window The screen to render onto.
         """
+        # Compute the world position only once.
+        o = self.get_render_position()
+        e = self.extent
+
         # Draw the contents of the rectangle.
         pygame.draw.rect(
             window,
             self.inner_color,
-            pygame.Rect(self.transform.get_world_position().tuple(), self.extent.tuple())
+            pygame.Rect(o.x, o.y, e.x, e.y)
         )
 
         # If an outline is to be drawn.
         if self.width > 0:
-            o = self.transform.get_world_position()
-            e = self.extent
             # Compute the points.
             points = [
-                o.tuple(),
-                Vector2(o.x + e.x, o.y).tuple(),
-                (o + e).tuple(),
-                Vector2(o.x, o.y + e.y).tuple(),
+                (o.x, o.y),
+                (o.x + e.x, o.y),
+                (o.x + e.x, o.y + e.y),
+                (o.x, o.y + e.y),
             ]
             # Draw the outline.
             pygame.draw.lines(window, self.outer_color, True, points, self.width)
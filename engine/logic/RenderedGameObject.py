@@ -14,8 +14,14 @@ from abc import ABC, abstractmethod
 class RenderedGameObject(GameObject, Renderable, ABC):
     """
     Base class used for all the game objects that are rendered on the screen.
+
+    Attributes:
+        renders_children    Flag set if the rendered objects below this one are rendered by it. (read-only)
     """
 
+    # Rendered objects below this one are registered in the renderer.
+    renders_children = False
+
     def __init__(self, parent):
         """
         Class constructor.
@@ -23,10 +29,12 @@ class RenderedGameObject(GameObject, Renderable, ABC):
         Registers itself into the engine's renderer.
         :param parent: The parent of this game object.
         """
+        # Renderer frame during which the object was last told that it moved.
+        self.__moved_frame = -1
         # Call the parent constructor.
         super().__init__(parent)
         # Register the object into the renderer.
-        Engine.renderer.add_renderable(self)
+        self.enable_rendering()
 
     def __del__(self):
         """
@@ -43,9 +51,103 @@ class RenderedGameObject(GameObject, Renderable, ABC):
         """
         pass
 
+    def mark_dirty(self):
+        """
+        Tells the renderer that the appearance of this object changed.
+        Must be called after changing any attribute that affects the rendering, other than the transform and the
+        visibility which are tracked on their own.
+        """
+        # Objects below a static layer are drawn by the layer.
+        layer = self.get_static_parent()
+        if layer is not None:
+            layer.mark_dirty()
+        else:
+            Engine.renderer.mark_dirty(self)
+
+    def get_static_parent(self):
+        """
+        Returns the closest parent that renders the objects below it.
+        :return: The parent game object, or None if this object is drawn by the renderer.
+        """
+        parent = self.transform.parent
+        while parent is not None:
+            if getattr(parent.gameobject, "renders_children", False):
+                return parent.gameobject
+            parent = parent.parent
+        return None
+
+    def _transform_changed_internal(self):
+        """
+        Tells the renderer that the object moved.
+        """
+        if not self._record_move_internal():
+            return
+        self.mark_dirty()
+        # Call the parent method.
+        super()._transform_changed_internal()
+
+    def _record_move_internal(self):
+        """
+        Records that the object moved during the current frame.
+        :return: False if the object, and thus its children, were already told that they moved since the last frame.
+        """
+        frame = Engine.renderer.frame
+        if self.__moved_frame == frame:
+            return False
+        self.__moved_frame = frame
+        return True
+
+    def _visibility_changed_internal(self, visible):
+        """
+        Shows or hides the object in the renderer.
+        :param visible: The new visibility of the object.
+        """
+        # Objects below a static layer are drawn by the layer.
+        layer = self.get_static_parent()
+        if layer is not None:
+            layer.mark_dirty()
+        else:
+            Engine.renderer.set_visible(self, visible)
+
+    def get_render_position(self):
+        """
+        Returns the world position to render this object at.
+        Uses the engine's batched transform solver if it is enabled and solved this object.
+        The returned vector is shared and must not be modified.
+        """
+        if Engine.transform_batch is not None:
+            position = Engine.transform_batch.get_world_position(self.transform)
+            if position is not None:
+                return position
+        return self.transform.get_world_position()
+
+    def get_render_scale(self):
+        """
+        Returns the world scale to render this object with.
+        Uses the engine's batched transform solver if it is enabled and solved this object.
+        The returned vector is shared and must not be modified.
+        """
+        if Engine.transform_batch is not None:
+            scale = Engine.transform_batch.get_world_scale(self.transform)
+            if scale is not None:
+                return scale
+        return self.transform.get_world_scale()
+
+    def set_render_layer(self, layer):
+        """
+        Moves this object to another render layer.
+        :param layer: The new layer of the object.
+        """
+        self.render_layer = layer
+        Engine.renderer.set_layer(self, layer)
+
     def enable_rendering(self):
         """
         Enables rendering of this item.
         """
+        # Objects below a static layer are rendered by the layer.
+        if self.get_static_parent() is not None:
+            return
+
         # Attach to the renderer.
         Engine.renderer.add_renderable(self)
@@ -0,0 +1,175 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the pygame library.
+import pygame
+
+# Import the rendered game object class.
+from engine.logic.RenderedGameObject import RenderedGameObject
+# Import the engine class.
+from engine.Engine import Engine
+# Import the render layers.
+from engine.render.Renderer import LAYER_BACKGROUND
+
+
+class StaticLayerGameObject(RenderedGameObject):
+    """
+    Game object that flags its subtree as static.
+    All the rendered objects below it are rasterized once into a cached surface, which is then drawn with a single
+    blit. The cache is rebuilt only when the transform, the visibility or the appearance of one of them changes:
+    the objects mark the layer dirty, and the cache is rebuilt at most once per frame, only if it is dirty.
+    Rendered objects must be created below the layer, they are then not registered into the renderer.
+    """
+
+    # Rendered objects below this one are drawn by it.
+    renders_children = True
+    # Static layers are drawn behind everything else.
+    render_layer = LAYER_BACKGROUND
+
+    def __init__(self, parent):
+        """
+        Class constructor.
+        Prepares the cached surface.
+        :param parent: The parent of this game object.
+        """
+        # Call the parent constructor.
+        super().__init__(parent)
+
+        # Flag set if an object of the subtree changed since the cache was built.
+        self.__dirty = True
+        # Render states of the rasterized objects.
+        self.__signature = None
+        # Rasterized subtree.
+        self.__surface = None
+        # Area of the screen covered by the rasterized subtree.
+        self.__bounds = pygame.Rect(0, 0, 0, 0)
+        # Incremented each time the cache is rebuilt.
+        self.__version = 0
+
+    def invalidate(self):
+        """
+        Forces the cache to be rebuilt on the next frame.
+        """
+        self.__signature = None
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """
+        Flags the cache as outdated, and tells the renderer that the layer changed.
+        Called by the objects of the subtree when they change.
+        """
+        self.__dirty = True
+        # Call the parent method.
+        super().mark_dirty()
+
+    def _transform_changed_internal(self):
+        """
+        Flags the cache as outdated when the layer moves.
+        The objects below it are drawn by the layer, so only the nested layers are told.
+        """
+        if not self._record_move_internal():
+            return
+        self.mark_dirty()
+        self.__move_nested_layers(self.transform)
+
+    def get_bounds(self):
+        """
+        Returns the area of the screen covered by the subtree.
+        """
+        self.__refresh()
+        return self.__bounds
+
+    def get_render_state(self):
+        """
+        Returns the version of the cached surface, and where it is drawn.
+        """
+        self.__refresh()
+        return self.__version, self.__bounds.topleft
+
+    def render(self, window):
+        """
+        Draws the cached surface on the screen.
+        :param window: The window to render the layer onto.
+        """
+        self.__refresh()
+        if self.__surface is not None:
+            window.blit(self.__surface, self.__bounds)
+
+    def __move_nested_layers(self, transform):
+        """
+        Tells the layers below the given transform that they moved.
+        :param transform: The transform to explore.
+        """
+        for child in transform.children:
+            if getattr(child.gameobject, "renders_children", False):
+                child.gameobject._transform_changed_internal()
+            else:
+                self.__move_nested_layers(child)
+
+    def __collect(self, transform, members):
+        """
+        Lists all the visible rendered objects below the given transform, in tree order.
+        :param transform: The transform to explore.
+        :param members: The list to fill.
+        """
+        for child in transform.children:
+            gameobject = child.gameobject
+            if not gameobject.visible:
+                continue
+            if isinstance(gameobject, RenderedGameObject):
+                members.append(gameobject)
+                # Nested layers render their own children.
+                if gameobject.renders_children:
+                    continue
+            self.__collect(child, members)
+
+    def __refresh(self):
+        """
+        Rebuilds the cached surface if any of the objects of the subtree changed.
+        """
+        # If nothing marked the layer dirty, keep the cache.
+        if not self.__dirty:
+            return
+        self.__dirty = False
+
+        # Compute the current state of the subtree.
+        members = []
+        self.__collect(self.transform, members)
+        signature = []
+        for member in members:
+            state = member.get_render_state()
+            # Objects without a state must be rasterized each time.
+            if state is None:
+                signature = None
+                break
+            signature.append((member, state))
+        # Layers with such objects are compared by the renderer on every frame.
+        self.polled = signature is None
+        self.__dirty = self.polled
+
+        # If nothing changed, keep the cache.
+        if signature is not None and signature == self.__signature:
+            return
+        self.__signature = signature
+        self.__version += 1
+
+        # Compute the area covered by the subtree.
+        screen = pygame.Rect((0, 0), Engine.renderer.get_window_size())
+        bounds = None
+        for member in members:
+            member_bounds = member.get_bounds()
+            if member_bounds is None:
+                member_bounds = screen
+            bounds = member_bounds if bounds is None else bounds.union(member_bounds)
+        if bounds is not None:
+            bounds = bounds.clip(screen)
+        if bounds is None or bounds.width == 0 or bounds.height == 0:
+            self.__surface = None
+            self.__bounds = pygame.Rect(0, 0, 0, 0)
+            return
+
+        # Rasterize the subtree and keep the covered area.
+        canvas = pygame.Surface(screen.size, pygame.SRCALPHA, 32)
+        for member in members:
+            member.render(canvas)
+        self.__surface = canvas.subsurface(bounds).copy()
+        self.__bounds = bounds
@@ -1,5 +1,8 @@
 #  Copyright © 2019 CAILLAUD Jean-Baptiste.
 
+# Import the ordered dictionary.
+from collections import OrderedDict
+
 # Import the pygame module.
 import pygame
 
@@ -7,21 +10,41 @@ import pygame
 from engine.logic.Textured import TexturedGameObject
 # Import the math module
 import engine.logic.Math as math
+# Import the render layers.
+from engine.render.Renderer import LAYER_UI
 
 
 class TextGameObject(TexturedGameObject):
     """
     Gets rendered as a text on the screen.
+    Rendered texts are shared between all the objects displaying the same text with the same style.
+    In glyph atlas mode, the text is composed from pre-rendered characters instead,
+    which is faster for texts that change often.
 
     Attributes:
-        text    The text that is written (read-only)
-        font    The name of the font used. (read-only)
+        text        The text that is written (read-only, use set_text)
+        font        The name of the font used. (read-only)
+        color       The color of the text. (read-only)
+        antialias   Flag set if the text is antialiased. (read-only)
+        glyph_atlas Flag set if the text is composed from pre-rendered characters. (read-only)
     """
 
+    # Texts are drawn above everything else.
+    render_layer = LAYER_UI
+
+    # Maximum memory, in bytes, used by the rendered texts cache.
+    TEXT_CACHE_BYTES = 4 * 1024 * 1024
+
     # Dictionary of all the loaded fonts.
     __fonts = {}
+    # Cache of the rendered texts, keyed by font name, size, text, color and antialiasing.
+    __texts = OrderedDict()
+    # Memory used by the rendered texts cache.
+    __texts_bytes = 0
+    # Pre-rendered characters, keyed by font name, size, color and antialiasing.
+    __glyphs = {}
 
-    def __init__(self, parent, font_name, size, text, color=(0, 0, 0)):
+    def __init__(self, parent, font_name, size, text, color=(0, 0, 0), antialias=True, glyph_atlas=False):
         """
         Class constructor.
         Loads the font from the specified name and creates the texture.
@@ -30,15 +53,96 @@ class TextGameObject(TexturedGameObject):
         :param size: The size of the font.
         :param text: The text to render.
         :param color: The color of the rendered text.
+        :param antialias: If True, the text is antialiased.
+        :param glyph_atlas: If True, the text is composed from pre-rendered characters.
         """
         super().__init__(parent, None, math.ZERO_VECTOR)
         # Load the font.
         self.font = TextGameObject.__load_font(font_name, size)
-        self.text = text
+        self.color = tuple(color)
+        self.antialias = antialias
+        self.glyph_atlas = glyph_atlas
+        self.__style = (font_name, size, self.color, antialias)
 
         # Render the text.
-        self.texture = self.font.render(self.text, True, color)
+        self.text = None
+        self.set_text(text)
+
+    def set_text(self, text):
+        """
+        Changes the text that is written.
+        The size of the object is updated to match the new text.
+        :param text: The new text.
+        """
+        # If the text did not change, do nothing.
+        if text == self.text:
+            return
+        self.text = text
+
+        # Get the texture of the text.
+        if self.glyph_atlas:
+            self.texture = TextGameObject.__compose_text(self.font, self.__style, text)
+        else:
+            self.texture = TextGameObject.__render_text(self.font, self.__style, text)
         self.size = math.Vector2(self.texture.get_width(), self.texture.get_height())
+        self.mark_dirty()
+
+    @classmethod
+    def __render_text(cls, font, style, text):
+        """
+        Renders the specified text.
+        If it was already rendered, return the previous surface instead of rendering it again.
+        :param font: The font to render the text with.
+        :param style: The font name, size, color and antialiasing of the text.
+        :param text: The text to render.
+        :return: The rendered text, which must not be modified.
+        """
+        key = style + (text,)
+        # If the text was already rendered.
+        if key in cls.__texts:
+            # Mark it as recently used.
+            cls.__texts.move_to_end(key)
+            return cls.__texts[key]
+
+        # Render the text.
+        surface = font.render(text, style[3], style[2])
+
+        # Store the text, evicting the least recently used ones if the cache is too large.
+        cls.__texts[key] = surface
+        cls.__texts_bytes += surface.get_pitch() * surface.get_height()
+        while cls.__texts_bytes > cls.TEXT_CACHE_BYTES and len(cls.__texts) > 1:
+            evicted = cls.__texts.popitem(last=False)[1]
+            cls.__texts_bytes -= evicted.get_pitch() * evicted.get_height()
+        return surface
+
+    @classmethod
+    def __compose_text(cls, font, style, text):
+        """
+        Composes the specified text from pre-rendered characters.
+        :param font: The font to render the characters with.
+        :param style: The font name, size, color and antialiasing of the text.
+        :param text: The text to compose.
+        :return: The composed text.
+        """
+        # Get the characters of this style.
+        if style not in cls.__glyphs:
+            cls.__glyphs[style] = {}
+        glyphs = cls.__glyphs[style]
+
+        # Render the missing characters.
+        for character in text:
+            if character not in glyphs:
+                glyphs[character] = font.render(character, style[3], style[2])
+
+        # Blit all the characters side by side.
+        surface = pygame.Surface(
+            (sum(glyphs[character].get_width() for character in text), font.get_height()), pygame.SRCALPHA, 32
+        )
+        x = 0
+        for character in text:
+            surface.blit(glyphs[character], (x, 0))
+            x += glyphs[character].get_width()
+        return surface
 
     @classmethod
     def __load_font(cls, font_name, size):
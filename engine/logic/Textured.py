@@ -1,6 +1,7 @@
 #  Copyright © 2019 CAILLAUD Jean-Baptiste.
 
 # Import the pygame utility.
+from collections import OrderedDict
 from copy import copy
 
 import pygame
@@ -9,18 +10,28 @@ import pygame
 from engine.logic.Math import ZERO_VECTOR
 # Import the rendered game object class.
 from engine.logic.RenderedGameObject import RenderedGameObject
-import engine
+# Import the engine class.
+from engine.Engine import Engine
 
 
 class TexturedGameObject(RenderedGameObject):
     """
     Game object that is rendered with a texture.
+    The rotated and scaled versions of the textures are cached, per object and in a shared LRU cache.
 
     Attributes:
-        texture     The texture of this object.
-        size        The size of the rendered image.
+        texture         The texture of this object. Loaded textures are shared and must not be modified.
+        texture_key     The key of the texture in the shared cache. None if the texture is not shared.
+        texture_angle   The angle, in degrees, to rotate the texture by.
+        size            The size of the rendered image.
     """
 
+    # Maximum number of transformed textures kept in the shared cache.
+    TRANSFORM_CACHE_SIZE = 128
+
+    # Shared cache of the transformed textures, keyed by texture key, size and angle.
+    __transformed = OrderedDict()
+
     def __init__(self, parent, texture_path, size):
         """
         Class constructor.
@@ -32,38 +43,86 @@ class TexturedGameObject(RenderedGameObject):
         # Call the parent constructor.
         super().__init__(parent)
 
-        # Try to load the texture.
+        # Try to load the texture, it is shared with all the objects using the same file.
         if texture_path is not None:
-            self.texture = pygame.image.load("Data/Textures/{}.bmp".format(texture_path)).convert()
-            self.texture.set_colorkey(self.texture.get_at((1, 1)))
-            self.rendered = self.texture.copy()
+            self.texture = Engine.load_texture(texture_path)
         else:
             self.texture = None
-            self.rendered = None
+        self.texture_key = texture_path
+        self.texture_angle = 0
+        self.rendered = None
+        # Key of the rendered texture.
+        self.__rendered_key = None
 
         # Save the size.
         self.size = copy(size)
 
+    def get_bounds(self):
+        """
+        Returns the area of the screen covered by the texture.
+        """
+        origin = self.get_render_position()
+        size = (self.size * self.get_render_scale()).tuple(True)
+        return pygame.Rect(int(origin.x) - 1, int(origin.y) - 1, size[0] + 2, size[1] + 2)
+
+    def get_render_state(self):
+        """
+        Returns the values that affect the rendering of the texture.
+        """
+        origin = self.get_render_position()
+        return (
+            origin.x, origin.y, self.size.x, self.size.y, self.get_render_scale().tuple(),
+            self.texture, self.texture_angle
+        )
+
     def render(self, window):
         """
         Renders the texture on the screen.
         Uses the world matrix to generate the origin and extent of the rendering target.
         :param window: The window to render the texture onto.
         """
-        # If the rendered texture is a none.
-        if self.rendered is None:
-            # If the texture is set.
-            if self.texture is not None:
-                self.rendered = self.texture.copy()
-            else:
-                raise ValueError("There is no texture to render !")
+        # If there is no texture.
+        if self.texture is None:
+            raise ValueError("There is no texture to render !")
 
         # Get the origin and extent points of the image.
-        origin = self.transform.get_world_position()
-        # Check if the scale has changed.
-        scale = (self.size * self.transform.get_world_scale()).tuple(True)
-        if scale[0] != self.texture.get_width() or scale[1] != self.texture.get_height():
-            self.rendered = pygame.transform.scale(self.texture, scale)
+        origin = self.get_render_position()
+        # Check if the texture, scale or angle has changed.
+        scale = (self.size * self.get_render_scale()).tuple(True)
+        key = (self.texture, scale, self.texture_angle)
+        if key != self.__rendered_key:
+            self.rendered = self.__transform_texture(scale)
+            self.__rendered_key = key
 
         # Blit the image.
         window.blit(self.rendered, pygame.Rect(origin.tuple(), ZERO_VECTOR.tuple()))
+
+    def __transform_texture(self, scale):
+        """
+        Rotates and scales the texture, using the shared cache if the texture has a key.
+        The returned surface may be shared and must not be modified.
+        :param scale: The size of the rendered texture.
+        :return: The transformed texture.
+        """
+        cache = TexturedGameObject.__transformed
+        key = (self.texture_key, scale, self.texture_angle % 360)
+
+        # If the texture was already transformed.
+        if self.texture_key is not None and key in cache:
+            # Mark it as recently used.
+            cache.move_to_end(key)
+            return cache[key]
+
+        # Transform the texture.
+        transformed = self.texture
+        if key[2] != 0:
+            transformed = pygame.transform.rotate(transformed, key[2])
+        if transformed.get_size() != scale:
+            transformed = pygame.transform.scale(transformed, scale)
+
+        # Store the result, evicting the least recently used one if needed.
+        if self.texture_key is not None:
+            cache[key] = transformed
+            if len(cache) > TexturedGameObject.TRANSFORM_CACHE_SIZE:
+                cache.popitem(last=False)
+        return transformed
@@ -7,16 +7,24 @@ class Transform:
     """
     Simple transform.
     Used to give information about the objects in the scene.
+    The local and world matrices are cached, and only recomputed when the transform or one of its parents changes.
+    Assigning any of the attributes below invalidates the cache. If a vector attribute is modified in place,
+    invalidate() must be called by hand.
 
     Attributes:
         parent      Parent transform of this object.
         position    Position of the transform in parent-relative space.
+        offset      Offset of the transform, rotated by the transform.
         rotation    Rotation of the transform in parent-relative space.
         scale       Scale of the transform in parent-relative space.
         gameobject  GameObject instance attached to this transform.
         children    List of all the children of this transform.
+        batch       Batched transform solver notified of all the changes, or None. Set by the engine.
     """
 
+    # Batched transform solver, if enabled.
+    batch = None
+
     def __init__(self, parent, position=ZERO_VECTOR, offset=ZERO_VECTOR, rotation=0, scale=UNIT_VECTOR, gameobject=None):
         """
         Class constructor.
@@ -28,18 +36,121 @@ class Transform:
         :param scale: The scale of this transform.
         :param gameobject: The game object that this transform represents.
         """
-        self.parent = parent
-        self.offset = copy(offset)
-        self.position = copy(position)
-        self.rotation = rotation
-        self.scale = scale
+        self.__parent = parent
+        self.__offset = copy(offset)
+        self.__position = copy(position)
+        self.__rotation = rotation
+        self.__scale = scale
         self.gameobject = gameobject
         self.children = []
 
+        # Prepare the caches.
+        self.__local_matrix = None
+        self.__world_dirty = True
+        self.__world_matrix = None
+        self.__world_position = None
+        self.__world_rotation = None
+        self.__world_scale = None
+
         # If there is a parent.
         if parent is not None:
             # Append ourselves to the children list.
             parent.children.append(self)
+            if Transform.batch is not None:
+                Transform.batch._hierarchy_changed_internal()
+
+    @property
+    def parent(self):
+        return self.__parent
+
+    @parent.setter
+    def parent(self, parent):
+        # Move ourselves to the children list of the new parent.
+        if self.__parent is not None and self in self.__parent.children:
+            self.__parent.children.remove(self)
+        self.__parent = parent
+        if parent is not None:
+            parent.children.append(self)
+        if Transform.batch is not None:
+            Transform.batch._hierarchy_changed_internal()
+        self.invalidate()
+        # The visibility of the object depends on its parents.
+        if self.gameobject is not None:
+            self.gameobject._update_visibility_internal()
+
+    @property
+    def position(self):
+        return self.__position
+
+    @position.setter
+    def position(self, position):
+        self.__position = position
+        self.invalidate()
+
+    @property
+    def offset(self):
+        return self.__offset
+
+    @offset.setter
+    def offset(self, offset):
+        self.__offset = offset
+        self.invalidate()
+
+    @property
+    def rotation(self):
+        return self.__rotation
+
+    @rotation.setter
+    def rotation(self, rotation):
+        self.__rotation = rotation
+        self.invalidate()
+
+    @property
+    def scale(self):
+        return self.__scale
+
+    @scale.setter
+    def scale(self, scale):
+        self.__scale = scale
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Clears the cached matrices of this transform and of all its descendants.
+        """
+        self.__local_matrix = None
+        self.__invalidate_world()
+        # The batched solver only needs the transform whose local values changed.
+        if Transform.batch is not None:
+            Transform.batch._transform_changed_internal(self)
+        # Tell the objects of the subtree that they moved.
+        if self.gameobject is not None:
+            self.gameobject._transform_changed_internal()
+
+    def __invalidate_world(self):
+        """
+        Clears the cached world values of this transform and of all its descendants.
+        """
+        # If the transform is already dirty, so are all of its children.
+        if self.__world_dirty:
+            return
+        self.__world_dirty = True
+
+        # Invalidate the children.
+        for child in self.children:
+            child.__invalidate_world()
+
+    def __clean_world(self):
+        """
+        Drops the cached world values if they were invalidated.
+        Must be followed by a call to one of the parent's world getters.
+        """
+        if self.__world_dirty:
+            self.__world_dirty = False
+            self.__world_matrix = None
+            self.__world_position = None
+            self.__world_rotation = None
+            self.__world_scale = None
 
     def apply(self, position, world=False):
         """
@@ -53,42 +164,70 @@ class Transform:
     def get_matrix(self, ignore_position=False, ignore_rotation=False, ignore_scale=True):
         """
         Returns the matrix generated by this transform.
+        The returned matrix is shared and must not be modified.
         """
+        # If the default matrix is requested, use the cached one.
+        if not ignore_position and not ignore_rotation and ignore_scale:
+            if self.__local_matrix is None:
+                self.__local_matrix = Mat3x3.create_matrix(self.__position, self.__rotation)
+            return self.__local_matrix
+
         return Mat3x3.create_matrix(
-            ZERO_VECTOR if ignore_position else self.position,
-            0 if ignore_rotation else self.rotation,
-            UNIT_VECTOR if ignore_scale else self.scale)
+            ZERO_VECTOR if ignore_position else self.__position,
+            0 if ignore_rotation else self.__rotation,
+            UNIT_VECTOR if ignore_scale else self.__scale)
 
     def get_world_matrix(self):
         """
         Returns the 3x3 matrix of this transform in world space.
-        """
-        return (self.parent.get_world_matrix() if self.parent is not None else IDENTITY_MATRIX) * self.get_matrix()
+        The returned matrix is shared and must not be modified.
+        """
+        self.__clean_world()
+        if self.__world_matrix is None:
+            self.__world_matrix = (
+                self.__parent.get_world_matrix() if self.__parent is not None else IDENTITY_MATRIX
+            ).compose(self.get_matrix())
+        return self.__world_matrix
 
     def get_world_position(self):
         """
         Returns the world position of this transform.
-        """
-        # Compute the position of the center.
-        center = (self.parent.get_world_matrix() if self.parent is not None else IDENTITY_MATRIX) * self.position
-        offset = self.get_matrix(ignore_position=True) * self.offset
-        return center + offset
+        The returned vector is shared and must not be modified.
+        """
+        self.__clean_world()
+        if self.__world_position is None:
+            # Compute the position of the center.
+            center = (
+                self.__parent.get_world_matrix() if self.__parent is not None else IDENTITY_MATRIX
+            ).apply(self.__position)
+            # The offset is only rotated, add it in place to avoid allocating another vector.
+            self.__world_position = center.iadd(self.get_matrix().apply_linear(self.__offset))
+        return self.__world_position
 
     def set_world_position(self, position):
         """
         Defines the world position of the object.
         :param position: The position the object is expected to be in.
         """
-        self.position = position - (self.parent.get_world_position() if self.parent is not None else ZERO_VECTOR)
+        self.position = position - (self.__parent.get_world_position() if self.__parent is not None else ZERO_VECTOR)
 
     def get_world_rotation(self):
         """
         Returns the world rotation of this transform.
         """
-        return self.rotation + (self.parent.get_world_rotation() if self.parent is not None else 0)
+        self.__clean_world()
+        if self.__world_rotation is None:
+            self.__world_rotation = \
+                self.__rotation + (self.__parent.get_world_rotation() if self.__parent is not None else 0)
+        return self.__world_rotation
 
     def get_world_scale(self):
         """
         Returns the world scale of this transform.
+        The returned vector is shared and must not be modified.
         """
-        return self.scale * (self.parent.get_world_scale() if self.parent is not None else UNIT_VECTOR)
+        self.__clean_world()
+        if self.__world_scale is None:
+            self.__world_scale = \
+                self.__scale * (self.__parent.get_world_scale() if self.__parent is not None else UNIT_VECTOR)
+        return self.__world_scale
@@ -0,0 +1,237 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import numpy, if it is available.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Import the math tools.
+from engine.logic.Math import Mat3x3, Vector2
+
+
+class TransformBatch:
+    """
+    Batched transform solver.
+    Keeps the local values of all the transforms of a scene graph in persistent numpy arrays, in parent-before-child
+    order, and computes all the world matrices, positions and scales with one vectorized pass per depth level.
+    The arrays are updated from the invalidation path of the transforms: a moved transform only rewrites its own row,
+    and the hierarchy is only listed again when a transform changes parent. Nothing is computed if nothing changed.
+    Like Transform.get_world_matrix, the world matrices and positions ignore the scale, which is composed apart.
+    Requires numpy.
+    """
+
+    # Columns of the local values.
+    POSITION_X, POSITION_Y, OFFSET_X, OFFSET_Y, ROTATION, SCALE_X, SCALE_Y = range(7)
+
+    def __init__(self):
+        """
+        Class constructor.
+        Prepares the solver's storage.
+        """
+        if numpy is None:
+            raise ImportError("The batched transform solver requires numpy.")
+
+        # Index of each solved transform.
+        self.__indices = {}
+        # Index of the parent of each transform, -1 for the top level transforms.
+        self.__parents = numpy.zeros(0, dtype=numpy.intp)
+        # Indices of the transforms of each depth level, starting at the second one.
+        self.__levels = []
+        # Local values of the transforms, one row per transform.
+        self.__local = numpy.zeros((0, 7))
+        # World matrices of the solved transforms, as rows of six affine components.
+        self.__matrices = numpy.zeros((0, 6))
+        # World positions and scales of the solved transforms.
+        self.__positions = numpy.zeros((0, 2))
+        self.__scales = numpy.zeros((0, 2))
+        # Cache of the vectors returned by get_world_position and get_world_scale.
+        self.__position_vectors = {}
+        self.__scale_vectors = {}
+
+        # Transforms whose local values changed since the last solve.
+        self.__changed = set()
+        # Flag set if a transform changed parent since the last solve.
+        self.__hierarchy_dirty = True
+
+    def _transform_changed_internal(self, transform):
+        """
+        Called by the transforms when they are invalidated.
+        :param transform: The transform whose local values changed.
+        """
+        self.__changed.add(transform)
+
+    def _hierarchy_changed_internal(self):
+        """
+        Called by the transforms when they are attached to another parent.
+        """
+        self.__hierarchy_dirty = True
+
+    def solve(self, root):
+        """
+        Computes the world matrices, positions and scales of all the descendants of the given root.
+        The root itself is considered to be at the origin of the world.
+        :param root: The root transform of the scene.
+        """
+        if self.__hierarchy_dirty:
+            self.__rebuild(root)
+        elif len(self.__changed) > 0:
+            # Only rewrite the rows of the changed transforms.
+            for transform in self.__changed:
+                index = self.__indices.get(transform)
+                if index is not None:
+                    self.__local[index] = TransformBatch.__pack(transform)
+        else:
+            # Nothing changed since the last solve.
+            return
+        self.__changed.clear()
+        self.__position_vectors = {}
+        self.__scale_vectors = {}
+
+        local = self.__local
+        rotation = local[:, TransformBatch.ROTATION]
+        c = numpy.cos(rotation)
+        s = numpy.sin(rotation)
+        position = local[:, TransformBatch.POSITION_X:TransformBatch.POSITION_Y + 1]
+        offset_x = local[:, TransformBatch.OFFSET_X]
+        offset_y = local[:, TransformBatch.OFFSET_Y]
+
+        # Build the local matrices, as in Transform.get_matrix. The top level transforms are relative to the world.
+        world = numpy.stack((c, -s, position[:, 0], s, c, position[:, 1]), axis=1)
+        scales = local[:, TransformBatch.SCALE_X:TransformBatch.SCALE_Y + 1].copy()
+
+        # Compose each level with the already solved parent level.
+        for idx in self.__levels:
+            p = world[self.__parents[idx]]
+            l_m = world[idx]
+            world[idx] = numpy.stack((
+                p[:, 0] * l_m[:, 0] + p[:, 1] * l_m[:, 3],
+                p[:, 0] * l_m[:, 1] + p[:, 1] * l_m[:, 4],
+                p[:, 0] * l_m[:, 2] + p[:, 1] * l_m[:, 5] + p[:, 2],
+                p[:, 3] * l_m[:, 0] + p[:, 4] * l_m[:, 3],
+                p[:, 3] * l_m[:, 1] + p[:, 4] * l_m[:, 4],
+                p[:, 3] * l_m[:, 2] + p[:, 4] * l_m[:, 5] + p[:, 5]
+            ), axis=1)
+            # Scales are multiplied, as in Transform.get_world_scale.
+            scales[idx] *= scales[self.__parents[idx]]
+
+        # The centers are the translations of the world matrices, add the offsets rotated by the local matrices.
+        self.__matrices = world
+        self.__positions = world[:, (2, 5)] + numpy.stack(
+            (c * offset_x - s * offset_y, s * offset_x + c * offset_y), axis=1
+        )
+        self.__scales = scales
+
+    def get_world_position(self, transform):
+        """
+        Returns the world position of the transform, as computed by the last solve.
+        The returned vector is shared and must not be modified.
+        :param transform: The transform to look up.
+        :return: The world position, or None if the transform was not solved or changed since the last solve.
+        """
+        index = self.__get_index(transform)
+        if index is None:
+            return None
+
+        # Create the vector on the first request only.
+        vector = self.__position_vectors.get(index)
+        if vector is None:
+            vector = Vector2(*self.__positions[index].tolist())
+            self.__position_vectors[index] = vector
+        return vector
+
+    def get_world_scale(self, transform):
+        """
+        Returns the world scale of the transform, as computed by the last solve.
+        The returned vector is shared and must not be modified.
+        :param transform: The transform to look up.
+        :return: The world scale, or None if the transform was not solved or changed since the last solve.
+        """
+        index = self.__get_index(transform)
+        if index is None:
+            return None
+
+        # Create the vector on the first request only.
+        vector = self.__scale_vectors.get(index)
+        if vector is None:
+            vector = Vector2(*self.__scales[index].tolist())
+            self.__scale_vectors[index] = vector
+        return vector
+
+    def get_world_matrix(self, transform):
+        """
+        Returns the world matrix of the transform, as computed by the last solve.
+        :param transform: The transform to look up.
+        :return: The world matrix, or None if the transform was not solved or changed since the last solve.
+        """
+        index = self.__get_index(transform)
+        if index is None:
+            return None
+        return Mat3x3.affine(*self.__matrices[index].tolist())
+
+    def clear(self):
+        """
+        Forgets the results of the last solve. The hierarchy is listed again on the next solve.
+        """
+        self.__indices = {}
+        self.__parents = numpy.zeros(0, dtype=numpy.intp)
+        self.__levels = []
+        self.__local = numpy.zeros((0, 7))
+        self.__matrices = numpy.zeros((0, 6))
+        self.__positions = numpy.zeros((0, 2))
+        self.__scales = numpy.zeros((0, 2))
+        self.__position_vectors = {}
+        self.__scale_vectors = {}
+        self.__changed.clear()
+        self.__hierarchy_dirty = True
+
+    def __get_index(self, transform):
+        """
+        Returns the index of a transform whose results are up to date.
+        :param transform: The transform to look up.
+        :return: The index of the transform, or None if its results are missing or outdated.
+        """
+        # A change of any transform may move any of its descendants, so nothing is up to date until the next solve.
+        if self.__hierarchy_dirty or len(self.__changed) > 0:
+            return None
+        return self.__indices.get(transform)
+
+    def __rebuild(self, root):
+        """
+        Lists the transforms in parent-before-child order, and packs all their local values.
+        :param root: The root transform of the scene.
+        """
+        transforms = []
+        parents = []
+        levels = []
+        level = [(child, -1) for child in root.children]
+        while len(level) > 0:
+            next_level = []
+            start = len(transforms)
+            for transform, parent in level:
+                index = len(transforms)
+                transforms.append(transform)
+                parents.append(parent)
+                next_level.extend((child, index) for child in transform.children)
+            # The top level does not need to be composed.
+            if start > 0:
+                levels.append(numpy.arange(start, len(transforms), dtype=numpy.intp))
+            level = next_level
+
+        self.__indices = {transform: i for i, transform in enumerate(transforms)}
+        self.__parents = numpy.array(parents, dtype=numpy.intp)
+        self.__levels = levels
+        self.__local = numpy.array([TransformBatch.__pack(t) for t in transforms], dtype=float).reshape((-1, 7))
+        self.__hierarchy_dirty = False
+
+    @staticmethod
+    def __pack(transform):
+        """
+        Returns the local values of a transform, as one row of the local array.
+        :param transform: The transform to pack.
+        :return: The local values, in the order of the column constants.
+        """
+        position = transform.position
+        offset = transform.offset
+        scale = transform.scale
+        return position.x, position.y, offset.x, offset.y, numpy.radians(transform.rotation), scale.x, scale.y
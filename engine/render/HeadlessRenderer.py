@@ -0,0 +1,57 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the os module.
+import os
+
+# Import the renderer base class.
+from engine.render.Renderer import Renderer
+
+
+class HeadlessRenderer(Renderer):
+    """
+    Renderer that works without a display or an audio device.
+    pygame is started with its dummy video and audio drivers, so textures can still be loaded and converted.
+    By default nothing is drawn at all. In offscreen mode, the scene is rendered onto the world surface,
+    which can be read with get_world_surface, but never shown.
+
+    Attributes:
+        offscreen   Flag set if the scene is rendered onto the world surface.
+    """
+
+    def __init__(self, size, offscreen=False, dirty_rects=False):
+        """
+        Class constructor.
+        Selects the dummy drivers before pygame is initialized.
+        :param size: The size of the offscreen surface.
+        :param offscreen: If True, the scene is rendered onto the world surface.
+        :param dirty_rects: If True, only repaints the damaged regions of the world surface.
+        """
+        # Use the dummy drivers, they must be selected before pygame is initialized.
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+        # Call the parent constructor.
+        super().__init__(size, dirty_rects)
+        self.offscreen = offscreen
+
+    def render(self):
+        """
+        Renders the scene onto the world surface, if in offscreen mode.
+        """
+        if self.offscreen:
+            super().render()
+
+    def mark_dirty(self, renderable):
+        """
+        Only records the changes in offscreen mode, as nothing is drawn otherwise.
+        :param renderable: The item that changed.
+        """
+        if self.offscreen:
+            super().mark_dirty(renderable)
+
+    def _present(self, rects):
+        """
+        There is no window to update.
+        :param rects: The regions of the screen that were rendered.
+        """
+        pass
@@ -0,0 +1,138 @@
+#  Copyright © 2019 CAILLAUD Jean-Baptiste.
+
+# Import the pygame library.
+import pygame
+# Import pygame locals.
+from pygame.locals import KEYDOWN, K_F3
+
+# Import the renderable base class.
+from engine.render.Renderable import Renderable
+# Import the render layers.
+from engine.render.Renderer import LAYER_DEBUG
+# Import the input listener base class.
+from engine.input.InputListener import InputListener
+
+
+class ProfilerOverlay(Renderable, InputListener):
+    """
+    Draws the averages of the profiler in the top left corner of the screen.
+    Toggled with the F3 key. The text is only refreshed a few times per second, to keep it readable.
+
+    Attributes:
+        shown   Flag set if the overlay is on the screen. (read-only, use toggle)
+    """
+
+    # Debug information is drawn above everything else.
+    render_layer = LAYER_DEBUG
+    # The text is refreshed on its own.
+    polled = True
+
+    # Key that toggles the overlay.
+    TOGGLE_KEY = K_F3
+    # Number of frames between two refreshes of the text.
+    REFRESH_FRAMES = 30
+    # Number of renderable classes listed.
+    MAX_RENDER_CLASSES = 4
+
+    def __init__(self, profiler, renderer):
+        """
+        Class constructor.
+        :param profiler: The profiler to display.
+        :param renderer: The renderer to draw the overlay with.
+        """
+        super().__init__()
+        self.shown = False
+        self.__profiler = profiler
+        self.__renderer = renderer
+
+        # Font used to write the text.
+        self.__font = pygame.font.Font(None, 18)
+        # Rendered text, and the frame it was rendered at.
+        self.__surface = None
+        self.__rendered_frame = None
+
+    def is_visible(self):
+        """
+        The overlay is only registered in the renderer while it is shown.
+        """
+        return True
+
+    def attach(self):
+        """
+        Registers the overlay in the renderer, if it is shown.
+        Must be called again after the renderer was cleared.
+        """
+        if self.shown:
+            self.__renderer.add_renderable(self)
+
+    def toggle(self):
+        """
+        Shows or hides the overlay.
+        """
+        self.shown = not self.shown
+        if self.shown:
+            self.__rendered_frame = None
+            self.__renderer.add_renderable(self)
+        else:
+            self.__renderer.remove_renderable(self)
+
+    def handle_input(self, event):
+        """
+        Toggles the overlay when the toggle key is pressed.
+        :param event: The event to parse.
+        """
+        if event.type == KEYDOWN and event.key == ProfilerOverlay.TOGGLE_KEY:
+            self.toggle()
+
+    def get_bounds(self):
+        """
+        Returns the area of the screen covered by the text.
+        """
+        self.__refresh()
+        return self.__surface.get_rect()
+
+    def get_render_state(self):
+        """
+        Returns the frame the text was rendered at.
+        """
+        self.__refresh()
+        return self.__rendered_frame
+
+    def render(self, window):
+        """
+        Draws the text onto the screen.
+        :param window: The surface to render onto.
+        """
+        self.__refresh()
+        window.blit(self.__surface, (0, 0))
+
+    def __refresh(self):
+        """
+        Renders the text again if it is too old.
+        """
+        frames = self.__profiler.frames
+        frame = frames[-1]["frame"] if len(frames) > 0 else 0
+        if self.__rendered_frame is not None and frame - self.__rendered_frame < ProfilerOverlay.REFRESH_FRAMES:
+            return
+        self.__rendered_frame = frame
+
+        # Write the averages.
+        summary = self.__profiler.get_summary(ProfilerOverlay.REFRESH_FRAMES)
+        lines = ["frame {:.2f} ms".format(summary["duration"] * 1000)]
+        for name, duration in sorted(summary["phases"].items()):
+            lines.append("  {} {:.2f} ms".format(name, duration * 1000))
+        renders = sorted(summary["renders"].items(), key=lambda item: -item[1])
+        for name, duration in renders[:ProfilerOverlay.MAX_RENDER_CLASSES]:
+            lines.append("  {} {:.2f} ms".format(name, duration * 1000))
+        lines.append("objects {} renderables {}".format(summary["objects"], summary["renderables"]))
+        lines.append("allocated blocks {:+.0f}".format(summary["allocated_blocks"]))
+
+        # Draw the lines on a dark background.
+        rendered = [self.__font.render(line, True, (255, 255, 255)) for line in lines]
+        height = self.__font.get_linesize()
+        self.__surface = pygame.Surface(
+            (max(line.get_width() for line in rendered) + 8, height * len(rendered) + 8), pygame.SRCALPHA, 32
+        )
+        self.__surface.fill((0, 0, 0, 192))
+        for i, line in enumerate(rendered):
+            self.__surface.blit(line, (4, 4 + i * height))
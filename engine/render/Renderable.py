@@ -3,13 +3,26 @@
 # Import the abstract class object.
 from abc import ABC, abstractmethod
 
+# Import the render layers.
+from engine.render.Renderer import LAYER_BOARD
+
 
 class Renderable(ABC):
     """
     Main renderable object class.
     This class should be overloaded for each renderable type.
+
+    Attributes:
+        render_layer    The layer this object is drawn in. Use RenderedGameObject.set_render_layer to change it.
+        polled          Flag set if the state of the object changes without the renderer being told with mark_dirty,
+                        so it must be compared on every frame. (read-only)
     """
 
+    # Default render layer of the renderables.
+    render_layer = LAYER_BOARD
+    # Renderables tell the renderer when they change.
+    polled = False
+
     def __init__(self):
         """
         Class constructor.
@@ -18,6 +31,22 @@ class Renderable(ABC):
         # Flag set if the renderable is visible.
         self.visible = True
 
+    def get_bounds(self):
+        """
+        Returns the area of the screen covered by the renderable.
+        Used by the renderer to only repaint the damaged regions of the screen.
+        :return: A pygame Rect, or None if the area is unknown and the whole screen must be repainted.
+        """
+        return None
+
+    def get_render_state(self):
+        """
+        Returns a value describing everything that affects the rendering of the object.
+        The renderer repaints the object only if this value changed since the last frame.
+        :return: A comparable value, or None if the object must be repainted on every frame.
+        """
+        return None
+
     @abstractmethod
     def render(self, window):
         """
@@ -1,22 +1,70 @@
 #  Copyright © 2019 CAILLAUD Jean-Baptiste.
 import pygame
 import pygame.locals
+# Import the high resolution timer.
+from time import perf_counter
+
+
+# Defines the render layers, drawn in increasing order.
+LAYER_BACKGROUND = 0
+LAYER_BOARD = 1
+LAYER_SHIPS = 2
+LAYER_MARKERS = 3
+LAYER_UI = 4
+LAYER_DEBUG = 5
 
 
 class Renderer:
     """
     Rendering engine used to display on a window.
     Creates a new window on instantiation.
+    Renderables are drawn layer by layer, in the order they were added to their layer.
+    Only the visible renderables are kept in the layers, hidden ones are not even iterated over.
+    In dirty rectangle mode, only the regions of the screen where a renderable changed are repainted.
+    The renderables tell the renderer when they change with mark_dirty, and only those are compared with their state
+    on the last frame, so a frame where nothing changed costs nothing.
+
+    Attributes:
+        profiler    The profiler that records the render cost of each renderable class, if any.
+        frame       The number of frames rendered so far. (read-only)
     """
-    def __init__(self, size):
+
+    # Number of damaged regions above which they are merged into a single one.
+    MAX_DAMAGED_RECTS = 16
+
+    def __init__(self, size, dirty_rects=False):
         """
         Class constructor.
         Initializes the attributes of the renderer.
 
         :param size: The size of the new window to create.
+        :param dirty_rects: If True, only repaints the damaged regions of the screen.
         """
-        # Initialize the renderables list.
-        self.__renderables = []
+        # Initialize the render layers, each layer maps the id of its visible renderables to the renderables.
+        self.__layers = {}
+        # Sorted list of the layer keys.
+        self.__layer_order = []
+        # Layer of each registered renderable, by id.
+        self.__layer_of = {}
+        # Insertion number of each registered renderable, by id. Used to keep the layers sorted.
+        self.__sequence_of = {}
+        self.__sequence = 0
+        # Layers that must be sorted before the next frame.
+        self.__unsorted_layers = set()
+
+        # No profiling by default.
+        self.profiler = None
+        # No frame was rendered yet.
+        self.frame = 0
+
+        # Prepare the dirty rectangle state.
+        self.__dirty_rects = dirty_rects
+        # Bounds and state of all the renderables drawn on the last frame.
+        self.__drawn = {}
+        # Renderables that changed since the last frame.
+        self.__dirty = set()
+        # Flag set if the entire screen must be repainted.
+        self.__full_redraw = True
 
         # Initialize pygame.
         pygame.init()
@@ -43,12 +91,36 @@ class Renderer:
         pygame.mixer.quit()
         pygame.quit()
 
-    def add_renderable(self, renderable):
+    def add_renderable(self, renderable, layer=None):
         """
         Adds a new renderable item to the rendered list.
+        Adding an item that is already rendered only moves it if the layer differs.
         :param renderable: The renderable item to add to the list.
+        :param layer: The layer to add the item to. Defaults to the item's render_layer.
         """
-        self.__renderables.append(renderable)
+        if layer is None:
+            layer = renderable.render_layer
+
+        # If the item is already in the requested layer, do nothing.
+        key = id(renderable)
+        current = self.__layer_of.get(key)
+        if current == layer:
+            return
+        if current is not None:
+            self.__layers[current].pop(key, None)
+        self.mark_dirty(renderable)
+
+        # Create the layer if it does not exist yet.
+        if layer not in self.__layers:
+            self.__layers[layer] = {}
+            self.__layer_order = sorted(self.__layers.keys())
+        self.__layer_of[key] = layer
+        self.__sequence_of[key] = self.__sequence
+        self.__sequence += 1
+
+        # Only visible items are placed in the layer. As it is the last item, the layer stays sorted.
+        if renderable.is_visible():
+            self.__layers[layer][key] = renderable
 
     def remove_renderable(self, renderable):
         """
@@ -56,15 +128,95 @@ class Renderer:
         :param renderable: The item to remove from the rendered list.
         """
         # Check if the item exists in the list.
-        if renderable in self.__renderables:
-            # Remove the item from the list.
-            self.__renderables.remove(renderable)
+        layer = self.__layer_of.pop(id(renderable), None)
+        if layer is not None:
+            # Remove the item from its layer.
+            del self.__sequence_of[id(renderable)]
+            self.__layers[layer].pop(id(renderable), None)
+            # Repaint the area it covered, if it was drawn.
+            if renderable in self.__drawn:
+                self.mark_dirty(renderable)
+
+    def set_layer(self, renderable, layer):
+        """
+        Moves the renderable item to another layer, if it is rendered.
+        The item is placed after all the items already in the layer.
+        :param renderable: The item to move.
+        :param layer: The layer to move the item to.
+        """
+        if id(renderable) in self.__layer_of:
+            self.add_renderable(renderable, layer)
+
+    def set_visible(self, renderable, visible):
+        """
+        Shows or hides the renderable item, if it is rendered.
+        Must be called each time the result of the item's is_visible method changes.
+        :param renderable: The item to show or hide.
+        :param visible: The new visibility of the item.
+        """
+        key = id(renderable)
+        layer = self.__layer_of.get(key)
+        if layer is None:
+            return
+        self.mark_dirty(renderable)
+
+        if visible:
+            # Add the item back, its place in the layer is restored before the next frame.
+            if key not in self.__layers[layer]:
+                self.__layers[layer][key] = renderable
+                self.__unsorted_layers.add(layer)
+        else:
+            self.__layers[layer].pop(key, None)
 
     def clear(self):
         """
         Clears the entire renderer.
         """
-        self.__renderables.clear()
+        self.__layers.clear()
+        self.__layer_order = []
+        self.__layer_of.clear()
+        self.__sequence_of.clear()
+        self.__unsorted_layers.clear()
+        self.__dirty.clear()
+        # The objects told that they moved before must be told again.
+        self.frame += 1
+        self.invalidate()
+
+    def get_renderables(self):
+        """
+        Returns a generator over all the visible renderable items, in drawing order.
+        """
+        # Restore the order of the layers where items were shown again.
+        for layer in self.__unsorted_layers:
+            self.__layers[layer] = dict(
+                sorted(self.__layers[layer].items(), key=lambda item: self.__sequence_of[item[0]])
+            )
+        self.__unsorted_layers.clear()
+
+        for layer in self.__layer_order:
+            yield from self.__layers[layer].values()
+
+    def get_renderable_count(self):
+        """
+        :return: The number of renderable items.
+        """
+        return len(self.__layer_of)
+
+    def mark_dirty(self, renderable):
+        """
+        Tells the renderer that the renderable moved, was shown or hidden, or changed its appearance.
+        Only the dirty renderables are compared with their state on the last frame.
+        :param renderable: The item that changed.
+        """
+        if self.__dirty_rects:
+            self.__dirty.add(renderable)
+
+    def invalidate(self):
+        """
+        Forces the entire screen to be repainted on the next frame.
+        """
+        self.__drawn = {}
+        self.__full_redraw = True
 
     def get_world_surface(self):
         return self.__world
@@ -73,17 +225,146 @@ class Renderer:
         """
         Renders all the renderable instances to the screen.
         """
+        # The changes made from now on belong to the next frame.
+        self.frame += 1
+
+        # If only the damaged regions should be repainted.
+        if self.__dirty_rects:
+            self.__render_damaged()
+            return
+
         # Fill the window with black.
         self.__world.fill((0, 0, 0, 255))
 
-        # Render all the renderable instances.
-        for renderable in self.__renderables:
-            if renderable.is_visible():
-                renderable.render(self.__world)
+        # Render all the visible renderable instances that are on the screen.
+        screen = self.__world.get_rect()
+        for renderable in self.get_renderables():
+            bounds = renderable.get_bounds()
+            if bounds is None or bounds.colliderect(screen):
+                self.__draw(renderable)
 
         # Flip the display.
-        self.__window.blit(self.__world, pygame.Rect((0, 0), self.get_window_size()))
-        pygame.display.flip()
+        self._present(None)
+
+    def __render_damaged(self):
+        """
+        Repaints the regions of the screen where a renderable changed since the last frame.
+        """
+        # If the entire screen must be repainted, all the renderables are compared.
+        if self.__full_redraw:
+            self.__render_all()
+            return
+        # If nothing changed, there is nothing to do.
+        if len(self.__dirty) == 0:
+            return
+
+        # Compare the dirty renderables with their state on the last frame.
+        dirty = self.__dirty
+        self.__dirty = set()
+        damaged = []
+        for renderable in dirty:
+            previous = self.__drawn.pop(renderable, None)
+            if self.__is_shown(renderable):
+                bounds = renderable.get_bounds()
+                state = renderable.get_render_state()
+                # Renderables without bounds or state must be repainted with the entire screen.
+                if bounds is None or state is None:
+                    self.__render_all()
+                    return
+                self.__drawn[renderable] = (bounds, state)
+                if renderable.polled:
+                    self.__dirty.add(renderable)
+                if previous is None:
+                    damaged.append(bounds)
+                elif previous[1] != state or previous[0] != bounds:
+                    damaged.append(bounds)
+                    damaged.append(previous[0])
+            elif previous is not None:
+                # Repaint the region of the renderable that is not drawn anymore.
+                damaged.append(previous[0])
+        if len(damaged) == 0:
+            return
+
+        # Clip the regions to the screen.
+        screen = self.__world.get_rect()
+        damaged = [rect.clip(screen) for rect in damaged]
+        damaged = [rect for rect in damaged if rect.width > 0 and rect.height > 0]
+        if len(damaged) == 0:
+            return
+        if len(damaged) > Renderer.MAX_DAMAGED_RECTS:
+            damaged = [damaged[0].unionall(damaged[1:])]
+
+        # Repaint each damaged region, with the bounds recorded for all the visible renderables.
+        visible = [(renderable, self.__drawn[renderable][0]) for renderable in self.get_renderables()]
+        for rect in damaged:
+            self.__world.set_clip(rect)
+            self.__world.fill((0, 0, 0, 255), rect)
+            for renderable, bounds in visible:
+                if bounds.colliderect(rect):
+                    self.__draw(renderable)
+        self.__world.set_clip(None)
+
+        # Update the damaged regions of the display.
+        self._present(damaged)
+
+    def __render_all(self):
+        """
+        Repaints the entire screen, and records the bounds and state of all the visible renderables.
+        """
+        self.__dirty.clear()
+        self.__drawn = {}
+        # Renderables without bounds or state keep the entire screen repainted.
+        full_redraw = False
+
+        self.__world.fill((0, 0, 0, 255))
+        screen = self.__world.get_rect()
+        for renderable in self.get_renderables():
+            bounds = renderable.get_bounds()
+            state = renderable.get_render_state()
+            if bounds is None or state is None:
+                full_redraw = True
+            else:
+                self.__drawn[renderable] = (bounds, state)
+                if renderable.polled:
+                    self.__dirty.add(renderable)
+            if bounds is None or bounds.colliderect(screen):
+                self.__draw(renderable)
+        self.__full_redraw = full_redraw
+        self._present(None)
+
+    def __is_shown(self, renderable):
+        """
+        :param renderable: The item to check.
+        :return: True if the renderable is registered and visible.
+        """
+        layer = self.__layer_of.get(id(renderable))
+        return layer is not None and id(renderable) in self.__layers[layer]
+
+    def __draw(self, renderable):
+        """
+        Renders one renderable onto the world, recording its cost if profiling.
+        :param renderable: The renderable to draw.
+        """
+        if self.profiler is None:
+            renderable.render(self.__world)
+        else:
+            start = perf_counter()
+            renderable.render(self.__world)
+            self.profiler.record_render(type(renderable).__name__, perf_counter() - start)
+
+    def _present(self, rects):
+        """
+        Copies the rendered world onto the window.
+        :param rects: The regions of the screen to update, or None to update the entire screen.
+        """
+        # If the entire screen must be updated.
+        if rects is None:
+            self.__window.blit(self.__world, pygame.Rect((0, 0), self.get_window_size()))
+            pygame.display.flip()
+        else:
+            for rect in rects:
+                self.__window.blit(self.__world, rect, rect)
+            pygame.display.update(rects)
 
     def get_window_size(self):
         """
@@ -102,3 +383,4 @@ class Renderer:
             self.__window_size = (width, height)
             self.__window = pygame.display.set_mode(self.__window_size)
             self.__world = pygame.Surface(self.__window_size, pygame.SRCALPHA, 32)
+            self.invalidate()
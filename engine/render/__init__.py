@@ -2,3 +2,7 @@
 
 # Import the renderer class.
 from engine.render.Renderer import Renderer
+# Import the render layers.
+from engine.render.Renderer import LAYER_BACKGROUND, LAYER_BOARD, LAYER_SHIPS, LAYER_MARKERS, LAYER_UI, LAYER_DEBUG
+# Import the headless renderer class.
+from engine.render.HeadlessRenderer import HeadlessRenderer
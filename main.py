@@ -2,5 +2,8 @@
 
 # Import the Battleships module.
 import battleships
-# Start the game
-battleships.start()
+
+# The tournament workers import this file when processes are spawned, only start the game once.
+if __name__ == "__main__":
+    # Start the game
+    battleships.start()